@@ -31,9 +31,75 @@ class Settings(BaseSettings):
     upload_folder: Path =Path("uploads")
     max_upload_size_mb: int= 20
 
+    # PDF extraction (process pool)
+    pdf_extract_workers: int = 2
+    pdf_extract_pages_per_task: int = 4
+    pdf_extract_timeout_seconds: float = 30.0
+
+    # Resume extraction cache (in-process LRU in front of Redis)
+    extraction_cache_max_entries: int = 256
+    extraction_cache_ttl_seconds: int = 60*60*24*7 # one week
+
+    # Batch resume ingestion
+    resume_batch_max_files: int = 50
+    resume_batch_concurrency: int = 4
+
+    # Bulk job ingestion (NDJSON/CSV feeds)
+    job_ingest_batch_size: int = 500
+    job_ingest_workers: int = 4
+
+    # Multi-URL job import (per-platform token buckets)
+    job_import_max_urls: int = 200
+    job_import_concurrency: int = 20
+    job_import_domain_rate: float = 10.0 # requests per second
+    job_import_domain_burst: int = 20
+    job_import_max_retries: int = 3
+    job_import_retry_base_seconds: float = 0.5
+
+    # HTML parser for fetched job pages: "auto", "selectolax", "lxml" or "html.parser"
+    html_parser_engine: str = "auto"
+
+    # URL ingestion conditional-GET cache
+    url_cache_enabled: bool = True
+    url_cache_backend: str = "disk" # "disk" or "redis"
+    url_cache_dir: Path = Path("cache/url_pages")
+    url_cache_ttl_seconds: int = 60*60*24*7 # one week
+    url_cache_max_bytes: int = 200*1024*1024
+
+    # Skill catalog snapshot held by each worker
+    skill_catalog_check_seconds: float = 30.0 # how often the catalog version is polled
+    skill_catalog_max_age_seconds: float = 600.0 # reload interval when Redis is unavailable
+
+    # Skill extraction worker for jobs stored with is_processed=False
+    skill_worker_enabled: bool = True # run a worker inside each API process
+    skill_worker_batch_size: int = 50 # jobs claimed per transaction
+    skill_worker_idle_seconds: float = 2.0 # wait when no unprocessed jobs are left
+
+    # Batch job ranking
+    analysis_rank_max_jobs: int = 200 # jobs scored per ranking request
+
+    # Shared outbound HTTP client (URL imports, ATS and Github APIs)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http_max_connections_per_host: int = 6
+    http_http2: bool = True
+    http_dns_cache_ttl_seconds: float = 300.0
+    http_timeout_seconds: float = 15.0
+
     # Github API
     github_api_base: str ="https://api.github.com"
     github_api_token: Optional[str] = None 
+    github_token_pool: list[str] = [] # more tokens to rotate through, as a JSON list
+    github_rate_limit_max_wait_seconds: float = 60.0 # queue for a rate limit reset at most this long
+    github_fetch_concurrency: int = 8 # repos fetched at once by fetch_multiple_repos
+    github_use_graphql: bool = True # batch imports through GraphQL when a token is set
+    github_graphql_batch_size: int = 20 # repos per GraphQL query
+    github_cache_enabled: bool = True # ETag cache for REST responses
+    github_cache_backend: str = "disk" # "disk" or "redis"
+    github_cache_dir: Path = Path("cache/github")
+    github_cache_ttl_seconds: int = 60*60*24*30 # thirty days
+    github_cache_max_bytes: int = 100*1024*1024
     redis_url: str = "redis://localhost:6379/0"
 
     class Config:
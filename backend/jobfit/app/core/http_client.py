@@ -0,0 +1,331 @@
+"""
+Shared HTTP client for outbound requests (job pages, ATS and GitHub APIs).
+
+One httpx.AsyncClient lives for the whole app, started and closed by the
+lifespan in app.main, so keep-alive connections, TLS sessions and DNS lookups
+are reused across imports instead of being paid on every URL. Proxies set in
+the environment (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY, NO_PROXY) are honoured as
+httpx.AsyncClient() would honour them.
+"""
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import AsyncIterator, Iterator, Optional
+from urllib.parse import urlsplit
+from urllib.request import getproxies
+
+import httpcore
+import httpx
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore network backend that caches getaddrinfo results per host.
+
+    Connections are opened to the cached address; TLS still verifies and sends
+    SNI for the original hostname since httpcore passes it to start_tls itself.
+    """
+    def __init__(self, ttl_seconds: float, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        self.ttl_seconds = ttl_seconds
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._addresses: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    async def connect_tcp(self, host: str, port: int, timeout=None, local_address=None, socket_options=None):
+        addresses = await self._resolve(host, port)
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        # Every cached address failed, resolve again next time
+        self._addresses.pop((host, port), None)
+        raise error
+
+    async def connect_unix_socket(self, path: str, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        cached = self._addresses.get((host, port))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._addresses[(host, port)] = (time.monotonic() + self.ttl_seconds, addresses)
+        return addresses
+
+    def clear(self) -> None:
+        self._addresses.clear()
+
+
+@contextmanager
+def _httpx_errors() -> Iterator[None]:
+    """Raise httpcore errors as the httpx exceptions of the same name, as httpx's own transport does."""
+    try:
+        yield
+    except httpcore.ConnectionNotAvailable:
+        raise
+    except Exception as e:
+        mapped = getattr(httpx, type(e).__name__, None) if type(e).__module__.startswith("httpcore") else None
+        if not (isinstance(mapped, type) and issubclass(mapped, httpx.TransportError)):
+            raise
+        raise mapped(str(e)) from e
+
+
+class _PoolResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def __aiter__(self):
+        with _httpx_errors():
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            with _httpx_errors():
+                await self._stream.aclose()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport over a caller-built httpcore connection pool.
+
+    httpx.AsyncHTTPTransport always builds its pool on the default network
+    backend. Building the pool here lets CachingNetworkBackend go in through
+    httpcore's public network_backend argument.
+    """
+    def __init__(self, pool: httpcore.AsyncConnectionPool):
+        self.pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors():
+            response = await self.pool.handle_async_request(core_request)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_PoolResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+
+
+@dataclass
+class _HostSlots:
+    """Per-host request limit, and how many requests hold or wait for it."""
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+class SharedHTTPClient:
+    """
+    Long-lived httpx.AsyncClient with per-host connection limits.
+
+    The pool bounds connections overall; a semaphore per host bounds how many
+    requests run against one site at once, so a large import cannot take the
+    whole pool or hammer a single job board. HTTP/2 is used when the h2 package
+    is installed.
+    """
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+        dns_cache_ttl: Optional[float] = None,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_connections = max_connections or settings.http_max_connections
+        self.max_keepalive_connections = max_keepalive_connections or settings.http_max_keepalive_connections
+        self.max_connections_per_host = max_connections_per_host or settings.http_max_connections_per_host
+        self.http2 = settings.http_http2 if http2 is None else http2
+        self.dns_cache_ttl = dns_cache_ttl or settings.http_dns_cache_ttl_seconds
+        self.timeout = timeout or settings.http_timeout_seconds
+        # Replaces the pooled transport, for tests and benchmarks (httpx.MockTransport)
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        # Only hosts with requests running or queued have an entry
+        self._host_limits: dict[str, _HostSlots] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, created on first use if the lifespan has not started it."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def start(self) -> None:
+        """Create the client up front (called from the app lifespan)."""
+        self.client
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_limits.clear()
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, waiting for a free slot on the target host."""
+        async with self._host_slot(url):
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Stream a response; the host slot is held until the body is closed."""
+        async with self._host_slot(url):
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one of the host's max_connections_per_host slots, dropping the entry once the host is idle."""
+        key = self._host_key(url)
+        slots = self._host_limits.get(key)
+        if slots is None:
+            slots = self._host_limits[key] = _HostSlots(asyncio.Semaphore(self.max_connections_per_host))
+        slots.users += 1
+        try:
+            async with slots.semaphore:
+                yield
+        finally:
+            slots.users -= 1
+            if not slots.users:
+                del self._host_limits[key]
+
+    def _create_client(self) -> httpx.AsyncClient:
+        if self.transport is not None:
+            return httpx.AsyncClient(transport=self.transport, timeout=self.timeout)
+
+        http2 = self.http2 and find_spec("h2") is not None
+        if self.http2 and not http2:
+            logger.warning("h2 package not installed, shared HTTP client is using HTTP/1.1 only")
+
+        backend = CachingNetworkBackend(self.dns_cache_ttl)
+        pool_options = dict(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+            http1=True,
+            http2=http2,
+            network_backend=backend,
+        )
+        pool = httpcore.AsyncConnectionPool(**pool_options)
+        return httpx.AsyncClient(
+            transport=PooledTransport(pool), mounts=self._proxy_mounts(pool_options), timeout=self.timeout
+        )
+
+    @staticmethod
+    def _proxy_mounts(pool_options: dict) -> dict[str, Optional[httpx.AsyncBaseTransport]]:
+        """
+        Transports for the environment's proxies, keyed by httpx mount pattern.
+
+        An explicit transport turns off httpx's own proxy setup, so the
+        environment is read here with the same rules: NO_PROXY hosts map to
+        None (the direct transport), HTTP proxies get a pool on the shared
+        network backend and SOCKS proxies an httpx transport.
+        """
+        proxies = getproxies()
+        mounts: dict[str, Optional[httpx.AsyncBaseTransport]] = {}
+        for scheme in ("http", "https", "all"):
+            url = proxies.get(scheme)
+            if not url:
+                continue
+            proxy = httpx.Proxy(url if "://" in url else f"http://{url}")
+            if proxy.url.scheme in ("http", "https"):
+                pool = httpcore.AsyncHTTPProxy(
+                    proxy_url=httpcore.URL(
+                        scheme=proxy.url.raw_scheme,
+                        host=proxy.url.raw_host,
+                        port=proxy.url.port,
+                        target=proxy.url.raw_path,
+                    ),
+                    proxy_auth=proxy.raw_auth,
+                    proxy_headers=proxy.headers.raw,
+                    **pool_options,
+                )
+                mounts[f"{scheme}://"] = PooledTransport(pool)
+            else:
+                mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(
+                    proxy=proxy, http2=pool_options["http2"], limits=httpx.Limits(
+                        max_connections=pool_options["max_connections"],
+                        max_keepalive_connections=pool_options["max_keepalive_connections"],
+                        keepalive_expiry=pool_options["keepalive_expiry"],
+                    ),
+                )
+        if not mounts:
+            return mounts
+
+        for host in proxies.get("no", "").split(","):
+            host = host.strip()
+            if host == "*":
+                return {}
+            if not host:
+                continue
+            if "://" in host:
+                mounts[host] = None
+                continue
+            try:
+                address = ipaddress.ip_address(host)
+            except ValueError:
+                address = None
+            if address is not None:
+                mounts[f"all://[{host}]" if address.version == 6 else f"all://{host}"] = None
+            elif host.lower() == "localhost":
+                mounts["all://localhost"] = None
+            else:
+                mounts[f"all://*{host}"] = None
+        return mounts
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+# Singleton instance
+http_client = SharedHTTPClient()
@@ -0,0 +1,51 @@
+"""
+JobFit Copilot API application.
+"""
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from app.core.config import get_settings
+from app.core.database import engine
+from app.core.http_client import http_client
+from app.routes.init import api_router
+from app.services.job_ingest import job_ingest_service
+from app.services.job_skill_worker import job_skill_worker
+from app.services.pdf_extract import pdf_engine
+from app.services.skill_catalog import skill_catalog
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP client for every outbound request the app makes
+    http_client.start()
+    # Skill catalog snapshot, swapped in the background when its version moves
+    try:
+        await skill_catalog.refresh()
+    except Exception as e:
+        logger.error(f"Skill catalog not loaded at startup, retrying in the background: {e}")
+    skill_catalog.start()
+    # Skill extraction for new jobs; more workers can run as separate processes
+    if settings.skill_worker_enabled:
+        job_skill_worker.start()
+    yield
+    await job_skill_worker.stop()
+    await skill_catalog.stop()
+    await http_client.aclose()
+    pdf_engine.shutdown()
+    job_ingest_service.shutdown()
+    await engine.dispose()
+
+
+app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
+
+app.include_router(api_router, prefix=settings.api_prefix)
+
+
+@app.get("/")
+def read_root():
+    return {"message": f"{settings.app_name} is running"}
@@ -20,7 +20,7 @@ class Base(DeclarativeBase):
     updated_at: Mapped[datetime]=mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        opupdate=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     def to_dict(self) -> dict[str, Any]:
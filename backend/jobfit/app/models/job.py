@@ -49,7 +49,6 @@ class RoleType(str, Enum):
     SALESFORCE_ADMIN="salesforce_admin"
     PROJECT_MANAGER="project_manager"
     BUSINESS_ANALYST="business_analyst"
-    PRODUCT_MANAGER="product_manager"
     DATA_ANALYST="data_analyst"
     AI_ENGINEER="ai_engineer"
     GAME_DEVELOPER="game_developer"
@@ -126,12 +125,15 @@ class Job(Base):
     source_url: Mapped[Optional[str]]=mapped_column(String(1000), nullable=True)
     external_id: Mapped[Optional[str]]=mapped_column(String(255), nullable=True)
 
+    # sha256 of cleaned_text and source_url, bulk ingestion skips jobs it has already stored
+    content_hash: Mapped[Optional[str]]=mapped_column(String(64), unique=True, nullable=True, index=True)
+
     # Processing Status
     is_processed: Mapped[bool]=mapped_column(nullable=False, default=False)
     processing_error: Mapped[Optional[str]]=mapped_column(Text, nullable=True)
 
     # AI Summary
-    ai_summary: Mapped[Optional[str]]=mapped_column(Text, nullable=False)
+    ai_summary: Mapped[Optional[str]]=mapped_column(Text, nullable=True)
 
     # Relationships 
     skills: Mapped[list["JobSkill"]]=relationship(
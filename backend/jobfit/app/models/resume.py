@@ -49,7 +49,7 @@ class Resume(Base):
     #   "projects": [...]
     # }
 
-    parsed_JSON: Mapped[Optional[dict]]=mapped_column(JSON, nullable=True)
+    parsed_json: Mapped[Optional[dict]]=mapped_column(JSON, nullable=True)
     
     # Bullet Points for Embedding (each experience bullet as separate item)
     # [{"text": "...", "context": "company_name - title", "embedding_id": "..."}]
@@ -0,0 +1,116 @@
+"""
+Analysis routes.
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import get_db
+from app.schemas.analysis import AnalysisComparison, AnalysisSummary
+from app.services.job_ranking import job_ranking_service
+
+router = APIRouter(prefix="/analyses", tags=["analyses"])
+settings = get_settings()
+
+
+# ===================
+# Request/Response Models for this endpoint
+# ===================
+
+class RankJobsRequest(BaseModel):
+    """Request to rank jobs for a user."""
+    user_id: int
+    # Defaults to every job the user has analyses for
+    job_ids: Optional[list[int]] = Field(None, min_length=1, max_length=settings.analysis_rank_max_jobs)
+    resume_id: Optional[int] = None
+
+
+class RankedJobItem(BaseModel):
+    """One job of a ranking."""
+    rank: int
+    analysis_id: int
+    job_id: int
+    job_title: str
+    company: Optional[str] = None
+    overall_score: float
+    coverage_score: float
+    depth_score: float
+    bonus_score: float
+    matched_skills: int
+    partial_skills: int
+    missing_skills: int
+    top_strengths: list[str] = []
+    top_gaps: list[str] = []
+
+
+class JobRankingResponse(AnalysisComparison):
+    """Jobs by descending fit, and the new analyses stored for them."""
+    ranking: list[RankedJobItem]
+    unknown_job_ids: list[int] = []
+    # Jobs still waiting for skill extraction, or whose extraction failed
+    unprocessed_job_ids: list[int] = []
+    scoring_ms: float
+    total_ms: int
+
+
+# ===================
+# Routes
+# ===================
+
+@router.post("/rank", response_model=JobRankingResponse, status_code=status.HTTP_201_CREATED)
+async def rank_jobs(
+    request: RankJobsRequest,
+    db: AsyncSession = Depends(get_db),
+) -> JobRankingResponse:
+    """
+    Score a user against many jobs at once and rank them.
+
+    - Scores every job in one pass over a job x skill matrix
+    - Stores one Analysis per job, marking the user's earlier analyses of
+      those jobs as not latest
+    - Skips jobs whose skills are not extracted yet, or failed to extract,
+      and lists them in unprocessed_job_ids
+    - skill_coverage_comaprison maps each job skill to the coverage points
+      it earns in each job; a job's points add up to its coverage score
+    """
+    ranking = await job_ranking_service.rank(db, request.user_id, request.job_ids, request.resume_id)
+    if not ranking.jobs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No jobs to rank",
+        )
+
+    best = ranking.jobs[0]
+    return JobRankingResponse(
+        analyses=[
+            AnalysisSummary(
+                id=job.analysis_id,
+                job_id=job.job_id,
+                status="completed",
+                overall_score=job.overall_score,
+                coverage_score=job.coverage_score,
+                depth_score=job.depth_score,
+                created_at=job.created_at,
+                updated_at=job.updated_at,
+                job_title=job.job_title,
+                company=job.company,
+                top_strengths=job.top_strengths,
+                top_gaps=job.top_gaps,
+            )
+            for job in ranking.jobs
+        ],
+        best_fit_job_id=best.job_id,
+        comaprison_notes=(
+            f"{len(ranking.jobs)} jobs ranked; best fit: {best.job_title} "
+            f"({best.overall_score:.0f}/100, {best.matched_skills} skills matched)."
+        ),
+        skill_coverage_comaprison=ranking.skill_coverage,
+        ranking=[RankedJobItem(**{name: getattr(job, name) for name in RankedJobItem.model_fields}) for job in ranking.jobs],
+        unknown_job_ids=ranking.unknown_job_ids,
+        unprocessed_job_ids=ranking.unprocessed_job_ids,
+        scoring_ms=ranking.scoring_ms,
+        total_ms=ranking.total_ms,
+    )
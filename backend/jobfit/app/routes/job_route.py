@@ -1,18 +1,29 @@
 """
 Job ingestion routes.
 """
-from typing import Optional
+import io
+import json
+import time
+from dataclasses import asdict
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import get_settings
+from app.core.database import async_session_factory, get_db
 from app.models.job import Job, JobSource, SeniorityLevel, RoleType
 from app.schemas.job import JobCreate, JobDetail, JobSummary, JobProcessingStatus
+from app.services.import_scheduler import url_import_scheduler
+from app.services.job_ingest import job_ingest_service, job_values, read_job_records
 from app.services.text_cleaner import clean_and_parse_job
+from app.services.url_cache import url_response_cache
+from app.services.url_ingestion import URLIngestResult
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
+settings = get_settings()
 
 
 # ===================
@@ -196,7 +207,7 @@ async def delete_job(
 # URL Import
 # ===================
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class JobImportUrlRequest(BaseModel):
@@ -244,6 +255,8 @@ async def import_job_from_url(
     fetch_method = "provided"
     detected_platform = None
     raw_text = request.raw_text
+    metadata = None
+    external_id = None
     
     # If no raw_text provided, attempt to fetch
     if not raw_text:
@@ -252,6 +265,8 @@ async def import_job_from_url(
         
         if result.success:
             raw_text = result.raw_text
+            metadata = result.metadata
+            external_id = result.external_id
             fetch_method = "fetched"
         else:
             # Return error with fallback message
@@ -270,7 +285,7 @@ async def import_job_from_url(
         fetch_method = "provided"
     
     # Now we have raw_text - create the job
-    parsed = clean_and_parse_job(raw_text, request.title)
+    parsed = clean_and_parse_job(raw_text, request.title, metadata)
     
     # Determine title (user provided > extracted > fallback)
     title = request.title or parsed["metadata"]["title"] or "Untitled Position"
@@ -300,6 +315,7 @@ async def import_job_from_url(
         cleaned_text=parsed["cleaned_text"],
         source=JobSource.URL,
         source_url=request.url,
+        external_id=external_id,
         seniority=seniority,
         role_type=role_type,
         remote_type=parsed["metadata"]["remote_type"],
@@ -335,3 +351,185 @@ async def import_job_from_url(
         "fetch_method": fetch_method,
         "detected_platform": detected_platform,
     }
+
+
+# ===================
+# Bulk Ingestion
+# ===================
+
+def _ndjson(event: dict) -> bytes:
+    return (json.dumps(event, default=str) + "\n").encode()
+
+
+async def _stream_ingest_events(file: UploadFile, fmt: str, source: JobSource) -> AsyncIterator[bytes]:
+    """
+    Run a feed through the ingestion service, one NDJSON event per batch.
+    """
+    start = time.perf_counter()
+    totals = {"received": 0, "inserted": 0, "duplicates": 0, "failed": 0}
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        async for report in job_ingest_service.ingest(
+            read_job_records(stream, fmt), async_session_factory, default_source=source
+        ):
+            for key in totals:
+                totals[key] += getattr(report, key)
+            yield _ndjson({"event": "batch", **asdict(report)})
+    except Exception as e:
+        yield _ndjson({"event": "error", "detail": f"Ingestion stopped: {str(e)}", **totals})
+        return
+    finally:
+        stream.detach()
+
+    elapsed = time.perf_counter() - start
+    yield _ndjson({
+        "event": "completed",
+        **totals,
+        "total_ms": int(elapsed * 1000),
+        "records_per_second": round(totals["received"] / max(elapsed, 1e-6), 1),
+    })
+
+
+@router.post("/bulk", status_code=status.HTTP_200_OK)
+async def ingest_jobs_bulk(
+    file: UploadFile = File(...),
+    format: Optional[str] = Form(None),
+    source: JobSource = Form(JobSource.MANUAL),
+) -> StreamingResponse:
+    """
+    Bulk-load a job feed (NDJSON or CSV) and stream a throughput report as NDJSON.
+
+    Each record needs raw_text (or description) and may carry title, company,
+    location, source_url, source and external_id. Records are parsed with
+    clean_and_parse_job in a process pool and inserted in batches of
+    job_ingest_batch_size; jobs whose cleaned text and source url are already
+    stored are counted as duplicates and skipped.
+
+    Emits one event per line of output:
+    - batch: received/inserted/duplicates/failed counts, timings and errors for a batch
+    - completed: totals for the feed
+    - error: ingestion stopped, batches already reported stay stored
+    """
+    fmt = format or ("csv" if (file.filename or "").lower().endswith(".csv") else "ndjson")
+    if fmt not in ("ndjson", "csv"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid format. Use 'ndjson' or 'csv'.",
+        )
+
+    return StreamingResponse(
+        _stream_ingest_events(file, fmt, source),
+        media_type="application/x-ndjson",
+    )
+
+
+# ===================
+# Multi-URL Import
+# ===================
+
+class JobImportUrlsRequest(BaseModel):
+    """Request to import many jobs from URLs."""
+    urls: list[str] = Field(..., min_length=1)
+
+
+async def _store_imported_job(result: URLIngestResult) -> tuple[int, bool]:
+    """
+    Parse and store one fetched job, returning (job_id, duplicate).
+
+    Uses the bulk ingestion insert so a URL imported twice maps to the job
+    already stored instead of creating a copy.
+    """
+    record = {"raw_text": result.raw_text, "source_url": result.source_url, "external_id": result.external_id}
+    values = job_values(record, JobSource.URL, result.metadata)
+    inserted = await job_ingest_service.insert_jobs(async_session_factory, [values])
+    if values["content_hash"] in inserted:
+        return inserted[values["content_hash"]], False
+
+    async with async_session_factory() as session:
+        existing = await session.execute(select(Job.id).where(Job.content_hash == values["content_hash"]))
+        return existing.scalar_one(), True
+
+
+async def _stream_import_events(urls: list[str]) -> AsyncIterator[bytes]:
+    """
+    Fetch every URL through the import scheduler, one NDJSON event per URL as it completes.
+    """
+    start = time.perf_counter()
+    totals = {"imported": 0, "duplicates": 0, "failed": 0}
+
+    async for scheduled in url_import_scheduler.run(urls):
+        result = scheduled.result
+        event = {
+            "event": "result",
+            "index": scheduled.index,
+            "attempts": scheduled.attempts,
+            "job_id": None,
+            "duplicate": False,
+            **{key: value for key, value in asdict(result).items() if key not in ("raw_text", "raw_html")},
+        }
+        if result.success:
+            try:
+                event["job_id"], event["duplicate"] = await _store_imported_job(result)
+            except Exception as e:
+                event["success"] = False
+                event["error_message"] = f"Failed to store job: {str(e)}"
+
+        if not event["success"]:
+            totals["failed"] += 1
+        elif event["duplicate"]:
+            totals["duplicates"] += 1
+        else:
+            totals["imported"] += 1
+        yield _ndjson(event)
+
+    yield _ndjson({
+        "event": "completed",
+        "total_urls": len(urls),
+        **totals,
+        "total_ms": int((time.perf_counter() - start) * 1000),
+    })
+
+
+@router.post("/import-urls", status_code=status.HTTP_200_OK)
+async def import_jobs_from_urls(request: JobImportUrlsRequest) -> StreamingResponse:
+    """
+    Import many jobs from URLs concurrently, streaming results as NDJSON.
+
+    URLs are fetched at most job_import_concurrency at a time, each job board
+    (Greenhouse, Lever, ... or the host for other sites) is rate limited by its
+    own token bucket, and 429/5xx responses are retried with jittered backoff.
+    Fetched jobs are stored like POST /jobs/bulk records, deduplicated on content.
+
+    Emits one event per line of output:
+    - result: the URLIngestResult of one URL (without the page text) with the
+      stored job_id, in completion order; `index` is the URL's input position
+    - completed: totals for the batch
+    """
+    if len(request.urls) > settings.job_import_max_urls:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many URLs. A batch may contain at most {settings.job_import_max_urls} URLs.",
+        )
+
+    return StreamingResponse(
+        _stream_import_events(request.urls),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get("/url-cache/stats")
+async def get_url_cache_stats() -> dict:
+    """
+    Hit/miss counters of the URL ingestion cache since this process started.
+
+    A hit is a 304 answered from the cache; bytes_saved is the size of the
+    page bodies those 304s did not have to download.
+    """
+    stats = asdict(url_response_cache.stats)
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        "backend": url_response_cache.backend,
+        "enabled": settings.url_cache_enabled,
+        **stats,
+        "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+    }
@@ -2,16 +2,18 @@
 Projects and Github import routes
 """
 
+from dataclasses import asdict
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import label, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
 from app.core.database import get_db
 from app.models.project import Project, ProjectSource
-from app.services.github_client import GitHubClient, github_client 
+from app.models.user import User
+from app.services.github_client import GitHubClient, GitHubRepo, github_client 
 from app.schemas.project import ProjectDetail, ProjectSummary, GitHubSyncResponse
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -50,6 +52,9 @@ class ImportResult(BaseModel):
     success: bool
     project_id: Optional[int] = None
     name: Optional[str] = None
+    # True when the repository was already imported and has not changed since
+    skipped: bool = False
+    message: Optional[str] = None
     error: Optional[str] = None 
 
 class GitHubImportResponse(BaseModel):
@@ -69,6 +74,33 @@ class RateLimitInfo(BaseModel):
     remaining: int 
     reset_at : str 
     authenticated: bool
+    tokens: int
+    predicted_wait_seconds: float
+
+# ==================
+# Helpers
+# ==================
+
+def _unchanged_since_sync(project: Project, repo: GitHubRepo) -> bool:
+    """
+    The repo answered 304 everywhere and the project holds that same data.
+
+    The ETag cache is shared by every project of the same repo, so the
+    project's source timestamps must also match what the cache returned.
+    """
+    return (
+        repo.not_modified
+        and project.source_updated_at == repo.updated_at
+        and project.source_pushed_at == repo.pushed_at
+    )
+
+async def _github_client_for(db: AsyncSession, user_id: int) -> GitHubClient:
+    """
+    GitHub client for a user's requests: on their OAuth token if they linked
+    GitHub, on the server's token pool otherwise.
+    """
+    user = await db.get(User, user_id)
+    return github_client.for_token(user.github_access_token if user else None)
 
 # ==================
 # Routes
@@ -87,14 +119,18 @@ async def import_github_repos(
     - Stores projects in database
     - Skips already imported repos (by github_repo_id)
     
-    Note: Uses unauthenticated API (60 req/hour). Set GITHUB_API_TOKEN for higher limits.
+    Note: Uses the user's GitHub OAuth token if they linked GitHub, else the
+    server's tokens (GITHUB_API_TOKEN and the token pool), else the
+    unauthenticated API (60 req/hour).
     """
     results=[]
     successful=0
     failed=0
 
+    client = await _github_client_for(db, request.user_id)
+
     # Fetch all repos
-    repos= await github_client.fetch_multiple_repos(request.repo_urls)
+    repos= await client.fetch_multiple_repos(request.repo_urls)
 
     for i, repo in enumerate(repos):
         url= request.repo_urls[i]
@@ -118,6 +154,18 @@ async def import_github_repos(
         )
         existing_project = existing.scalar_one_or_none()
 
+        if existing_project and _unchanged_since_sync(existing_project, repo):
+            results.append(ImportResult(
+                url=url,
+                success=True,
+                project_id=existing_project.id,
+                name=existing_project.name,
+                skipped=True,
+                message="Existing project unchanged",
+            ))
+            successful += 1
+            continue
+
         if existing_project:
             # Update existing project 
             existing_project.description = repo.description
@@ -135,7 +183,7 @@ async def import_github_repos(
                 success=True,
                 project_id=existing_project.id,
                 name=existing_project.name,
-                error= "Updated existing project"
+                message="Updated existing project",
             ))
             successful += 1
             continue
@@ -316,13 +364,17 @@ async def delete_project(
     await db.delete(project)
 
 @router.get("/github/rate-limit", response_model=RateLimitInfo)
-async def check_github_rate_limit() -> dict:
+async def check_github_rate_limit(
+    requests: int = Query(1, ge=1, description="REST calls the caller is about to make, 3 per repo"),
+) -> dict:
     """
     Check current GitHub API rate limit status.
 
-    Useful for mooniroting API usage before bull imports
+    Useful for mooniroting API usage before bull imports. Limits are summed
+    over the token pool; predicted_wait_seconds is how long that many more
+    requests would queue for a reset.
     """
-    info= await github_client.check_rate_limit()
+    info= await github_client.check_rate_limit(requests)
 
     if "error" in info:
         raise HTTPException(
@@ -334,6 +386,8 @@ async def check_github_rate_limit() -> dict:
         "remaining": info["remaining"],
         "reset_at": info["reset_at"],
         "authenticated": info["authenticated"],
+        "tokens": info["tokens"],
+        "predicted_wait_seconds": info["predicted_wait_seconds"],
     }
 
 @router.post("/github/refresh/{project_id}", response_model=ProjectDetail)
@@ -377,8 +431,10 @@ async def refresh_github_project(
     
     owner, repo = parts
     
+    client = await _github_client_for(db, project.user_id)
+    
     # Fetch fresh data
-    repo_data = await github_client.fetch_repo(owner, repo)
+    repo_data = await client.fetch_repo(owner, repo)
     
     if repo_data.errors:
         raise HTTPException(
@@ -386,6 +442,10 @@ async def refresh_github_project(
             detail=f"GitHub API error: {'; '.join(repo_data.errors)}",
         )
     
+    # Nothing changed on GitHub, leave the row alone
+    if _unchanged_since_sync(project, repo_data):
+        return project
+    
     # Update project
     project.description = repo_data.description
     project.stars_count = repo_data.stars_count
@@ -400,4 +460,25 @@ async def refresh_github_project(
     await db.flush()
     await db.refresh(project)
     
-    return project
\ No newline at end of file
+    return project
+
+
+@router.get("/github/cache-stats")
+async def get_github_cache_stats() -> dict:
+    """
+    Hit/miss counters of the GitHub ETag cache since this process started.
+
+    A hit is a 304 answered from the cache; rate_limit_saved counts the hits
+    on authenticated requests, which GitHub does not charge to the rate limit.
+    """
+    cache = github_client.cache
+    if cache is None:
+        return {"enabled": False}
+    stats = asdict(cache.stats)
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        "backend": cache.backend,
+        "enabled": True,
+        **stats,
+        "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+    }
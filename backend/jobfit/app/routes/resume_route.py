@@ -1,19 +1,27 @@
 """
 Resume upload and text extraction routes.
 """
+import asyncio
 import hashlib
+import json
+import time
 import uuid
+import zipfile
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form,  status
-from sqlalchemy import label, select, update
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, insert, label, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
-from app.core.database import get_db
+from app.core.database import async_session_factory, get_db
 from app.models.resume import Resume
-from app.services.pdf_extract import PDFExtractor, ResumeParser
+from app.services.extraction_cache import extraction_cache
+from app.services.pdf_extract import ExtractedResume, PDFExtractor, ResumeParser
 
 router= APIRouter(prefix="/resumes", tags=["resumes"])
 settings= get_settings()
@@ -67,28 +75,44 @@ class ResumeListItem(BaseModel):
     class config:
         from_attributes = True
 
+class BatchFileResult(BaseModel):
+    """
+    Outcome of one file in a batch upload.
+    """
+    file_name: str
+    success: bool
+    resume_id: Optional[int] = None
+    page_count: int = 0
+    line_count: int = 0
+    bullet_count: int = 0
+    cached: bool = False
+    extraction_ms: int = 0
+    error: Optional[str] = None
+
+class ResumeBatchUploadResponse(BaseModel):
+    """
+    Response after a batch upload.
+    """
+    user_id: int
+    total_files: int
+    successful: int
+    failed: int
+    extraction_ms: int
+    insert_ms: int
+    total_ms: int
+    results: list[BatchFileResult]
+
 # ==================
-# Routes
+# Helpers
 # ==================
-@router.post("", response_model=ResumeUploadResponse, status_code=status.HTTP_201_CREATED)
-async def upload_resume(
-    file: UploadFile = File(...),
-    user_id: int = Form(...),
-    label: Optional[str] = Form(None),
-    set_active: bool = Form(True),
-    db: AsyncSession = Depends(get_db),
-) -> dict:
-    """
-    Upload a resume PDF
 
-    - Extracts text using pdfplumber
-    - Segments into lines and bullet points
-    - Stores raw text and structured data
-    - Optionally sets as active resume for the user
-    
-    Returns resume_id for subsequent analysis.
-    """""
-    # Validate file type 
+# Uploads are read in chunks of this size so oversized files are rejected early
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+def _validate_pdf_filename(file: UploadFile) -> str:
+    """
+    Validate the upload's filename and return its extension.
+    """
     if not file.filename:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -102,59 +126,118 @@ async def upload_resume(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid file type. Allowed types: {', '.join(allowed_types)}"
         )
-    # Read file content 
-    content= await file.read()
-    file_size = len(content)
+    return file_ext
+
+def _too_large() -> str:
+    return f"File size exceeds the maximum limit of {settings.max_upload_size_mb} MB."
 
-    # Validate file size
+async def _read_upload(file: UploadFile) -> bytes:
+    """
+    Read an upload in chunks, stopping as soon as it exceeds the size limit.
+    """
     max_size = settings.max_upload_size_mb * 1024 * 1024
-    if file_size > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size exceeds the maximum limit of {settings.max_upload_size_mb} MB."
-        )
-    
-    # Gnerate unique filename for storage
-    file_hash = hashlib.sha256(content).hexdigest()
-    unique_name = f"{uuid.uuid4().hex}_{file.filename}"
-    file_path= settings.upload_dir / unique_name 
+    chunks = []
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=_too_large()
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+def _spool(read: Callable[[int], bytes], file_ext: str) -> Optional[tuple[Path, str, int, bool]]:
+    """
+    Copy a stream to the upload folder, hashing it on the way.
 
-    # Save file to disk
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'wb') as f:
-        f.write(content)
-    
-    # Extract text from pdf
+    Blocking; run it in a thread. Only one chunk is held in memory. The file
+    lands at its content-hash path, as with _store_file, so re-uploads share
+    one copy on disk. Returns None, keeping nothing, once the stream exceeds
+    the upload size limit.
+
+    Returns the path, the SHA-256, the size in bytes and whether a new file
+    was written.
+    """
+    max_size = settings.max_upload_size_mb * 1024 * 1024
+    settings.upload_folder.mkdir(parents=True, exist_ok=True)
+    tmp_path = settings.upload_folder / f"{uuid.uuid4().hex}.tmp"
+    digest = hashlib.sha256()
+    size = 0
     try:
-        extracted = await PDFExtractor.extract_from_bytes(content, file.filename)
-    except Exception as e:
-        # Clean up file on extraction failure 
-        file_path.unlink(missing_ok=True)
+        with open(tmp_path, 'wb') as f:
+            while chunk := read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    return None
+                digest.update(chunk)
+                f.write(chunk)
+
+        file_hash = digest.hexdigest()
+        file_path = settings.upload_folder / f"{file_hash}{file_ext}"
+        if file_path.exists():
+            return file_path, file_hash, size, False
+        tmp_path.replace(file_path)
+        return file_path, file_hash, size, True
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+async def _spool_upload(file: UploadFile, file_ext: str) -> tuple[Path, str, int]:
+    """
+    Stream an upload to its content-hash path in the upload folder.
+
+    Returns the path, the SHA-256 and the size in bytes.
+    """
+    spooled = await asyncio.to_thread(_spool, file.file.read, file_ext)
+    if spooled is None:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Failed to extract text from PDF: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_too_large()
         )
-    if not extracted.raw_text and not extracted.errors:
-        extracted.errors.append("No text could be extracted from PDF.")
+    file_path, file_hash, size, _ = spooled
+    return file_path, file_hash, size
 
-    # Parse basic structure 
-    parsed_structure = ResumeParser.parse_basic_structure(extracted.lines)
+def _store_file(content: bytes, file_hash: str, file_ext: str) -> tuple[Path, bool]:
+    """
+    Store an upload by content hash so re-uploads share one copy on disk.
 
-    # If setting as activate, deatcivate other resumes for this user 
-    if set_active:
-        await db.execute(
-            update(Resume)
-            .where(Resume.user_id == user_id)
-            .values(is_active=False)
-        )
-    # Create resume record
-    resume= Resume(
+    Returns the path and whether a new file was written.
+    """
+    file_path= settings.upload_folder / f"{file_hash}{file_ext}"
+    if file_path.exists():
+        return file_path, False
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f"{uuid.uuid4().hex}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    tmp_path.replace(file_path)
+    return file_path, True
+
+def _resume_values(
+    *,
+    user_id: int,
+    file_path: Path,
+    file_name: str,
+    file_size: int,
+    file_hash: str,
+    mime_type: Optional[str],
+    extracted: ExtractedResume,
+    parsed_structure: dict,
+    label: Optional[str],
+    set_active: bool,
+) -> dict:
+    """
+    Column values for a new Resume row.
+    """
+    return dict(
         user_id=user_id,
         file_path=str(file_path),
-        file_name=file.filename,
+        file_name=file_name,
         file_size_bytes=file_size,
         file_hash=file_hash,
-        mime_type=file.content_type or "application/pdf",
+        mime_type=mime_type or "application/pdf",
         raw_text=extracted.raw_text,
         bullet_points=extracted.bullet_points,
         parsed_json={
@@ -169,8 +252,164 @@ async def upload_resume(
         is_active=set_active,
         is_processed=True,
         processing_error="; ".join(extracted.errors) if extracted.errors else None,
+    )
+
+def _too_many_files() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Too many files. A batch may contain at most {settings.resume_batch_max_files} PDFs."
+    )
+
+@dataclass
+class _BatchFile:
+    """
+    One PDF of a batch, spooled to the upload folder unless it has an error.
+    """
+    file_name: str
+    path: Optional[Path] = None
+    file_hash: str = ""
+    size: int = 0
+    # Whether the spool wrote path, rather than finding it already stored
+    created: bool = False
+    error: Optional[str] = None
+
+def _spool_batch_file(file_name: str, read: Callable[[int], bytes]) -> _BatchFile:
+    """
+    Spool one PDF of a batch, turning an oversized or empty file into a per-file error.
+    """
+    spooled = _spool(read, '.pdf')
+    if spooled is None:
+        return _BatchFile(file_name, error=_too_large())
+    path, file_hash, size, created = spooled
+    if not size:
+        if created:
+            path.unlink(missing_ok=True)
+        return _BatchFile(file_name, error="File is empty.")
+    return _BatchFile(file_name, path, file_hash, size, created)
+
+def _expand_zip_upload(file_name: str, content: bytes, max_files: int) -> list[_BatchFile]:
+    """
+    Spool the PDF members of a zip archive to the upload folder.
+
+    Blocking; run it in a thread. Members are counted and their declared
+    sizes checked before any is inflated, then inflated one chunk at a time.
+    A member over the upload size limit comes back with an error, like an
+    oversized PDF uploaded on its own.
+
+    Raises a 400 if the archive holds more than max_files PDFs.
+    """
+    max_size = settings.max_upload_size_mb * 1024 * 1024
+    try:
+        archive = zipfile.ZipFile(BytesIO(content))
+    except zipfile.BadZipFile:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{file_name} is not a valid zip archive."
+        )
 
+    with archive:
+        infos = [
+            info for info in archive.infolist()
+            if not info.is_dir()
+            and Path(info.filename).suffix.lower() == '.pdf'
+            and Path(info.filename).parts[0] != '__MACOSX'
+        ]
+        if len(infos) > max_files:
+            raise _too_many_files()
+
+        members = []
+        for info in infos:
+            name = Path(info.filename).name
+            if info.file_size > max_size:
+                members.append(_BatchFile(name, error=_too_large()))
+                continue
+            with archive.open(info) as member:
+                members.append(_spool_batch_file(name, member.read))
+        return members
+
+async def _deactivate_resumes(db: AsyncSession, user_id: int) -> None:
+    """
+    Deactivate every resume of a user.
+    """
+    await db.execute(
+        update(Resume)
+        .where(Resume.user_id == user_id)
+        .values(is_active=False)
     )
+
+# ==================
+# Routes
+# ==================
+@router.post("", response_model=ResumeUploadResponse, status_code=status.HTTP_201_CREATED)
+async def upload_resume(
+    file: UploadFile = File(...),
+    user_id: int = Form(...),
+    label: Optional[str] = Form(None),
+    set_active: bool = Form(True),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    Upload a resume PDF
+
+    - Extracts text using pdfplumber
+    - Segments into lines and bullet points
+    - Stores raw text and structured data
+    - Optionally sets as active resume for the user
+
+    Re-uploads of the same PDF reuse the cached extraction and the stored file.
+    
+    Returns resume_id for subsequent analysis.
+    """""
+    file_ext = _validate_pdf_filename(file)
+
+    # Read file content 
+    content= await _read_upload(file)
+    file_size = len(content)
+
+    file_hash = hashlib.sha256(content).hexdigest()
+    file_path, stored_new_file = await asyncio.to_thread(_store_file, content, file_hash, file_ext)
+    
+    cached = await extraction_cache.get(file_hash)
+    if cached:
+        extracted = cached.extracted
+        parsed_structure = cached.parsed_structure
+    else:
+        # Extract text from pdf
+        try:
+            extracted = await PDFExtractor.extract_from_bytes(content, file.filename, file_hash=file_hash)
+        except Exception as e:
+            # Clean up file on extraction failure 
+            if stored_new_file:
+                file_path.unlink(missing_ok=True)
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Failed to extract text from PDF: {str(e)}"
+            )
+
+        if not extracted.raw_text and not extracted.errors:
+            extracted.errors.append("No text could be extracted from PDF.")
+
+        # Parse basic structure 
+        parsed_structure = ResumeParser.parse_basic_structure(extracted.lines)
+        await extraction_cache.set(file_hash, extracted, parsed_structure)
+
+    # If setting as activate, deatcivate other resumes for this user 
+    if set_active:
+        await _deactivate_resumes(db, user_id)
+
+    # Create resume record
+    resume= Resume(**_resume_values(
+        user_id=user_id,
+        file_path=file_path,
+        file_name=file.filename,
+        file_size=file_size,
+        file_hash=file_hash,
+        mime_type=file.content_type,
+        extracted=extracted,
+        parsed_structure=parsed_structure,
+        label=label,
+        set_active=set_active,
+    ))
     db.add(resume)
     await db.flush()
     await db.refresh(resume)
@@ -186,6 +425,284 @@ async def upload_resume(
         "is_processed": resume.is_processed,
         "created_at": resume.created_at,
     }
+@router.post("/batch", response_model=ResumeBatchUploadResponse, status_code=status.HTTP_201_CREATED)
+async def upload_resume_batch(
+    files: list[UploadFile] = File(...),
+    user_id: int = Form(...),
+    label: Optional[str] = Form(None),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    Upload many resume PDFs at once, as separate files and/or zip archives.
+
+    - Spools each PDF and zip member to the upload folder, workers extract
+      from the stored files
+    - Extracts files concurrently through the PDF process pool, bounded by
+      resume_batch_concurrency
+    - Reuses cached extractions for PDFs seen before
+    - Inserts every Resume row with a single INSERT
+    - Returns per-file results with timings
+
+    Batch uploads do not change which resume is active for the user.
+    """
+    batch_start = time.perf_counter()
+
+    uploads: list[_BatchFile] = []
+    try:
+        for file in files:
+            if not file.filename:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="No filename provided."
+                )
+            if Path(file.filename).suffix.lower() not in ('.pdf', '.zip'):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid file type for {file.filename}. Allowed types: .pdf, .zip"
+                )
+
+            # Count files before reading them; PDFs are spooled to disk so a
+            # batch holds at most one archive in memory at a time
+            remaining = settings.resume_batch_max_files - len(uploads)
+            if Path(file.filename).suffix.lower() == '.zip':
+                content = await _read_upload(file)
+                uploads.extend(await asyncio.to_thread(_expand_zip_upload, file.filename, content, remaining))
+                del content
+            else:
+                if remaining < 1:
+                    raise _too_many_files()
+                uploads.append(await asyncio.to_thread(_spool_batch_file, file.filename, file.file.read))
+
+        if not uploads:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No PDF files found in upload."
+            )
+    except HTTPException:
+        # A rejected batch keeps none of the files it brought
+        for upload in uploads:
+            if upload.created:
+                upload.path.unlink(missing_ok=True)
+        raise
+
+    semaphore = asyncio.Semaphore(settings.resume_batch_concurrency)
+
+    async def process(upload: _BatchFile) -> tuple[BatchFileResult, Optional[dict]]:
+        async with semaphore:
+            start = time.perf_counter()
+            if upload.error:
+                return BatchFileResult(file_name=upload.file_name, success=False, error=upload.error), None
+
+            cached = await extraction_cache.get(upload.file_hash)
+            if cached:
+                extracted = cached.extracted
+                parsed_structure = cached.parsed_structure
+            else:
+                extracted = await PDFExtractor.extract_from_file(upload.path, file_hash=upload.file_hash)
+                if not extracted.raw_text and not extracted.errors:
+                    extracted.errors.append("No text could be extracted from PDF.")
+                parsed_structure = ResumeParser.parse_basic_structure(extracted.lines)
+                await extraction_cache.set(upload.file_hash, extracted, parsed_structure)
+
+            result = BatchFileResult(
+                file_name=upload.file_name,
+                success=not extracted.errors,
+                page_count=extracted.page_count,
+                line_count=len(extracted.lines),
+                bullet_count=len(extracted.bullet_points),
+                cached=cached is not None,
+                extraction_ms=int((time.perf_counter() - start) * 1000),
+                error="; ".join(extracted.errors) if extracted.errors else None,
+            )
+            values = _resume_values(
+                user_id=user_id,
+                file_path=upload.path,
+                file_name=upload.file_name,
+                file_size=upload.size,
+                file_hash=upload.file_hash,
+                mime_type="application/pdf",
+                extracted=extracted,
+                parsed_structure=parsed_structure,
+                label=label,
+                set_active=False,
+            )
+            return result, values
+
+    processed = await asyncio.gather(*(process(upload) for upload in uploads))
+    extraction_ms = int((time.perf_counter() - batch_start) * 1000)
+
+    # One INSERT for every file that produced a row, ids come back in parameter order
+    insert_start = time.perf_counter()
+    rows = [(result, values) for result, values in processed if values is not None]
+    if rows:
+        inserted = await db.execute(
+            insert(Resume).returning(Resume.id, sort_by_parameter_order=True),
+            [values for _, values in rows],
+        )
+        for (result, _), resume_id in zip(rows, inserted.scalars().all()):
+            result.resume_id = resume_id
+    insert_ms = int((time.perf_counter() - insert_start) * 1000)
+
+    results = [result for result, _ in processed]
+    successful = sum(1 for result in results if result.success)
+    return {
+        "user_id": user_id,
+        "total_files": len(results),
+        "successful": successful,
+        "failed": len(results) - successful,
+        "extraction_ms": extraction_ms,
+        "insert_ms": insert_ms,
+        "total_ms": int((time.perf_counter() - batch_start) * 1000),
+        "results": results,
+    }
+
+def _ndjson(event: dict) -> bytes:
+    return (json.dumps(event, default=str) + "\n").encode()
+
+async def _stream_resume_events(
+    *,
+    file_hash: str,
+    file_path: Path,
+    file_size: int,
+    file_name: str,
+    mime_type: Optional[str],
+    user_id: int,
+    label: Optional[str],
+    set_active: bool,
+) -> AsyncIterator[bytes]:
+    """
+    Extract a resume page by page, emitting NDJSON events, then store it.
+
+    Extraction workers read the stored file. Each page is sent as soon as
+    it is ready, but its text, lines and bullet points are also kept, since
+    the Resume row and the extraction cache need the whole document.
+    """
+    yield _ndjson({
+        "event": "started",
+        "file_name": file_name,
+        "file_size_bytes": file_size,
+        "file_hash": file_hash,
+    })
+
+    cached = await extraction_cache.get(file_hash)
+    if cached:
+        extracted = cached.extracted
+        parsed_structure = cached.parsed_structure
+        yield _ndjson({
+            "event": "cached",
+            "page_count": extracted.page_count,
+            "lines": extracted.lines,
+            "bullet_points": extracted.bullet_points,
+        })
+    else:
+        pages_text = []
+        lines = []
+        bullet_points = []
+        errors = []
+        page_count = 0
+        try:
+            async for page in PDFExtractor.iter_pages(file_path):
+                page_count = page.page_count
+                pages_text.append(page.text)
+                lines.extend(page.lines)
+                bullet_points.extend(page.bullet_points)
+                errors.extend(page.errors)
+                yield _ndjson({
+                    "event": "page",
+                    "page": page.page_number,
+                    "page_count": page.page_count,
+                    "lines": page.lines,
+                    "bullet_points": page.bullet_points,
+                    "errors": page.errors,
+                })
+        except asyncio.TimeoutError:
+            errors.append(f"Extraction timed out after {settings.pdf_extract_timeout_seconds:g} seconds")
+        except Exception as e:
+            errors.append(f"Extraction failed: {str(e)}")
+
+        extracted = ExtractedResume(
+            raw_text='\n\n'.join(pages_text),
+            lines=lines,
+            bullet_points=bullet_points,
+            page_count=page_count,
+            file_hash=file_hash,
+            errors=errors,
+        )
+        if not extracted.raw_text and not extracted.errors:
+            extracted.errors.append("No text could be extracted from PDF.")
+
+        parsed_structure = ResumeParser.parse_basic_structure(extracted.lines)
+        await extraction_cache.set(file_hash, extracted, parsed_structure)
+
+    # The response outlives the request's dependencies, so use a dedicated session
+    async with async_session_factory() as session:
+        try:
+            if set_active:
+                await _deactivate_resumes(session, user_id)
+            resume = Resume(**_resume_values(
+                user_id=user_id,
+                file_path=file_path,
+                file_name=file_name,
+                file_size=file_size,
+                file_hash=file_hash,
+                mime_type=mime_type,
+                extracted=extracted,
+                parsed_structure=parsed_structure,
+                label=label,
+                set_active=set_active,
+            ))
+            session.add(resume)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            yield _ndjson({"event": "error", "detail": f"Failed to store resume: {str(e)}"})
+            return
+
+    yield _ndjson({
+        "event": "completed",
+        "id": resume.id,
+        "user_id": resume.user_id,
+        "page_count": extracted.page_count,
+        "line_count": len(extracted.lines),
+        "bullet_count": len(extracted.bullet_points),
+        "errors": extracted.errors,
+        "created_at": resume.created_at,
+    })
+
+@router.post("/stream", status_code=status.HTTP_200_OK)
+async def upload_resume_stream(
+    file: UploadFile = File(...),
+    user_id: int = Form(...),
+    label: Optional[str] = Form(None),
+    set_active: bool = Form(True),
+) -> StreamingResponse:
+    """
+    Upload a resume PDF and stream extraction progress as NDJSON.
+
+    Emits one event per line of output:
+    - started: file accepted
+    - page: lines and bullet points of each page, in page order, as pages finish
+    - cached: the whole extraction, when the same PDF was processed before
+    - completed: the stored resume id and totals
+    - error: the resume could not be stored
+    """
+    file_ext = _validate_pdf_filename(file)
+    file_path, file_hash, file_size = await _spool_upload(file, file_ext)
+
+    return StreamingResponse(
+        _stream_resume_events(
+            file_hash=file_hash,
+            file_path=file_path,
+            file_size=file_size,
+            file_name=file.filename,
+            mime_type=file.content_type,
+            user_id=user_id,
+            label=label,
+            set_active=set_active,
+        ),
+        media_type="application/x-ndjson",
+    )
+
 @router.get("/{resume_id}", response_model=ResumeDetailResponse)
 async def get_resume(
     resume_id: int,
@@ -282,7 +799,7 @@ async def delete_resume(
     """
     Delete a resume by ID.
 
-    Also removes the file from disk.
+    Also removes the file from disk once no other resume references it.
     """
     result= await db.execute(select(Resume).where(Resume.id == resume_id))
     resume= result.scalar_one_or_none()
@@ -293,9 +810,14 @@ async def delete_resume(
             detail=f"Resume with ID {resume_id} not found."
         )
     
-    # Delete the file from storage
+    # Delete the file from storage unless another resume shares it
+    shared= await db.execute(
+        select(func.count())
+        .select_from(Resume)
+        .where(Resume.file_path == resume.file_path, Resume.id != resume_id)
+    )
     file_path= Path(resume.file_path)
-    if file_path.exists():
+    if shared.scalar_one() == 0 and file_path.exists():
         file_path.unlink()
     
     await db.delete(resume)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Cost of one fit analysis against catalog size, excluding database I/O.
+
+For the seed catalog and catalogs of 5,000 and 50,000 terms (as in
+bench_skill_catalog), scores random users of 40 skills against random jobs
+of 15 skills: building the two vectors from (skill_id, value) pairs, and
+FitScorer.score() on them. Then ranks one user against 50 jobs: score()
+per job against one score_many() call on the jobs' CSR matrix.
+
+Usage: python -m app.scripts.bench_fit_scoring [analyses]
+"""
+import random
+import sys
+import time
+
+import yaml
+
+from app.scripts.bench_skill_catalog import make_rows
+from app.services.fit_scoring import FitScorer
+from app.services.skill_catalog import CatalogSnapshot
+from app.services.skill_matcher import SEED_FILE
+
+IMPORTANCES = ("REQUIRED", "PREFERRED", "NICE_TO_HAVE")
+
+
+def make_pairs(snapshot: CatalogSnapshot, count: int, seed: int = 11) -> list[tuple[list, list]]:
+    """(job skills, user skills) pairs drawn from the first 300 skills of the catalog."""
+    rng = random.Random(seed)
+    ids = [record.id for record in snapshot.records[:300]]
+    return [
+        (
+            [(skill_id, rng.choice(IMPORTANCES)) for skill_id in rng.sample(ids, 15)],
+            [(skill_id, rng.random()) for skill_id in rng.sample(ids, 40)],
+        )
+        for _ in range(count)
+    ]
+
+
+def run(count: int = 5_000) -> None:
+    print(f"{'skills':>8} {'vectors us':>11} {'score us':>9} {'total us':>9}")
+    with open(SEED_FILE, encoding="utf-8") as f:
+        seed_rows = yaml.safe_load(f)["skills"]
+    for rows in (seed_rows, make_rows(5_000), make_rows(50_000)):
+        scorer = FitScorer(CatalogSnapshot.from_records(rows))
+        pairs = make_pairs(scorer.snapshot, count)
+
+        start = time.perf_counter()
+        vectors = [(scorer.job_vector(job), scorer.user_vector(user)) for job, user in pairs]
+        vectors_us = (time.perf_counter() - start) / count * 1e6
+
+        start = time.perf_counter()
+        for job, user in vectors:
+            scorer.score(job, user)
+        score_us = (time.perf_counter() - start) / count * 1e6
+
+        print(f"{scorer.size:>8} {vectors_us:>11.1f} {score_us:>9.1f} {vectors_us + score_us:>9.1f}")
+
+    print(f"\n{'skills':>8} {'jobs':>5} {'per job ms':>11} {'batch ms':>9}")
+    for rows in (seed_rows, make_rows(5_000), make_rows(50_000)):
+        scorer = FitScorer(CatalogSnapshot.from_records(rows))
+        pairs = make_pairs(scorer.snapshot, 50)
+        user = scorer.user_vector(pairs[0][1])
+        job_skills = [(job_id, skill_id, importance) for job_id, (job, _) in enumerate(pairs) for skill_id, importance in job]
+        repeats = max(1, count // 50)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for job, _ in pairs:
+                scorer.score(scorer.job_vector(job), user)
+        per_job_ms = (time.perf_counter() - start) / repeats * 1000
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            scorer.score_many(scorer.job_matrix(range(len(pairs)), job_skills), user)
+        batch_ms = (time.perf_counter() - start) / repeats * 1000
+
+        print(f"{scorer.size:>8} {len(pairs):>5} {per_job_ms:>11.2f} {batch_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Import latency benchmark for GitHubClient.fetch_multiple_repos.
+
+A local GitHub API stub answers /repos/{owner}/{repo}, /languages and /readme
+after a per-request delay, charging a handshake delay per new connection like
+the URL ingestion stub. The same repo list is imported the previous way (one
+repo after another, a new client per repo, three sequential calls each) and
+through the fan-out client on the shared pool, then through the GraphQL batch
+fetcher, which needs a token and asks for a whole batch of repos at once.
+A last run refreshes the same repos over REST with the ETag cache warm, when
+every request is a conditional one answered 304.
+
+Usage: python -m app.scripts.bench_github_import [repos] [handshake_ms] [rtt_ms]
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from app.core.http_client import SharedHTTPClient
+from app.scripts.bench_url_ingest import StubJobBoard
+from app.services.github_cache import GitHubResponseCache
+from app.services.github_client import GitHubClient, GitHubRepo
+
+README = base64.b64encode(b"# Project\n\nA FastAPI service with PostgreSQL and Redis.\n" * 20).decode()
+
+
+class GitHubStub(StubJobBoard):
+    """Keep-alive HTTP/1.1 server with the REST endpoints and the GraphQL endpoint GitHubClient uses."""
+
+    def __init__(self, handshake_ms: float, rtt_ms: float):
+        super().__init__(b"", handshake_ms, rtt_ms)
+        self.requests = 0
+
+    def respond(self, path: str) -> tuple[int, bytes]:
+        parts = path.strip("/").split("/")
+        if len(parts) < 3 or parts[0] != "repos" or parts[2].startswith("missing"):
+            return 404, b'{"message": "Not Found"}'
+        owner, repo = parts[1], parts[2]
+        if len(parts) == 3:
+            body = {
+                "id": abs(hash(repo)) % 10**8, "name": repo, "full_name": f"{owner}/{repo}",
+                "html_url": f"https://github.com/{owner}/{repo}", "description": "Benchmark repo",
+                "stargazers_count": 42, "forks_count": 7, "watchers_count": 42, "language": "Python",
+                "fork": False, "private": False, "topics": ["fastapi"],
+                "created_at": "2024-01-02T03:04:05Z", "updated_at": "2025-01-02T03:04:05Z",
+                "pushed_at": "2025-01-02T03:04:05Z",
+            }
+        elif parts[3] == "languages":
+            body = {"Python": 120000, "TypeScript": 40000}
+        else:
+            body = {"content": README, "encoding": "base64"}
+        return 200, json.dumps(body).encode()
+
+    def respond_graphql(self, payload: bytes) -> tuple[int, bytes]:
+        variables = json.loads(payload)["variables"]
+        data = {}
+        for key, owner in variables.items():
+            if not key.startswith("owner"):
+                continue
+            i = key[len("owner"):]
+            repo = variables[f"name{i}"]
+            data[f"repo{i}"] = None if repo.startswith("missing") else {
+                "databaseId": abs(hash(repo)) % 10**8, "name": repo, "nameWithOwner": f"{owner}/{repo}",
+                "url": f"https://github.com/{owner}/{repo}", "description": "Benchmark repo",
+                "stargazerCount": 42, "forkCount": 7, "isFork": False, "isPrivate": False,
+                "primaryLanguage": {"name": "Python"},
+                "languages": {"edges": [
+                    {"size": 120000, "node": {"name": "Python"}},
+                    {"size": 40000, "node": {"name": "TypeScript"}},
+                ]},
+                "repositoryTopics": {"nodes": [{"topic": {"name": "fastapi"}}]},
+                "createdAt": "2024-01-02T03:04:05Z", "updatedAt": "2025-01-02T03:04:05Z",
+                "pushedAt": "2025-01-02T03:04:05Z",
+                "readme0": {"text": base64.b64decode(README).decode()},
+            }
+        return 200, json.dumps({"data": data}).encode()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.handshake)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                self.requests += 1
+                await asyncio.sleep(self.rtt)
+                method, path = head.split(b" ", 2)[:2]
+                if method == b"POST":
+                    length = int(re.search(rb'(?i)\r\ncontent-length: *(\d+)', head).group(1))
+                    status, body = self.respond_graphql(await reader.readexactly(length))
+                else:
+                    status, body = self.respond(path.decode())
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if status == 200 and f"\r\nif-none-match: {etag}\r\n".encode() in head.lower():
+                    status, body = 304, b""
+                writer.write(
+                    f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\nETag: {etag}\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def legacy_fetch_multiple(client: GitHubClient, urls: list[str]) -> list[GitHubRepo]:
+    """The previous fetch_multiple_repos: repos in sequence, a new AsyncClient and three sequential calls each."""
+    repos = []
+    for url in urls:
+        owner, repo = client.parse_repo_url(url)
+        base = f"{client.base_url}/repos/{owner}/{repo}"
+        async with httpx.AsyncClient(timeout=30.0) as http:
+            metadata = await http.get(base, headers=client.headers)
+            if metadata.status_code != 200:
+                repos.append(None)
+                continue
+            languages = await http.get(f"{base}/languages", headers=client.headers)
+            readme = await http.get(f"{base}/readme", headers=client.headers)
+            data = metadata.json()
+            repos.append(GitHubRepo(
+                repo_id=data["id"], full_name=data["full_name"], name=data["name"],
+                description=data["description"], url=data["html_url"],
+                stars_count=data["stargazers_count"], forks_count=data["forks_count"],
+                watchers_count=data["watchers_count"], languages=languages.json(),
+                primary_language=data["language"], is_fork=data["fork"], is_private=data["private"],
+                topics=data["topics"],
+                readme_content=base64.b64decode(readme.json()["content"]).decode(),
+            ))
+    return repos
+
+
+async def run(repos: int = 20, handshake_ms: float = 30.0, rtt_ms: float = 40.0) -> None:
+    stub = GitHubStub(handshake_ms, rtt_ms)
+    stub.serve_in_thread()
+    base_url = f"http://127.0.0.1:{stub.port}"
+    urls = [f"https://github.com/octo/{'missing' if i % 10 == 9 else 'repo'}-{i}" for i in range(repos)]
+
+    http = SharedHTTPClient()
+    client = GitHubClient(base_url=base_url, http=http, use_graphql=False)
+    graphql_client = GitHubClient(token="benchmark", base_url=base_url, http=http)
+    cache_dir = tempfile.TemporaryDirectory()
+    cache = GitHubResponseCache(backend="disk", directory=Path(cache_dir.name))
+    cached_client = GitHubClient(token="benchmark", base_url=base_url, http=http, use_graphql=False, cache=cache)
+    await cached_client.fetch_multiple_repos(urls)
+
+    print(f"{repos} repos ({sum('missing' in url for url in urls)} missing), "
+          f"{handshake_ms:g} ms per new connection, {rtt_ms:g} ms per request")
+    print(f"{'':>9} {'seconds':>8} {'requests':>9} {'connections':>12} {'rate limit':>11}")
+    runs = (
+        ("previous", legacy_fetch_multiple, client),
+        ("fan-out", GitHubClient.fetch_multiple_repos, client),
+        ("graphql", GitHubClient.fetch_multiple_repos, graphql_client),
+        ("etag", GitHubClient.fetch_multiple_repos, cached_client),
+    )
+    for name, fetch, github in runs:
+        requests, connections, free = stub.requests, stub.connections, cache.stats.rate_limit_saved
+        start = time.perf_counter()
+        results = await fetch(github, urls)
+        elapsed = time.perf_counter() - start
+        assert [bool(repo and not repo.errors) for repo in results] == ["missing" not in url for url in urls]
+        charged = stub.requests - requests - (cache.stats.rate_limit_saved - free)
+        print(f"{name:>9} {elapsed:>8.2f} {stub.requests - requests:>9} {stub.connections - connections:>12} "
+              f"{charged:>11}")
+
+    await http.aclose()
+    cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(run(
+        int(args[0]) if len(args) > 0 else 20,
+        float(args[1]) if len(args) > 1 else 30.0,
+        float(args[2]) if len(args) > 2 else 40.0,
+    ))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Parse-time benchmark for job page text extraction.
+
+Extracts the saved Greenhouse, Lever and generic career pages under
+app/tests/fixtures/job_html with the pre-extractor implementation (one
+soup.select() per noise and content selector, then a descendants walk) and
+with every installed HTMLTextExtractor engine, and prints ms per page. The
+json-ld column is the structured-data fast path, which the Greenhouse and
+Lever pages take; on the generic page it only scans for a block and finds none.
+
+Usage: python -m app.scripts.bench_html_extract [iterations]
+"""
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+from app.services.html_extract import ENGINES
+from app.services.structured_data import extract_job_posting
+from app.services.url_ingestion import URLIngestService
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "job_html"
+
+PAGES = [("greenhouse", "greenhouse"), ("lever", "lever"), ("generic", None)]
+
+
+def legacy_extract(html: str, platform: Optional[str] = None) -> str:
+    """URLIngestService._extract_job_text before the extractor engines."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for selector in URLIngestService.REMOVE_SELECTORS:
+        for element in soup.select(selector):
+            element.decompose()
+
+    content = None
+    for selector, selector_platform in URLIngestService.JOB_CONTENT_SELECTORS:
+        if selector_platform and selector_platform != platform:
+            continue
+        elements = soup.select(selector)
+        if elements:
+            content = elements[0]
+            break
+    if not content:
+        content = soup.body or soup
+
+    lines = []
+    for child in content.descendants:
+        if child.name in ['p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            lines.append('\n')
+        elif child.name == 'li':
+            lines.append('\n• ')
+        elif child.string:
+            text = child.string.strip()
+            if text:
+                lines.append(text + ' ')
+
+    text = ''.join(lines)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r' \n', '\n', text)
+    text = re.sub(r'\n ', '\n', text)
+    return text.strip()
+
+
+def time_per_page(extract, html: str, platform: Optional[str], iterations: int) -> float:
+    extract(html, platform)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        extract(html, platform)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def run(iterations: int = 200) -> None:
+    extractors = {"legacy": legacy_extract}
+    for name, engine in ENGINES.items():
+        if engine.available():
+            extractor = engine(URLIngestService.REMOVE_SELECTORS, URLIngestService.JOB_CONTENT_SELECTORS)
+            extractors[name] = extractor.extract
+        else:
+            print(f"{name} not installed, skipped")
+    extractors["json-ld"] = lambda html, platform: extract_job_posting(html)
+
+    print(f"{'page':<12}{'KB':>6}" + "".join(f"{name:>14}" for name in extractors))
+    for page, platform in PAGES:
+        html = (FIXTURES / f"{page}.html").read_text(encoding="utf-8")
+        timings = [time_per_page(extract, html, platform, iterations) for extract in extractors.values()]
+        print(f"{page:<12}{len(html) / 1000:>6.1f}" + "".join(f"{ms:>11.3f} ms" for ms in timings))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
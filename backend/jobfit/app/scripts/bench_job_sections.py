@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for JobSectionExtractor.extract_sections.
+
+Compares the previous extractor (one header search per field, each followed
+by slicing the rest of the text and searching it for SECTION_END) with the
+single pass, on job descriptions of 2 to 200 KB.
+
+Usage: python -m app.scripts.bench_job_sections [repeats]
+"""
+import random
+import sys
+import time
+
+from app.services.text_cleaner import JobSectionExtractor
+
+
+TEXT_SIZES = [2_000, 20_000, 200_000]
+
+HEADERS = ["About the role", "Responsibilities", "Requirements", "Nice to have", "Benefits", "How to apply"]
+
+SECTION_LINES = [
+    "• Design and build APIs in Python and Go",
+    "• Run what you build: on-call, SLOs, postmortems",
+    "The team works across three time zones and ships weekly.",
+    "• Strong PostgreSQL and Kafka skills",
+    "We care about reliability, observability and developer experience.",
+    "- Experience with Kubernetes and Terraform",
+]
+
+
+def legacy_extract_section(text: str, header_pattern) -> str | None:
+    """The previous per-field extraction."""
+    match = header_pattern.search(text)
+    if not match:
+        return None
+    remaining = text[match.end():]
+    end_match = JobSectionExtractor.SECTION_END.search(remaining)
+    section_text = remaining[:end_match.start()] if end_match else remaining[:2000]
+    return section_text.strip() if section_text.strip() else None
+
+
+def legacy_extract_sections(text: str) -> dict:
+    return {
+        name: legacy_extract_section(text, pattern)
+        for name, pattern in JobSectionExtractor.HEADER_PATTERNS.items()
+    }
+
+
+def make_text(size: int, seed: int = 3) -> str:
+    """One job description of about size chars: longer sections, same headers."""
+    rng = random.Random(seed)
+    per_section = max(1, size // (len(HEADERS) * 45))
+    lines = ["Senior Backend Engineer", "Northwind · Berlin"]
+    for header in HEADERS:
+        lines.extend(["", header])
+        lines.extend(rng.choice(SECTION_LINES) for _ in range(per_section))
+    return "\n".join(lines)
+
+
+def best_time(func, text: str, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1_000_000
+
+
+def run(repeats: int = 20) -> None:
+    print(f"{'chars':>8} {'previous us':>12} {'single pass us':>15} {'speedup':>8}")
+    for size in TEXT_SIZES:
+        text = make_text(size)
+        sections = JobSectionExtractor.extract_sections(text)
+        assert legacy_extract_sections(text) == {
+            name: getattr(sections, name) for name in JobSectionExtractor.HEADER_PATTERNS
+        }
+
+        legacy = best_time(legacy_extract_sections, text, repeats)
+        current = best_time(JobSectionExtractor.extract_sections, text, repeats)
+        print(f"{len(text):>8} {legacy:>12.1f} {current:>15.1f} {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for JobMetadataExtractor.extract_metadata.
+
+Compares the previous extractor (one search per seniority, role and remote
+pattern until the first hit, then the salary search) with the trigger scan
+in JobMetadataExtractor.scan, on cleaned synthetic job pages.
+
+Usage: python -m app.scripts.bench_metadata_scan [pages]
+"""
+import sys
+import time
+
+from app.scripts.bench_text_cleaner import make_pages
+from app.services.text_cleaner import JobMetadata, JobMetadataExtractor, TextCleaner
+
+
+def legacy_extract_metadata(text: str) -> JobMetadata:
+    """The previous extractor: each dimension's patterns searched in turn."""
+    metadata = JobMetadata()
+    for dimension, patterns in JobMetadataExtractor.DIMENSIONS.items():
+        for label, pattern in patterns.items():
+            if pattern.search(text):
+                setattr(metadata, dimension, label)
+                break
+
+    salary_match = JobMetadataExtractor.SALARY_PATTERN.search(text)
+    if salary_match:
+        groups = salary_match.groups()
+        if groups[0]:
+            metadata.salary_min = int(groups[0] + groups[1]) if groups[1] else int(groups[0])
+            metadata.salary_max = int(groups[2] + groups[3]) if groups[3] else int(groups[2])
+        elif groups[4]:
+            metadata.salary_min = int(groups[4]) * 1000
+            metadata.salary_max = int(groups[5]) * 1000
+        metadata.salary_currency = "USD"
+    return metadata
+
+
+def best_time(func, texts: list[str], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(page_count: int = 10_000) -> None:
+    texts = [TextCleaner.clean_job_text(page) for page in make_pages(page_count)]
+
+    for text in texts[:500]:
+        current = JobMetadataExtractor.extract_metadata(text, title_hint="-")
+        current.hits = []
+        current.title = None
+        assert current == legacy_extract_metadata(text)
+
+    legacy = best_time(legacy_extract_metadata, texts)
+    current = best_time(lambda text: JobMetadataExtractor.extract_metadata(text, title_hint="-"), texts)
+    print(f"{page_count} pages")
+    print(f"{'previous':>10} {legacy / page_count * 1e6:8.1f} us/page")
+    print(f"{'current':>10} {current / page_count * 1e6:8.1f} us/page  ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Bytes and parse CPU per import for the platform API adapters.
+
+Imports Greenhouse, Lever and Ashby postings through URLIngestService twice,
+once scraping the HTML page and once through the platform's JSON API. An
+httpx.MockTransport serves the saved pages under app/tests/fixtures/job_html
+and the API responses under app/tests/fixtures/platform_api, so the numbers
+are response bytes and CPU time spent in the service, without network noise.
+Ashby's hosted pages render client-side, its HTML side uses the generic page.
+
+Usage: python -m app.scripts.bench_platform_api [imports]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from app.core.http_client import SharedHTTPClient
+from app.services.url_ingestion import URLIngestService
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+
+POSTINGS = {
+    "greenhouse": (
+        "https://boards.greenhouse.io/acmepayments/jobs/4012345",
+        "job_html/greenhouse.html", "platform_api/greenhouse_job.json",
+    ),
+    "lever": (
+        "https://jobs.lever.co/northwind/5ac21346-8e0c-4494-8e7a-3eb92ff77902",
+        "job_html/lever.html", "platform_api/lever_posting.json",
+    ),
+    "ashby": (
+        "https://jobs.ashbyhq.com/globex/0b1e3f7a-4d2c-4f8e-9a51-7c6d2e8b9f10",
+        "job_html/generic.html", "platform_api/ashby_board.json",
+    ),
+}
+
+
+class FixtureServer:
+    """MockTransport handler answering from one page and one API fixture, counting bytes."""
+
+    def __init__(self, page: str, api_response: str):
+        self.page = (FIXTURES / page).read_bytes()
+        self.api_response = (FIXTURES / api_response).read_bytes()
+        self.bytes_sent = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host.startswith(("boards-api.", "api.")):
+            body, content_type = self.api_response, "application/json"
+        else:
+            body, content_type = self.page, "text/html; charset=utf-8"
+        self.bytes_sent += len(body)
+        return httpx.Response(200, content=body, headers={"Content-Type": content_type})
+
+
+async def measure(url: str, server: FixtureServer, use_platform_apis: bool, imports: int) -> tuple[float, float]:
+    """Return (KB per import, CPU ms per import)."""
+    http = SharedHTTPClient(transport=httpx.MockTransport(server))
+    service = URLIngestService(http=http, use_platform_apis=use_platform_apis)
+    await service.ingest_url(url)
+    server.bytes_sent = 0
+
+    start = time.process_time()
+    for _ in range(imports):
+        # Every import downloads Ashby's board, as for postings of different boards
+        service._board_responses.clear()
+        result = await service.ingest_url(url)
+        assert result.success and bool(result.api_url) == use_platform_apis
+    cpu_ms = (time.process_time() - start) * 1000 / imports
+    await http.aclose()
+    return server.bytes_sent / imports / 1000, cpu_ms
+
+
+async def run(imports: int = 300) -> None:
+    print(f"{'platform':<12}{'HTML KB':>9}{'API KB':>9}{'HTML ms':>10}{'API ms':>9}")
+    for platform, (url, page, api_response) in POSTINGS.items():
+        server = FixtureServer(page, api_response)
+        html_kb, html_ms = await measure(url, server, False, imports)
+        api_kb, api_ms = await measure(url, server, True, imports)
+        print(f"{platform:<12}{html_kb:>9.1f}{api_kb:>9.1f}{html_ms:>10.3f}{api_ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 300))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Memory per worker and per-request cost of the skill catalog snapshot.
+
+For the seed catalog and catalogs of 5,000 and 50,000 terms (the seed terms
+padded with bench_skill_matcher's synthetic skills), reports the memory a
+worker holds for the snapshot (tracemalloc, and CatalogSnapshot.memory_bytes'
+estimate) and the cost of building the catalog from rows on every request
+against reading the shared snapshot. Row building excludes the database
+round trip, which only adds to the per-request side.
+
+Usage: python -m app.scripts.bench_skill_catalog
+"""
+import gc
+import time
+import tracemalloc
+
+import yaml
+
+from app.scripts.bench_skill_matcher import make_catalog
+from app.services.skill_catalog import CatalogSnapshot, SkillCatalog
+from app.services.skill_matcher import SEED_FILE
+
+CATEGORIES = ("language", "framework", "cloud", "tool", "devops", "database")
+
+
+def make_rows(term_count: int) -> list[dict]:
+    catalog = make_catalog(term_count)
+    return [
+        {
+            "id": skill_id,
+            "canonical_name": name,
+            "display_name": name.title(),
+            "category": CATEGORIES[skill_id % len(CATEGORIES)],
+            "aliases": aliases,
+            "related_skills": [],
+        }
+        for skill_id, name, aliases in catalog
+    ]
+
+
+def measure_memory(rows: list[dict]) -> tuple[CatalogSnapshot, int]:
+    gc.collect()
+    tracemalloc.start()
+    snapshot = CatalogSnapshot.from_records(rows, version=1)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return snapshot, size
+
+
+def run() -> None:
+    print(f"{'skills':>8} {'terms':>8} {'traced KB':>10} {'estimate KB':>12} "
+          f"{'rebuild ms/req':>15} {'snapshot us/req':>16}")
+    with open(SEED_FILE, encoding="utf-8") as f:
+        seed_rows = yaml.safe_load(f)["skills"]
+    for rows in (seed_rows, make_rows(5_000), make_rows(50_000)):
+        snapshot, traced = measure_memory(rows)
+
+        start = time.perf_counter()
+        for _ in range(5):
+            CatalogSnapshot.from_records(rows)
+        rebuild_ms = (time.perf_counter() - start) / 5 * 1000
+
+        catalog = SkillCatalog(loader=None, version_reader=None)
+        catalog._snapshot = snapshot
+        start = time.perf_counter()
+        for _ in range(100_000):
+            catalog.snapshot.lookup("k8s")
+        lookup_us = (time.perf_counter() - start) / 100_000 * 1e6
+
+        print(f"{len(snapshot):>8} {snapshot.matcher.term_count:>8} {traced / 1024:>10.0f} "
+              f"{snapshot.memory_bytes() / 1024:>12.0f} {rebuild_ms:>15.2f} {lookup_us:>16.2f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for SkillMatcher against catalog size.
+
+Scans cleaned synthetic job pages with catalogs of 100, 1,000, 10,000 and
+50,000 terms: the seed catalog's terms, padded with made-up one to three
+word aliases. For reference, the same pages are scanned term by term with
+one compiled word-boundary regex per term, the straightforward way to map
+text to catalog terms, on the catalogs that finish in reasonable time.
+
+Usage: python -m app.scripts.bench_skill_matcher [pages]
+"""
+import random
+import re
+import string
+import sys
+import time
+
+from app.scripts.bench_text_cleaner import make_pages
+from app.services.skill_matcher import SEED_FILE, SkillMatcher
+from app.services.text_cleaner import TextCleaner
+
+SIZES = (100, 1_000, 10_000, 50_000)
+
+# Largest catalog the per-term regex baseline is run on
+REGEX_MAX_TERMS = 1_000
+
+
+def make_catalog(term_count: int, seed: int = 5) -> list[tuple[int, str, list[str]]]:
+    """Seed skills, then synthetic skills of five aliases each, up to term_count terms."""
+    import yaml
+
+    with open(SEED_FILE, encoding="utf-8") as f:
+        records = yaml.safe_load(f)["skills"]
+    catalog, total = [], 0
+    for skill_id, record in enumerate(records, start=1):
+        terms = list(dict.fromkeys([record["canonical_name"], *map(str, record.get("aliases") or [])]))
+        terms = terms[:term_count - total]
+        if not terms:
+            break
+        catalog.append((skill_id, terms[0], terms[1:]))
+        total += len(terms)
+
+    rng = random.Random(seed)
+    skill_id = len(records)
+    while total < term_count:
+        skill_id += 1
+        count = min(5, term_count - total)
+        terms = [
+            " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))) for _ in range(rng.randint(1, 3)))
+            for _ in range(count)
+        ]
+        catalog.append((skill_id, terms[0], terms[1:]))
+        total += count
+    return catalog
+
+
+def regex_find(patterns: list[tuple[int, re.Pattern]], text: str) -> int:
+    """The per-term baseline: every term's regex searched over the whole text."""
+    lowered = text.lower()
+    return sum(1 for _, pattern in patterns for _ in pattern.finditer(lowered))
+
+
+def mb_per_second(func, texts: list[str], size_mb: float, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return size_mb / best
+
+
+def run(page_count: int = 2_000) -> None:
+    texts = [TextCleaner.clean_job_text(page) for page in make_pages(page_count)]
+    size_mb = sum(len(text) for text in texts) / 1e6
+    print(f"{page_count} pages, {size_mb:.1f} MB")
+    print(f"{'terms':>8} {'build s':>8} {'nodes':>8} {'matcher MB/s':>13} {'hits/page':>10} {'regex MB/s':>11}")
+
+    for size in SIZES:
+        catalog = make_catalog(size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(catalog)
+        build = time.perf_counter() - start
+        hits = sum(len(matcher.find(text)) for text in texts) / page_count
+        matcher_speed = mb_per_second(matcher.find, texts, size_mb)
+
+        regex_speed = ""
+        if size <= REGEX_MAX_TERMS:
+            patterns = [
+                (skill_id, re.compile(r'(?<!\w)' + r'\s+'.join(map(re.escape, term.lower().split())) + r'(?!\w)'))
+                for skill_id, name, aliases in catalog for term in [name, *aliases]
+            ]
+            regex_speed = f"{mb_per_second(lambda text: regex_find(patterns, text), texts, size_mb, 1):.2f}"
+        print(f"{matcher.term_count:>8} {build:>8.2f} {len(matcher._goto):>8} {matcher_speed:>13.2f} "
+              f"{hits:>10.1f} {regex_speed:>11}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
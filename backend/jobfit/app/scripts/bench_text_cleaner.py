@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for TextCleaner.clean_job_text.
+
+Compares the previous pipeline (five HTML substitutions, one str.replace per
+unicode character and one pass per BOILERPLATE_PATTERNS regex) with the
+current one on 10,000 synthetic scraped job pages, and reports MB/s.
+
+Usage: python -m app.scripts.bench_text_cleaner [pages]
+"""
+import random
+import re
+import sys
+import time
+from html import unescape
+
+from app.services.text_cleaner import TextCleaner
+
+
+PARAGRAPHS = [
+    "<h2>About the role</h2><p>We are looking for a Senior Backend Engineer to join our Payments team.</p>",
+    "<p>You&rsquo;ll own services that move €2B a year &mdash; reliably.</p>",
+    "<h3>Responsibilities</h3><ul><li>Design and build APIs in Python and Go</li>"
+    "<li>Run what you build: on-call, SLOs, postmortems</li><li>Mentor engineers</li></ul>",
+    "<h3>Requirements</h3><ul><li>5+ years of backend experience</li>"
+    "<li>Strong PostgreSQL and Kafka skills</li><li>Experience with Kubernetes</li></ul>",
+    "<h3>Benefits</h3><ul><li>Remote-first, “work from anywhere”</li><li>Equity&nbsp;and 401k</li></ul>",
+    "<div class=\"salary\">$150,000 - $190,000 per year</div><br/>",
+    "<p>We value diversity… and we’re an equal opportunity employer.​</p>",
+]
+
+BOILERPLATE = [
+    "<div>Apply now</div>",
+    "<p>Share this job</p>",
+    "<span>Save job</span>",
+    "<div>Job ID: REQ-10293</div>",
+    "<p>Posted 3 days ago</p>",
+    "<p>Similar jobs</p>",
+    "<div>We use cookies to improve your experience.</div>",
+    "<a href=\"/login\">Sign in</a>",
+]
+
+
+def legacy_clean_job_text(raw_text: str) -> str:
+    """The previous clean_job_text: every substitution as its own pass."""
+    if not raw_text:
+        return ""
+
+    text = unescape(raw_text)
+    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'<p\s*/?>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'</p>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'<li\s*>', '\n• ', text, flags=re.IGNORECASE)
+    text = TextCleaner.HTML_TAG_PATTERN.sub('', text)
+
+    for old, new in TextCleaner.UNICODE_REPLACEMENTS.items():
+        text = text.replace(old, new)
+
+    for pattern in TextCleaner.BOILERPLATE_PATTERNS:
+        text = pattern.sub('', text)
+
+    text = TextCleaner.MULTI_SPACE_PATTERN.sub(' ', text)
+    text = TextCleaner.MULTI_NEWLINE_PATTERN.sub('\n\n', text)
+    lines = [line.strip() for line in text.split('\n')]
+    text = '\n'.join(lines)
+    return text.strip()
+
+
+def make_pages(count: int, seed: int = 11) -> list[str]:
+    """Build scraped-looking job pages with some UI junk between paragraphs."""
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(6, 14)):
+            parts.append(rng.choice(PARAGRAPHS))
+            if rng.random() < 0.25:
+                parts.append(rng.choice(BOILERPLATE))
+        pages.append("<html><body>\n" + "\n".join(parts) + "\n</body></html>")
+    return pages
+
+
+def throughput(func, pages: list[str], size_mb: float) -> float:
+    """MB/s for cleaning every page once."""
+    start = time.perf_counter()
+    for page in pages:
+        func(page)
+    return size_mb / (time.perf_counter() - start)
+
+
+def run(page_count: int = 10_000) -> None:
+    pages = make_pages(page_count)
+    size_mb = sum(len(page.encode()) for page in pages) / 1_000_000
+
+    for page in pages[:500]:
+        assert legacy_clean_job_text(page) == TextCleaner.clean_job_text(page)
+
+    legacy = throughput(legacy_clean_job_text, pages, size_mb)
+    current = throughput(TextCleaner.clean_job_text, pages, size_mb)
+    print(f"{page_count} pages, {size_mb:.1f} MB")
+    print(f"{'previous':>10} {legacy:8.1f} MB/s")
+    print(f"{'current':>10} {current:8.1f} MB/s  ({current / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
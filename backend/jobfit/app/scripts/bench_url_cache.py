@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Re-import benchmark for the URL ingestion conditional-GET cache.
+
+A local stub Greenhouse board serves pages with an ETag and answers matching
+If-None-Match requests with 304. The same postings are imported twice, by a
+URLIngestService without a cache and by one with a disk cache in a temporary
+directory; the second round shows latency and bytes downloaded per import.
+
+Usage: python -m app.scripts.bench_url_cache [postings]
+"""
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.core.http_client import http_client
+from app.scripts.bench_url_ingest import GREENHOUSE_PAGE, StubJobBoard
+from app.services.url_cache import URLResponseCache
+from app.services.url_ingestion import URLIngestService
+
+
+class ETagJobBoard(StubJobBoard):
+    """Stub board with one ETag per page, honouring If-None-Match."""
+
+    ETAG = b'"posting-v1"'
+
+    def __init__(self, page: bytes):
+        super().__init__(page, handshake_ms=0, rtt_ms=0)
+        self.bytes_sent = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if b"if-none-match: " + self.ETAG in head.lower():
+                    response = b"HTTP/1.1 304 Not Modified\r\nETag: " + self.ETAG + b"\r\nContent-Length: 0\r\n\r\n"
+                else:
+                    response = (
+                        b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\nETag: " + self.ETAG +
+                        b"\r\nContent-Length: " + str(len(self.page)).encode() + b"\r\n\r\n" + self.page
+                    )
+                self.bytes_sent += len(response)
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def reimport(service: URLIngestService, board: ETagJobBoard, urls: list[str]) -> tuple[float, float]:
+    """Import every URL twice, return (median ms, KB sent per import) of the second round."""
+    for url in urls:
+        await service.ingest_url(url)
+
+    sent_before = board.bytes_sent
+    latencies = []
+    for url in urls:
+        start = time.perf_counter()
+        result = await service.ingest_url(url)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert result.success
+    return statistics.median(latencies), (board.bytes_sent - sent_before) / len(urls) / 1000
+
+
+async def run(postings: int = 200) -> None:
+    board = ETagJobBoard(GREENHOUSE_PAGE * 4)
+    board.serve_in_thread()
+    urls = [f"http://127.0.0.1:{board.port}/boards.greenhouse.io/acme/jobs/{i}" for i in range(postings)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = URLResponseCache(backend="disk", directory=Path(directory))
+        services = {
+            "no cache": URLIngestService(max_content_length=2_000_000),
+            "cached": URLIngestService(max_content_length=2_000_000, cache=cache),
+        }
+        print(f"{postings} postings re-imported, {len(board.page) / 1000:.0f} KB per page")
+        for name, service in services.items():
+            median_ms, kb_sent = await reimport(service, board, urls)
+            print(f"{name:>9} {median_ms:8.2f} ms/import {kb_sent:10.1f} KB/import")
+        print(f"cache stats: {cache.stats}")
+
+    await http_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
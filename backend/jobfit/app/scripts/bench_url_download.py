@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Memory and time benchmark for rejecting oversized job pages.
+
+A local stub serves a 50 MB page, once with a Content-Length header and once
+chunked (no declared size). Compares the previous fetch, which downloaded the
+whole body and then checked len(response.content) against max_content_length,
+with the streamed, size-capped read in URLIngestService. Peak memory is
+measured with tracemalloc.
+
+Usage: python -m app.scripts.bench_url_download [page_mb]
+"""
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from app.core.http_client import http_client
+from app.scripts.bench_url_ingest import StubJobBoard
+from app.services.url_ingestion import URLIngestService
+
+CHUNK = 64 * 1024
+
+
+class LargePageBoard(StubJobBoard):
+    """Stub board serving one big page, with Content-Length or chunked."""
+
+    def __init__(self, page: bytes, chunked: bool):
+        super().__init__(page, handshake_ms=0, rtt_ms=0)
+        self.chunked = chunked
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                if not self.chunked:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                        b"Content-Length: " + str(len(self.page)).encode() + b"\r\n\r\n"
+                    )
+                    for i in range(0, len(self.page), CHUNK):
+                        writer.write(self.page[i:i + CHUNK])
+                        await writer.drain()
+                else:
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                                 b"Transfer-Encoding: chunked\r\n\r\n")
+                    for i in range(0, len(self.page), CHUNK):
+                        piece = self.page[i:i + CHUNK]
+                        writer.write(f"{len(piece):x}\r\n".encode() + piece + b"\r\n")
+                        await writer.drain()
+                    writer.write(b"0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def legacy_fetch(service: URLIngestService, url: str) -> bool:
+    """The previous check: download everything, then compare the size."""
+    response = await http_client.get(url, headers=service.headers, timeout=service.timeout)
+    return len(response.content) > service.max_content_length
+
+
+async def streamed_fetch(service: URLIngestService, url: str) -> bool:
+    result = await service.ingest_url(url)
+    return result.error_message == "Page too large"
+
+
+async def measure(fetch, service: URLIngestService, url: str) -> tuple[float, float]:
+    """(seconds, peak MB) to reject one oversized page."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    rejected = await fetch(service, url)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert rejected
+    return elapsed, peak / 1_000_000
+
+
+async def run(page_mb: int = 50) -> None:
+    page = b"<html><body><div class=\"job-description\">" + b"<p>Lorem ipsum dolor sit amet.</p>" * (page_mb * 1_000_000 // 34) + b"</div></body></html>"
+    service = URLIngestService()
+    print(f"{len(page) / 1_000_000:.0f} MB page, cap {service.max_content_length / 1000:.0f} KB")
+    print(f"{'':>22} {'seconds':>8} {'peak MB':>8}")
+    for chunked in (False, True):
+        board = LargePageBoard(page, chunked)
+        board.serve_in_thread()
+        url = f"http://127.0.0.1:{board.port}/jobs/1"
+        label = "chunked" if chunked else "content-length"
+        for name, fetch in (("previous", legacy_fetch), ("streamed", streamed_fetch)):
+            elapsed, peak = await measure(fetch, service, url)
+            print(f"{label + ' ' + name:>22} {elapsed:8.3f} {peak:8.1f}")
+
+    await http_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Wall-clock benchmark for importing a list of job URLs.
+
+Serves a Greenhouse board, a Lever board and two company career sites from
+local stubs that answer after a fixed delay and throttle every 15th request
+with a 429. Compares importing the list one URL at a time, as repeated
+POST /jobs/import-url calls do, with URLImportScheduler.
+
+Usage: python -m app.scripts.bench_url_import [urls] [rtt_ms]
+"""
+import asyncio
+import sys
+import time
+from collections import Counter
+
+from app.core.http_client import http_client
+from app.scripts.bench_url_ingest import GREENHOUSE_PAGE, LEVER_PAGE, StubJobBoard
+from app.services.import_scheduler import URLImportScheduler
+from app.services.url_ingestion import url_ingest_service
+
+
+class ThrottlingJobBoard(StubJobBoard):
+    """Stub board that answers every `throttle_every`-th request with 429."""
+
+    def __init__(self, page: bytes, rtt_ms: float, throttle_every: int = 15):
+        super().__init__(page, handshake_ms=0, rtt_ms=rtt_ms)
+        self.throttle_every = throttle_every
+        self.requests = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                self.requests += 1
+                await asyncio.sleep(self.rtt)
+                if self.requests % self.throttle_every == 0:
+                    writer.write(b"HTTP/1.1 429 Too Many Requests\r\nContent-Length: 0\r\n\r\n")
+                else:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                        b"Content-Length: " + str(len(self.page)).encode() + b"\r\n\r\n" + self.page
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def make_urls(boards: dict[str, ThrottlingJobBoard], count: int) -> list[str]:
+    """40% Greenhouse, 30% Lever, the rest split over two career sites."""
+    paths = {
+        "greenhouse": "boards.greenhouse.io/acme/jobs/{}",
+        "lever": "jobs.lever.co/acme/{}",
+        "careers_a": "careers/{}",
+        "careers_b": "careers/{}",
+    }
+    weights = ["greenhouse"] * 4 + ["lever"] * 3 + ["careers_a", "careers_b", "careers_a"]
+    urls = []
+    for i in range(count):
+        name = weights[i % len(weights)]
+        urls.append(f"http://127.0.0.1:{boards[name].port}/" + paths[name].format(i))
+    return urls
+
+
+async def one_by_one(urls: list[str]) -> Counter:
+    outcomes = Counter()
+    for url in urls:
+        result = await url_ingest_service.ingest_url(url)
+        outcomes["ok" if result.success else f"HTTP {result.http_status}"] += 1
+    return outcomes
+
+
+async def scheduled(urls: list[str]) -> Counter:
+    outcomes = Counter()
+    async for item in URLImportScheduler().run(urls):
+        outcomes["ok" if item.result.success else f"HTTP {item.result.http_status}"] += 1
+    return outcomes
+
+
+async def run(count: int = 200, rtt_ms: float = 100.0) -> None:
+    boards = {
+        "greenhouse": ThrottlingJobBoard(GREENHOUSE_PAGE, rtt_ms),
+        "lever": ThrottlingJobBoard(LEVER_PAGE, rtt_ms),
+        "careers_a": ThrottlingJobBoard(GREENHOUSE_PAGE.replace(b'id="content"', b'class="job-description"'), rtt_ms),
+        "careers_b": ThrottlingJobBoard(LEVER_PAGE.replace(b'posting-page', b'job-description'), rtt_ms),
+    }
+    for board in boards.values():
+        board.serve_in_thread()
+    urls = make_urls(boards, count)
+
+    print(f"{count} URLs, {rtt_ms:g} ms per request, every 15th request throttled")
+    for name, import_all in (("one by one", one_by_one), ("scheduler", scheduled)):
+        start = time.perf_counter()
+        outcomes = await import_all(urls)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>11} {elapsed:7.1f} s  {dict(outcomes)}")
+
+    await http_client.aclose()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(run(
+        int(args[0]) if len(args) > 0 else 200,
+        float(args[1]) if len(args) > 1 else 100.0,
+    ))
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for repeated Greenhouse/Lever URL imports.
+
+Runs two local stub job boards (one per platform, each on its own port) and
+imports the same postings over and over, first with a new httpx.AsyncClient
+per URL as URLIngestService used to, then through the shared pooled client.
+The stubs charge a configurable delay for every new connection to stand in
+for the TCP and TLS handshakes a real board costs, plus a per-request delay.
+
+Usage: python -m app.scripts.bench_url_ingest [imports] [handshake_ms] [rtt_ms]
+"""
+import asyncio
+import statistics
+import sys
+import threading
+import time
+
+import httpx
+
+from app.core.http_client import http_client
+from app.services.url_ingestion import URLIngestResult, url_ingest_service
+
+PARAGRAPH = (
+    "<p>You will design, build and run the services behind our payments platform, "
+    "working with Python, Go, PostgreSQL and Kafka on Kubernetes.</p>"
+)
+
+GREENHOUSE_PAGE = (
+    "<html><head><title>Senior Backend Engineer</title></head><body>"
+    "<header><nav>Jobs</nav></header><div id=\"content\"><h1>Senior Backend Engineer</h1>"
+    + PARAGRAPH * 60 +
+    "<h3>Requirements</h3><ul>" + "<li>5+ years building distributed systems</li>" * 20 + "</ul>"
+    "</div><footer>Powered by Greenhouse</footer></body></html>"
+).encode()
+
+LEVER_PAGE = (
+    "<html><head><title>Staff Data Engineer</title></head><body>"
+    "<div class=\"posting-page\"><h2>Staff Data Engineer</h2>"
+    + PARAGRAPH * 60 +
+    "<h3>What you'll need</h3><ul>" + "<li>Airflow, dbt and Spark in production</li>" * 20 + "</ul>"
+    "</div><div class=\"apply-button\">Apply for this job</div></body></html>"
+).encode()
+
+
+class StubJobBoard:
+    """Minimal keep-alive HTTP/1.1 server answering every GET with one page."""
+
+    def __init__(self, page: bytes, handshake_ms: float, rtt_ms: float):
+        self.page = page
+        self.handshake = handshake_ms / 1000
+        self.rtt = rtt_ms / 1000
+        self.connections = 0
+        self.port = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.handshake)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                await asyncio.sleep(self.rtt)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                    b"Content-Length: " + str(len(self.page)).encode() + b"\r\n\r\n" + self.page
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def serve_in_thread(self) -> None:
+        started = threading.Event()
+
+        async def serve() -> None:
+            server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+            self.port = server.sockets[0].getsockname()[1]
+            started.set()
+            async with server:
+                await server.serve_forever()
+
+        threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+        started.wait()
+
+
+async def legacy_ingest(url: str) -> URLIngestResult:
+    """The previous fetch: a fresh client, connection pool and TLS context per URL."""
+    start = time.time()
+    async with httpx.AsyncClient(
+        timeout=url_ingest_service.timeout,
+        follow_redirects=True,
+        headers=url_ingest_service.headers,
+    ) as client:
+        response = await client.get(url)
+        raw_text = url_ingest_service._extract_job_text(response.text, url_ingest_service._detect_platform(url))
+        return URLIngestResult(
+            success=True,
+            raw_text=raw_text,
+            source_url=url,
+            fetch_time_ms=int((time.time() - start) * 1000),
+        )
+
+
+def make_urls(boards: dict[str, StubJobBoard], imports: int) -> list[str]:
+    urls = []
+    for i in range(imports):
+        if i % 2:
+            urls.append(f"http://127.0.0.1:{boards['lever'].port}/jobs.lever.co/acme/{i}")
+        else:
+            urls.append(f"http://127.0.0.1:{boards['greenhouse'].port}/boards.greenhouse.io/acme/jobs/{i}")
+    return urls
+
+
+async def sequential_latencies(ingest, urls: list[str]) -> list[float]:
+    latencies = []
+    for url in urls:
+        start = time.perf_counter()
+        result = await ingest(url)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert result.success, result.error_message or result.fallback_message
+    return latencies
+
+
+async def concurrent_seconds(ingest, urls: list[str], concurrency: int = 20) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> None:
+        async with semaphore:
+            await ingest(url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(url) for url in urls))
+    return time.perf_counter() - start
+
+
+async def run(imports: int = 200, handshake_ms: float = 10.0, rtt_ms: float = 2.0) -> None:
+    boards = {
+        "greenhouse": StubJobBoard(GREENHOUSE_PAGE, handshake_ms, rtt_ms),
+        "lever": StubJobBoard(LEVER_PAGE, handshake_ms, rtt_ms),
+    }
+    for board in boards.values():
+        board.serve_in_thread()
+    urls = make_urls(boards, imports)
+
+    first = await url_ingest_service.ingest_url(urls[0])
+    assert first.raw_text == (await legacy_ingest(urls[0])).raw_text
+
+    print(f"{imports} imports, {handshake_ms:g} ms per new connection, {rtt_ms:g} ms per request")
+    print(f"{'':>8} {'p50 ms':>8} {'p95 ms':>8} {'connections':>12} {'concurrent s':>13}")
+    for name, ingest in (("previous", legacy_ingest), ("pooled", url_ingest_service.ingest_url)):
+        before = sum(board.connections for board in boards.values())
+        latencies = await sequential_latencies(ingest, urls)
+        wall = await concurrent_seconds(ingest, urls)
+        connections = sum(board.connections for board in boards.values()) - before
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{name:>8} {statistics.median(latencies):>8.2f} {p95:>8.2f} {connections:>12} {wall:>13.2f}")
+
+    await http_client.aclose()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(run(
+        int(args[0]) if len(args) > 0 else 200,
+        float(args[1]) if len(args) > 1 else 10.0,
+        float(args[2]) if len(args) > 2 else 2.0,
+    ))
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.models import Skill, SkillCategory
+from app.services.skill_catalog import bump_catalog_version
 
 
 # Load database URL from environment or use default
@@ -86,11 +87,13 @@ async def seed_skills():
                 created_count += 1
         
         await session.commit()
+        version = await bump_catalog_version()
         
         print(f"\nSeeding complete!")
         print(f"   Created: {created_count}")
         print(f"   Updated: {updated_count}")
         print(f"   Skipped: {skipped_count}")
+        print(f"   Catalog version: {version if version is not None else 'not bumped, Redis unavailable'}")
 
 
 async def clear_skills():
@@ -103,6 +106,7 @@ async def clear_skills():
     async with async_session() as session:
         await session.execute(Skill.__table__.delete())
         await session.commit()
+        await bump_catalog_version()
         print("All skills cleared")
 
 
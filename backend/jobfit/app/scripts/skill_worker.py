@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Run a skill extraction worker outside the API processes.
+
+Claims unprocessed jobs in batches and stores their skills until stopped,
+or until no unprocessed jobs are left with --drain. Start as many of these
+as needed: batches are claimed with FOR UPDATE SKIP LOCKED, so workers
+never process the same job twice.
+
+Usage: python -m app.scripts.skill_worker [--batch-size 50] [--drain]
+"""
+import argparse
+import asyncio
+import time
+
+from app.core.database import engine
+from app.services.job_skill_worker import JobSkillWorker
+from app.services.skill_catalog import skill_catalog
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Extract skills of unprocessed jobs.")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--drain", action="store_true", help="exit once no unprocessed jobs are left")
+    return parser.parse_args()
+
+
+async def drain(worker: JobSkillWorker) -> None:
+    start = time.perf_counter()
+    processed = failed = skills = 0
+    while True:
+        report = await worker.process_batch()
+        if not report.claimed:
+            break
+        processed += report.processed
+        failed += report.failed
+        skills += report.skills
+        print(f"batch: {report.processed} processed, {report.failed} failed, "
+              f"{report.skills} skills in {report.elapsed_ms} ms")
+    elapsed = time.perf_counter() - start
+    print(f"Done: {processed} jobs processed, {failed} failed, {skills} skills in {elapsed:.1f}s "
+          f"({processed / max(elapsed, 1e-6):.0f} jobs/s)")
+
+
+async def main() -> None:
+    args = parse_args()
+    worker = JobSkillWorker(batch_size=args.batch_size)
+    await skill_catalog.refresh()
+    try:
+        if args.drain:
+            await drain(worker)
+        else:
+            skill_catalog.start()
+            await worker.run()
+    finally:
+        await skill_catalog.stop()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,141 @@
+"""
+Content-hash keyed cache for resume extraction results.
+
+Users re-upload the same CV many times, so the pdfplumber output and the
+parsed structure are cached on the sha256 of the PDF bytes:
+an in-process LRU in front of the Redis instance named by Settings.redis_url.
+"""
+import copy
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from app.core.config import get_settings
+from app.services.pdf_extract import ExtractedResume
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class CachedExtraction:
+    """Cached result of extracting and parsing one PDF."""
+    extracted: ExtractedResume
+    parsed_structure: dict
+
+
+class ExtractionCache:
+    """
+    Two-tier extraction cache keyed on the file hash.
+
+    Redis is optional: if the package is missing or the server is down the
+    cache keeps working with the in-process tier only.
+    """
+
+    KEY_PREFIX = "jobfit:extraction:"
+
+    # Seconds to wait before trying Redis again after a connection failure
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        redis_url: Optional[str] = None,
+    ):
+        self.max_entries = max_entries or settings.extraction_cache_max_entries
+        self.ttl_seconds = ttl_seconds or settings.extraction_cache_ttl_seconds
+        self.redis_url = redis_url or settings.redis_url
+        self._entries: OrderedDict[str, CachedExtraction] = OrderedDict()
+        self._redis = None
+        self._redis_available = True
+        self._redis_retry_at = 0.0
+
+    async def get(self, file_hash: str) -> Optional[CachedExtraction]:
+        """Return the cached extraction for a file hash, if any."""
+        entry = self._entries.get(file_hash)
+        if entry is None:
+            payload = await self._redis_call("get", self.KEY_PREFIX + file_hash)
+            if not payload:
+                return None
+            try:
+                entry = self._decode(payload)
+            except (ValueError, TypeError, KeyError) as e:
+                logger.warning(f"Discarding corrupt extraction cache entry {file_hash}: {e}")
+                return None
+            self._remember(file_hash, entry)
+        else:
+            self._entries.move_to_end(file_hash)
+
+        # Callers own what they get back, never hand out the cached objects
+        return copy.deepcopy(entry)
+
+    async def set(self, file_hash: str, extracted: ExtractedResume, parsed_structure: dict) -> None:
+        """
+        Cache a successful extraction.
+
+        Results with errors are not cached, they may come from a timeout or a
+        crashed worker and should be retried on the next upload.
+        """
+        if extracted.errors:
+            return
+        entry = copy.deepcopy(CachedExtraction(extracted=extracted, parsed_structure=parsed_structure))
+        self._remember(file_hash, entry)
+        await self._redis_call("set", self.KEY_PREFIX + file_hash, self._encode(entry), ex=self.ttl_seconds)
+
+    def clear(self) -> None:
+        """Drop the in-process tier."""
+        self._entries.clear()
+
+    def _remember(self, file_hash: str, entry: CachedExtraction) -> None:
+        self._entries[file_hash] = entry
+        self._entries.move_to_end(file_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _encode(entry: CachedExtraction) -> str:
+        return json.dumps({
+            "extracted": asdict(entry.extracted),
+            "parsed_structure": entry.parsed_structure,
+        })
+
+    @staticmethod
+    def _decode(payload: bytes | str) -> CachedExtraction:
+        data = json.loads(payload)
+        return CachedExtraction(
+            extracted=ExtractedResume(**data["extracted"]),
+            parsed_structure=data["parsed_structure"],
+        )
+
+    async def _redis_call(self, method: str, *args, **kwargs):
+        """Run a Redis command, treating any failure as a cache miss."""
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            return await getattr(client, method)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Extraction cache Redis {method} failed: {e}")
+            self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+            return None
+
+    def _get_redis(self):
+        if not self._redis_available or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            try:
+                import redis.asyncio as redis_asyncio
+            except ImportError:
+                logger.warning("redis package not installed, extraction cache is in-process only")
+                self._redis_available = False
+                return None
+            self._redis = redis_asyncio.from_url(self.redis_url, socket_connect_timeout=1.0)
+        return self._redis
+
+
+# Singleton instance
+extraction_cache = ExtractionCache()
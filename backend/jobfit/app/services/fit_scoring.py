@@ -0,0 +1,553 @@
+"""
+Fit scoring of a user's skills against a job's skills.
+
+A job is a vector of importance weights over the skill catalog's index
+(NICE_TO_HAVE=1, PREFERRED=2, REQUIRED=3, 0 for skills it does not name), a
+user a vector of UserSkill.strength (0-1). FitScorer computes every score
+of AnalysisJsonDetail from the two vectors with array operations:
+
+- coverage: importance-weighted share of job skills the user has, partial
+  matches counting half
+- depth: importance-weighted mean strength of the top job skills the user has
+- bonus: user skills the job does not name, weighted by how much of the job's
+  demand falls in their radar category
+- radar: per radar category, importance-weighted strength on the job's
+  skills, or the user's mean strength when the job names none there
+
+One FitScorer is built per catalog snapshot and shared; scoring an analysis
+takes tens of microseconds. score_many() scores one user against many jobs
+at once, the jobs' weights as a CSR matrix (JobSkillMatrix) and the user
+as a dense vector, with the same results as score() on each job.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+from sqlalchemy import JSON, column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.job_skill_worker import IMPORTANCE_RANK, JOB_SKILLS_TABLE, JOBS_TABLE
+from app.services.skill_catalog import CatalogSnapshot, SkillCatalog, skill_catalog
+
+logger = logging.getLogger(__name__)
+
+SCORING_VERSION = "fit-scoring v1"
+
+# user_skills columns read for scoring, without the UserSkill mapper
+USER_SKILLS_TABLE = table(
+    "user_skills",
+    column("user_id"),
+    column("skill_id"),
+    column("strength"),
+    column("years_experience"),
+    column("evidence", JSON),
+    column("best_evidence_text"),
+)
+
+RADAR_AXES = ("backend", "frontend", "devops", "ml_ai", "communication", "data", "mobile", "security")
+
+# Skill category -> radar axis; categories not listed count towards no axis
+CATEGORY_AXES = {
+    **dict.fromkeys((
+        "backend", "language", "framework", "api", "architecture", "authentication", "cache",
+        "messaging", "runtime", "jvm", "scripting", "general_purpose", "systems", "library", "development",
+    ), "backend"),
+    **dict.fromkeys(("frontend", "web"), "frontend"),
+    **dict.fromkeys((
+        "devops", "cloud", "platform", "tool", "ci_cd", "containerization", "kubernetes", "orchestration",
+        "iac", "configuration", "automation", "monitoring", "provider", "version_control", "testing",
+    ), "devops"),
+    **dict.fromkeys(("ml_ai", "ai", "llm", "nlp", "data_science"), "ml_ai"),
+    **dict.fromkeys((
+        "communication", "soft_skill", "interpersonal", "management", "leadership", "methodology",
+        "process", "cognitive",
+    ), "communication"),
+    **dict.fromkeys((
+        "data", "database", "relational", "nosql", "query", "search", "big_data", "streaming", "data_processing",
+    ), "data"),
+    "mobile": "mobile",
+    "security": "security",
+}
+
+DEFAULT_WEIGHTS = {"coverage": 0.6, "depth": 0.3, "bonus": 0.1}
+
+# Strength from which a job skill counts as matched, and as partially matched
+MATCH_THRESHOLD = 0.6
+PARTIAL_THRESHOLD = 0.3
+
+# Job skills the depth score looks at
+TOP_SKILLS = 10
+
+# Relevance-weighted bonus strength that earns the full bonus score
+BONUS_SATURATION = 3.0
+
+IMPORTANCE_LABELS = {1: "nice to have", 2: "preferred", 3: "required"}
+
+COVERAGE_FORMULA = "(matched + 0.5*partial) / total, each weighted by importance"
+DEPTH_FORMULA = f"importance-weighted mean strength of the top {TOP_SKILLS} job skills the user has"
+
+
+@dataclass
+class FitScore:
+    """Scores of one user against one job; skill arrays are catalog indexes."""
+    overall: float
+    coverage: float
+    depth: float
+    bonus: float
+    radar: dict[str, float]
+    matched: np.ndarray
+    partial: np.ndarray
+    missing: np.ndarray
+    bonus_skills: np.ndarray
+    bonus_relevance: np.ndarray  # aligned with bonus_skills
+    top_evaluated: int
+    average_evidence_strength: float
+    weights: dict[str, float] = field(default_factory=dict)
+    job_weights: Optional[np.ndarray] = None  # the scored vectors
+    strengths: Optional[np.ndarray] = None
+
+    def breakdown(self) -> dict:
+        """ScoreBreakdown fields."""
+        return {
+            "total_required_skills": int(self.matched.size + self.partial.size + self.missing.size),
+            "matched_skills": int(self.matched.size),
+            "partial_skills": int(self.partial.size),
+            "missing_skills": int(self.missing.size),
+            "coverage_formula": COVERAGE_FORMULA,
+            "top_skills_evaluated": self.top_evaluated,
+            "average_evidence_strength": self.average_evidence_strength,
+            "depth_formula": DEPTH_FORMULA,
+            "bonus_skills_count": int(self.bonus_skills.size),
+            "bonus_relevance_average": float(self.bonus_relevance.mean()) if self.bonus_relevance.size else 0.0,
+            "weights": dict(self.weights),
+        }
+
+
+@dataclass
+class JobSkillMatrix:
+    """Importance weights of several jobs, CSR over the catalog's skill index."""
+    job_ids: np.ndarray  # job of each row
+    indptr: np.ndarray
+    indices: np.ndarray  # sorted within each row
+    data: np.ndarray
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Row of each stored entry."""
+        return np.repeat(np.arange(self.job_ids.size), np.diff(self.indptr))
+
+    def matvec(self, vector: np.ndarray) -> np.ndarray:
+        """Matrix-vector product with a dense vector over the skill index."""
+        return np.bincount(self.rows, weights=self.data * vector[self.indices], minlength=self.job_ids.size)
+
+
+@dataclass
+class BatchFitScore:
+    """Scores of one user against each row of a JobSkillMatrix."""
+    job_ids: np.ndarray
+    overall: np.ndarray
+    coverage: np.ndarray
+    depth: np.ndarray
+    bonus: np.ndarray
+    matched: np.ndarray  # counts per job
+    partial: np.ndarray
+    missing: np.ndarray
+    top_strengths: list[list[int]]  # catalog indexes per job
+    top_gaps: list[list[int]]
+    contributions: np.ndarray  # coverage points of each matrix entry
+    matrix: JobSkillMatrix
+
+    def coverage_by_skill(self, records: tuple) -> dict[str, dict[int, float]]:
+        """
+        Skill name -> {job id -> coverage points the skill earns in that job}.
+
+        A job's points add up to its coverage score.
+        """
+        comparison: dict[str, dict[int, float]] = {}
+        job_ids = self.matrix.job_ids[self.matrix.rows]
+        for job_id, index, points in zip(job_ids.tolist(), self.matrix.indices.tolist(), self.contributions.tolist()):
+            record = records[index]
+            comparison.setdefault(record.display_name or record.canonical_name, {})[job_id] = round(points, 2)
+        return comparison
+
+
+def _rank_in_rows(rows: np.ndarray) -> np.ndarray:
+    """Position of each entry within its row, for entries grouped by row."""
+    return np.arange(rows.size) - np.searchsorted(rows, rows)
+
+
+def _first_per_row(order: np.ndarray, rows: np.ndarray, jobs: int, count: int) -> list[list[int]]:
+    """The first count entries of each row, order being entry positions grouped by row."""
+    ordered_rows = rows[order]
+    kept = order[_rank_in_rows(ordered_rows) < count]
+    bounds = np.searchsorted(rows[kept], np.arange(jobs + 1))
+    return [kept[bounds[row]:bounds[row + 1]].tolist() for row in range(jobs)]
+
+
+def importance_weight(importance: Union[str, int, Any]) -> int:
+    """Weight of a JobSkill importance, given as SkillImportance, its name or its value."""
+    if isinstance(importance, int):
+        return importance
+    name = getattr(importance, "name", importance)
+    if name in IMPORTANCE_RANK:
+        return IMPORTANCE_RANK[name]
+    return int(getattr(importance, "value", importance))
+
+
+class FitScorer:
+    """
+    Skill index, radar axes and scoring of one catalog snapshot.
+
+    Read-only after construction, so one instance serves concurrent requests.
+    """
+
+    def __init__(self, snapshot: CatalogSnapshot, weights: Optional[dict[str, float]] = None):
+        self.snapshot = snapshot
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.size = len(snapshot.records)
+        self.index_of = {record.id: index for index, record in enumerate(snapshot.records)}
+        # Radar axis of each skill; skills without one go to a last, ignored bucket
+        axis_index = {axis: index for index, axis in enumerate(RADAR_AXES)}
+        self.axes = np.array(
+            [axis_index.get(CATEGORY_AXES.get(record.category), len(RADAR_AXES)) for record in snapshot.records],
+            dtype=np.intp,
+        )
+
+    def job_vector(self, job_skills: Iterable[tuple[int, Any]]) -> np.ndarray:
+        """Importance weights from (skill_id, importance) pairs; unknown skills are dropped."""
+        vector = np.zeros(self.size)
+        for skill_id, importance in job_skills:
+            index = self.index_of.get(skill_id)
+            if index is not None:
+                vector[index] = max(vector[index], importance_weight(importance))
+        return vector
+
+    def user_vector(self, user_skills: Iterable[tuple[int, float]]) -> np.ndarray:
+        """Strengths from (skill_id, strength) pairs, clipped to 0-1."""
+        vector = np.zeros(self.size)
+        for skill_id, strength in user_skills:
+            index = self.index_of.get(skill_id)
+            if index is not None:
+                vector[index] = strength or 0.0
+        return np.clip(vector, 0.0, 1.0, out=vector)
+
+    def job_matrix(self, job_ids: Iterable[int], job_skills: Iterable[tuple[int, int, Any]]) -> JobSkillMatrix:
+        """
+        CSR matrix of jobs from (job_id, skill_id, importance) rows.
+
+        Rows follow job_ids; skills outside the catalog and jobs not in
+        job_ids are dropped, a skill listed twice keeps its highest weight.
+        """
+        job_ids = np.array(list(job_ids), dtype=np.int64)
+        row_of = {job_id: row for row, job_id in enumerate(job_ids.tolist())}
+        rows, cols, data = [], [], []
+        for job_id, skill_id, importance in job_skills:
+            row, col = row_of.get(job_id), self.index_of.get(skill_id)
+            if row is not None and col is not None:
+                rows.append(row)
+                cols.append(col)
+                data.append(importance_weight(importance))
+        rows, cols, data = np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp), np.array(data, dtype=float)
+
+        # Sorted by row, column, then highest weight first; keep one entry per cell
+        order = np.lexsort((-data, cols, rows))
+        rows, cols, data = rows[order], cols[order], data[order]
+        first = np.ones(rows.size, dtype=bool)
+        first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        rows, cols, data = rows[first], cols[first], data[first]
+
+        indptr = np.zeros(job_ids.size + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=job_ids.size), out=indptr[1:])
+        return JobSkillMatrix(job_ids=job_ids, indptr=indptr, indices=cols, data=data)
+
+    def score(self, job: np.ndarray, user: np.ndarray) -> FitScore:
+        """Score a user strength vector against a job weight vector."""
+        wanted = job > 0
+        total = job.sum()
+        matched = wanted & (user >= MATCH_THRESHOLD)
+        partial = wanted & (user >= PARTIAL_THRESHOLD) & ~matched
+        missing = wanted & ~matched & ~partial
+        coverage = 100.0 * (job[matched].sum() + 0.5 * job[partial].sum()) / total if total else 0.0
+
+        # Depth: the job's most important skills the user has, by weight x strength
+        held = np.flatnonzero(wanted & (user > 0))
+        top = held[np.argsort(-(job[held] * user[held]), kind="stable")[:TOP_SKILLS]]
+        depth = 100.0 * np.average(user[top], weights=job[top]) if top.size else 0.0
+        average_strength = float(user[top].mean()) if top.size else 0.0
+
+        # Share of the job's demand per radar axis (the last bucket is "no axis")
+        buckets = len(RADAR_AXES) + 1
+        demand = np.bincount(self.axes, weights=job, minlength=buckets)
+        demand_share = demand / total if total else np.zeros(buckets)
+        demand_share[-1] = 0.0
+
+        # Bonus: relevance of an extra skill is its axis' share of the job's demand
+        extra = np.flatnonzero(~wanted & (user > 0))
+        relevance = demand_share[self.axes[extra]]
+        bonus = 100.0 * min(1.0, float((user[extra] * relevance).sum()) / BONUS_SATURATION)
+
+        # Radar: fit on the job's skills per axis, the user's own profile elsewhere
+        job_fit = np.bincount(self.axes, weights=job * user, minlength=buckets)
+        held_any = user > 0
+        profile = np.bincount(self.axes, weights=user, minlength=buckets)
+        profile_count = np.bincount(self.axes, weights=held_any, minlength=buckets)
+        radar = np.where(
+            demand > 0,
+            np.divide(job_fit, demand, out=np.zeros(buckets), where=demand > 0),
+            np.divide(profile, profile_count, out=np.zeros(buckets), where=profile_count > 0),
+        ) * 100.0
+
+        overall = (
+            self.weights.get("coverage", 0.0) * coverage
+            + self.weights.get("depth", 0.0) * depth
+            + self.weights.get("bonus", 0.0) * bonus
+        )
+        return FitScore(
+            overall=round(float(min(max(overall, 0.0), 100.0)), 2),
+            coverage=round(float(coverage), 2),
+            depth=round(float(depth), 2),
+            bonus=round(bonus, 2),
+            radar={axis: round(float(radar[index]), 2) for index, axis in enumerate(RADAR_AXES)},
+            matched=np.flatnonzero(matched),
+            partial=np.flatnonzero(partial),
+            missing=np.flatnonzero(missing),
+            bonus_skills=extra,
+            bonus_relevance=relevance,
+            top_evaluated=int(top.size),
+            average_evidence_strength=round(average_strength, 4),
+            weights=dict(self.weights),
+            job_weights=job,
+            strengths=user,
+        )
+
+
+    def score_many(self, matrix: JobSkillMatrix, user: np.ndarray) -> BatchFitScore:
+        """Score a user strength vector against every job of a matrix, as score() would."""
+        jobs = matrix.job_ids.size
+        rows, cols, weights = matrix.rows, matrix.indices, matrix.data
+        strengths = user[cols]
+        total = np.bincount(rows, weights=weights, minlength=jobs)
+        per_total = np.divide(1.0, total, out=np.zeros(jobs), where=total > 0)
+
+        # Coverage: the weights times each skill's credit (1 matched, 0.5 partial)
+        credit = np.where(user >= MATCH_THRESHOLD, 1.0, np.where(user >= PARTIAL_THRESHOLD, 0.5, 0.0))
+        coverage = 100.0 * matrix.matvec(credit) * per_total
+        contributions = 100.0 * weights * credit[cols] * per_total[rows]
+        matched = np.bincount(rows, weights=strengths >= MATCH_THRESHOLD, minlength=jobs)
+        partial = np.bincount(rows, weights=(strengths >= PARTIAL_THRESHOLD) & (strengths < MATCH_THRESHOLD), minlength=jobs)
+
+        # Depth: per job, the TOP_SKILLS held skills with the highest weight x strength
+        order = np.lexsort((-(weights * strengths), rows))
+        held = order[strengths[order] > 0]
+        top = held[_rank_in_rows(rows[held]) < TOP_SKILLS]
+        top_weight = np.bincount(rows[top], weights=weights[top], minlength=jobs)
+        depth = 100.0 * np.divide(
+            np.bincount(rows[top], weights=weights[top] * strengths[top], minlength=jobs),
+            top_weight, out=np.zeros(jobs), where=top_weight > 0,
+        )
+
+        # Bonus: the user's strength per radar axis, less what each job already names
+        buckets = len(RADAR_AXES) + 1
+        entry_axes = self.axes[cols]
+        demand_share = np.bincount(rows * buckets + entry_axes, weights=weights, minlength=jobs * buckets)
+        demand_share = demand_share.reshape(jobs, buckets) * per_total[:, None]
+        demand_share[:, -1] = 0.0
+        profile = np.bincount(self.axes, weights=user, minlength=buckets)
+        named = np.bincount(rows, weights=strengths * demand_share[rows, entry_axes], minlength=jobs)
+        relevant = np.maximum(demand_share @ profile - named, 0.0)
+        bonus = 100.0 * np.minimum(1.0, relevant / BONUS_SATURATION)
+
+        overall = (
+            self.weights.get("coverage", 0.0) * coverage
+            + self.weights.get("depth", 0.0) * depth
+            + self.weights.get("bonus", 0.0) * bonus
+        )
+        gap_order = np.lexsort((-strengths, -weights, rows))
+        return BatchFitScore(
+            job_ids=matrix.job_ids,
+            overall=np.clip(overall, 0.0, 100.0).round(2),
+            coverage=coverage.round(2),
+            depth=depth.round(2),
+            bonus=bonus.round(2),
+            matched=matched.astype(int),
+            partial=partial.astype(int),
+            missing=(np.diff(matrix.indptr) - matched - partial).astype(int),
+            top_strengths=[
+                cols[entries].tolist()
+                for entries in _first_per_row(order[strengths[order] >= MATCH_THRESHOLD], rows, jobs, 3)
+            ],
+            top_gaps=[
+                cols[entries].tolist()
+                for entries in _first_per_row(gap_order[strengths[gap_order] < MATCH_THRESHOLD], rows, jobs, 3)
+            ],
+            contributions=contributions,
+            matrix=matrix,
+        )
+
+
+class FitScoringEngine:
+    """
+    Builds AnalysisJsonDetail for a user and a job.
+
+    Keeps one FitScorer for the current skill catalog snapshot and builds a
+    new one when the catalog swaps in another snapshot.
+    """
+
+    def __init__(self, catalog: Optional[SkillCatalog] = None, weights: Optional[dict[str, float]] = None):
+        self.catalog = catalog or skill_catalog
+        self.weights = weights
+        self._scorer: Optional[FitScorer] = None
+
+    @property
+    def scorer(self) -> FitScorer:
+        snapshot = self.catalog.snapshot
+        scorer = self._scorer
+        if scorer is None or scorer.snapshot is not snapshot:
+            scorer = self._scorer = FitScorer(snapshot, self.weights)
+        return scorer
+
+    async def analyze(self, db: AsyncSession, user_id: int, job_id: int, resume_id: Optional[int] = None):
+        """AnalysisJsonDetail of a user against a stored, processed job."""
+        job = (await db.execute(
+            select(JOBS_TABLE.c.id, JOBS_TABLE.c.title, JOBS_TABLE.c.company).where(JOBS_TABLE.c.id == job_id)
+        )).mappings().one()
+        job_skills = (await db.execute(
+            select(JOB_SKILLS_TABLE.c.skill_id, JOB_SKILLS_TABLE.c.importance)
+            .where(JOB_SKILLS_TABLE.c.job_id == job_id)
+        )).all()
+        user_skills = await load_user_skills(db, user_id)
+
+        scorer = self.scorer
+        score = scorer.score(
+            scorer.job_vector(job_skills),
+            scorer.user_vector((skill_id, row["strength"]) for skill_id, row in user_skills.items()),
+        )
+        return self.json_detail(score, dict(job), user_skills, resume_id)
+
+    def json_detail(self, score: FitScore, job: dict, user_skills: dict[int, dict], resume_id: Optional[int] = None):
+        """
+        Assemble AnalysisJsonDetail from a score.
+
+        Args:
+            score: FitScorer.score() of the job
+            job: id, title and company of the job
+            user_skills: user_skills rows by skill id, for years and evidence
+        """
+        from app.schemas.analysis import (
+            AnalysisJsonDetail, BonusSkillItem, EvidenceItem, GapRoadmapItem, RadarScores,
+            ScoreBreakdown, SkillTableRow,
+        )
+
+        records = self.scorer.snapshot.records
+        weights, strengths = score.job_weights, score.strengths
+
+        def name(index: int) -> str:
+            return records[index].display_name or records[index].canonical_name
+
+        # Job skills by importance, then strength
+        wanted = np.concatenate((score.matched, score.partial, score.missing))
+        wanted = wanted[np.lexsort((-strengths[wanted], -weights[wanted]))]
+        gaps = [index for index in wanted if strengths[index] < MATCH_THRESHOLD]
+        strengths_order = [
+            index for index in wanted[np.argsort(-(weights[wanted] * strengths[wanted]), kind="stable")]
+            if strengths[index] >= MATCH_THRESHOLD
+        ]
+
+        skills_table = []
+        for index in wanted:
+            row = user_skills.get(records[index].id) or {}
+            skills_table.append(SkillTableRow(
+                skill_id=records[index].id,
+                skill_name=name(index),
+                category=records[index].category,
+                required=bool(weights[index] >= IMPORTANCE_RANK["REQUIRED"]),
+                strength=float(strengths[index]),
+                user_years=row.get("years_experience"),
+                evidence=[
+                    EvidenceItem(
+                        source=str(item.get("source", "")),
+                        text=str(item.get("text", "")),
+                        context=item.get("context"),
+                        repo_name=item.get("repo") or item.get("repo_name"),
+                        similarity_score=min(max(float(item.get("similarity") or 0.0), 0.0), 1.0),
+                    )
+                    for item in row.get("evidence") or []
+                ],
+                best_evidence_preview=(row.get("best_evidence_text") or "")[:200] or None,
+            ))
+
+        bonus_order = np.argsort(-(strengths[score.bonus_skills] * score.bonus_relevance), kind="stable")
+        bonus_skills = []
+        for position in bonus_order:
+            index, relevance = score.bonus_skills[position], score.bonus_relevance[position]
+            axis = CATEGORY_AXES.get(records[index].category)
+            bonus_skills.append(BonusSkillItem(
+                skill_id=records[index].id,
+                skill_name=name(index),
+                category=records[index].category,
+                strength=float(strengths[index]),
+                relavance_note=(
+                    f"{axis} skills are {relevance:.0%} of this job's skill weight" if relevance > 0
+                    else "Not used in this role"
+                ),
+            ))
+
+        top_strengths = [name(index) for index in strengths_order[:3]]
+        top_gaps = [name(index) for index in gaps[:3]]
+        title = job["title"] + (f" at {job['company']}" if job.get("company") else "")
+        return AnalysisJsonDetail(
+            overall_score=score.overall,
+            coverage_score=score.coverage,
+            depth_score=score.depth,
+            bonus_score=score.bonus,
+            radar=RadarScores(**score.radar),
+            skills_table=skills_table,
+            score_breakdown=ScoreBreakdown(**score.breakdown()),
+            gaps=[
+                GapRoadmapItem(
+                    skill_id=records[index].id,
+                    skill_name=name(index),
+                    category=records[index].category,
+                    importance=int(weights[index]),
+                    current_strength=float(strengths[index]),
+                    target_strength=MATCH_THRESHOLD,
+                    why_it_matters=f"{name(index)} is {IMPORTANCE_LABELS[int(weights[index])]} for {title}.",
+                    resources=[],
+                    project_idea=f"A small project built around {name(index)}",
+                )
+                for index in gaps
+            ],
+            bonus_skills=bonus_skills,
+            top_strengths=top_strengths,
+            top_gaps=top_gaps,
+            file_summary=(
+                f"{score.overall:.0f}/100 fit for {title}: {score.matched.size} of {wanted.size} "
+                f"job skills matched, {score.partial.size} partially."
+            ),
+            strength_narrative=(
+                f"Strongest matches: {', '.join(top_strengths)}." if top_strengths
+                else "None of this job's skills is matched yet."
+            ),
+            gaps_narrative=(
+                f"Closing {', '.join(top_gaps)} would raise coverage the most." if top_gaps
+                else "No skill gaps for this job."
+            ),
+            job_id=job["id"],
+            job_title=job["title"],
+            company=job.get("company"),
+            resume_id=resume_id,
+            analyzed_at=datetime.now(timezone.utc),
+            model_version=SCORING_VERSION,
+        )
+
+
+async def load_user_skills(db: AsyncSession, user_id: int) -> dict[int, dict]:
+    """user_skills rows of a user by skill id."""
+    result = await db.execute(select(USER_SKILLS_TABLE).where(USER_SKILLS_TABLE.c.user_id == user_id))
+    return {row["skill_id"]: dict(row) for row in result.mappings()}
+
+
+# Singleton instance
+fit_scoring_engine = FitScoringEngine()
@@ -0,0 +1,79 @@
+"""
+ETag cache for GitHub REST API responses.
+
+Stores the ETag/Last-Modified and the decoded payload of each GitHub endpoint
+GitHubClient reads (repository metadata, languages, README), keyed on the
+request URL. GitHubClient sends the validators back as If-None-Match/
+If-Modified-Since; a 304 reuses the stored payload, and GitHub does not count
+it against the rate limit when the request is authenticated.
+
+Storage, expiry and eviction are those of the URL ingestion cache, in the
+directory or Redis chosen with Settings.github_cache_backend.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.services.url_cache import URLCacheStats, URLResponseCache
+
+settings = get_settings()
+
+
+@dataclass
+class CachedResponse:
+    """Validators and decoded payload of one GitHub API response."""
+    url: str
+    payload: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_length: int
+    stored_at: float
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class GitHubCacheStats(URLCacheStats):
+    """URL cache counters plus the 304s that did not use up rate limit."""
+    rate_limit_saved: int = 0
+
+
+class GitHubResponseCache(URLResponseCache):
+    """Conditional-GET cache for GitHub API responses, on disk or in Redis."""
+
+    KEY_PREFIX = "jobfit:githubcache:"
+    ENTRY_TYPE = CachedResponse
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        directory: Optional[Path] = None,
+        ttl_seconds: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        redis_url: Optional[str] = None,
+    ):
+        super().__init__(
+            backend=backend or settings.github_cache_backend,
+            directory=directory or settings.github_cache_dir,
+            ttl_seconds=ttl_seconds or settings.github_cache_ttl_seconds,
+            max_bytes=max_bytes or settings.github_cache_max_bytes,
+            redis_url=redis_url,
+        )
+        self.stats = GitHubCacheStats()
+
+    def record_hit(self, page: CachedResponse, authenticated: bool = False) -> None:
+        """A 304 was answered from this response; authenticated 304s are free of rate limit."""
+        super().record_hit(page)
+        if authenticated:
+            self.stats.rate_limit_saved += 1
+
+
+# Singleton instance
+github_response_cache = GitHubResponseCache()
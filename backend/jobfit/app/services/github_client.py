@@ -2,16 +2,22 @@
 GitHub API client for fetching repository information.
 """
 import re
+import asyncio
 import base64
+import copy
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from urllib.parse import urlparse
 
 import httpx
 
 from app.core.config import get_settings
+from app.core.http_client import SharedHTTPClient, http_client
+from app.services.github_cache import CachedResponse, GitHubResponseCache, github_response_cache
+from app.services.github_rate_limit import GitHubRateLimited, GitHubRateLimiter
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -50,14 +56,54 @@ class GitHubRepo:
     
     # Errors during fetch
     errors: list[str] = field(default_factory=list)
+    
+    # Metadata, languages and README all answered 304 from the ETag cache
+    not_modified: bool = False
 
 
 class GitHubClient:
     """
     Async client for GitHub API.
+    
+    Requests go through the shared pooled HTTP client, which also caps how
+    many run against api.github.com at once.
     """
     
-    BASE_URL = "https://api.github.com"
+    # Seconds per GitHub API request
+    TIMEOUT = 30.0
+    
+    # Times a request rejected for rate limit is sent again on another token or after the reset
+    RATE_LIMIT_RETRIES = 2
+    
+    # README text kept per repository
+    README_MAX_CHARS = 10000
+    
+    # README paths tried by the GraphQL query, first existing one wins
+    README_PATHS = ("README.md", "readme.md", "Readme.md", "README.rst", "README.txt", "README")
+    
+    # Repository fields for the GraphQL fetch, the same data as the three REST calls
+    GRAPHQL_FRAGMENT = """
+fragment RepoFields on Repository {
+  databaseId
+  name
+  nameWithOwner
+  description
+  url
+  stargazerCount
+  forkCount
+  isFork
+  isPrivate
+  primaryLanguage { name }
+  languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  createdAt
+  updatedAt
+  pushedAt
+%s
+}""" % "\n".join(
+        f'  readme{i}: object(expression: "HEAD:{path}") {{ ... on Blob {{ text }} }}'
+        for i, path in enumerate(README_PATHS)
+    )
     
     # Repo URL patterns
     GITHUB_URL_PATTERN = re.compile(
@@ -65,20 +111,65 @@ class GitHubClient:
         re.I
     )
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        http: Optional[SharedHTTPClient] = None,
+        max_concurrency: Optional[int] = None,
+        use_graphql: Optional[bool] = None,
+        graphql_batch_size: Optional[int] = None,
+        cache: Optional[GitHubResponseCache] = None,
+        tokens: Optional[list[str]] = None,
+        max_rate_limit_wait: Optional[float] = None,
+    ):
         """
         Initialize GitHub client.
         
         Args:
             token: Optional personal access token for higher rate limits
+            base_url: API root, settings.github_api_base by default
+            http: Shared HTTP client to send requests through
+            max_concurrency: Repos (or GraphQL batches) fetch_multiple_repos fetches at once
+            use_graphql: Batch fetch_multiple_repos through GraphQL when a token is set
+            graphql_batch_size: Repos per GraphQL query
+            cache: ETag cache for REST responses, None to always download
+            tokens: More tokens to rotate through with token, settings.github_token_pool by default
+            max_rate_limit_wait: Seconds a request may queue for a rate limit reset before failing
         """
         self.token = token or settings.github_api_token
+        self.base_url = (base_url or settings.github_api_base).rstrip('/')
+        self.http = http or http_client
+        self.max_concurrency = max_concurrency or settings.github_fetch_concurrency
+        self.use_graphql = settings.github_use_graphql if use_graphql is None else use_graphql
+        self.graphql_batch_size = graphql_batch_size or settings.github_graphql_batch_size
+        self.cache = cache
+        self.rate_limiter = GitHubRateLimiter(
+            [self.token, *(settings.github_token_pool if tokens is None else tokens)],
+            max_wait_seconds=(
+                settings.github_rate_limit_max_wait_seconds if max_rate_limit_wait is None else max_rate_limit_wait
+            ),
+        )
+        # Authorization is added per request, from the token the rate limiter picks
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "JobFit-Copilot/1.0",
         }
-        if self.token:
-            self.headers["Authorization"] = f"Bearer {self.token}"
+    
+    def for_token(self, token: Optional[str]) -> "GitHubClient":
+        """
+        A client sending every request with this token alone, e.g. a user's OAuth token.
+
+        It shares this client's HTTP client and cache but has a pool of its
+        own, so the token is never used for anyone else's requests. Without
+        a token this client is returned.
+        """
+        if not token:
+            return self
+        client = copy.copy(self)
+        client.token = token
+        client.rate_limiter = GitHubRateLimiter([token], max_wait_seconds=self.rate_limiter.max_wait_seconds)
+        return client
     
     @classmethod
     def parse_repo_url(cls, url: str) -> Optional[tuple[str, str]]:
@@ -101,61 +192,54 @@ class GitHubClient:
     async def fetch_repo(self, owner: str, repo: str) -> GitHubRepo:
         """
         Fetch repository information.
+        
+        Languages and README are requested together once the metadata
+        request has confirmed the repository exists. With a cache, each
+        request is conditional, and not_modified is set on the result when
+        all three came back 304.
         """
         errors = []
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        try:
             # Fetch repo metadata
-            repo_data = await self._fetch_repo_metadata(client, owner, repo)
+            repo_data, metadata_not_modified = await self._fetch_repo_metadata(owner, repo)
             if not repo_data:
-                return GitHubRepo(
-                    repo_id=0,
-                    full_name=f"{owner}/{repo}",
-                    name=repo,
-                    description=None,
-                    url=f"https://github.com/{owner}/{repo}",
-                    stars_count=0,
-                    forks_count=0,
-                    watchers_count=0,
-                    languages={},
-                    primary_language=None,
-                    is_fork=False,
-                    is_private=True,
-                    topics=[],
-                    errors=["Repository not found or not accessible"],
-                )
-            
-            # Fetch languages
-            languages = await self._fetch_languages(client, owner, repo)
+                return self._not_found_repo(owner, repo)
             
-            # Fetch README
-            readme_content = await self._fetch_readme(client, owner, repo)
-            
-            # Parse timestamps
-            created_at = self._parse_timestamp(repo_data.get('created_at'))
-            updated_at = self._parse_timestamp(repo_data.get('updated_at'))
-            pushed_at = self._parse_timestamp(repo_data.get('pushed_at'))
-            
-            return GitHubRepo(
-                repo_id=repo_data.get('id', 0),
-                full_name=repo_data.get('full_name', f"{owner}/{repo}"),
-                name=repo_data.get('name', repo),
-                description=repo_data.get('description'),
-                url=repo_data.get('html_url', f"https://github.com/{owner}/{repo}"),
-                stars_count=repo_data.get('stargazers_count', 0),
-                forks_count=repo_data.get('forks_count', 0),
-                watchers_count=repo_data.get('watchers_count', 0),
-                languages=languages,
-                primary_language=repo_data.get('language'),
-                is_fork=repo_data.get('fork', False),
-                is_private=repo_data.get('private', False),
-                topics=repo_data.get('topics', []),
-                readme_content=readme_content,
-                created_at=created_at,
-                updated_at=updated_at,
-                pushed_at=pushed_at,
-                errors=errors,
+            # Fetch languages and README in parallel
+            (languages, languages_not_modified), (readme_content, readme_not_modified) = await asyncio.gather(
+                self._fetch_languages(owner, repo),
+                self._fetch_readme(owner, repo),
             )
+        except GitHubRateLimited as e:
+            return self._error_repo(f"https://github.com/{owner}/{repo}", repo, str(e))
+        
+        # Parse timestamps
+        created_at = self._parse_timestamp(repo_data.get('created_at'))
+        updated_at = self._parse_timestamp(repo_data.get('updated_at'))
+        pushed_at = self._parse_timestamp(repo_data.get('pushed_at'))
+        
+        return GitHubRepo(
+            repo_id=repo_data.get('id', 0),
+            full_name=repo_data.get('full_name', f"{owner}/{repo}"),
+            name=repo_data.get('name', repo),
+            description=repo_data.get('description'),
+            url=repo_data.get('html_url', f"https://github.com/{owner}/{repo}"),
+            stars_count=repo_data.get('stargazers_count', 0),
+            forks_count=repo_data.get('forks_count', 0),
+            watchers_count=repo_data.get('watchers_count', 0),
+            languages=languages,
+            primary_language=repo_data.get('language'),
+            is_fork=repo_data.get('fork', False),
+            is_private=repo_data.get('private', False),
+            topics=repo_data.get('topics', []),
+            readme_content=readme_content,
+            created_at=created_at,
+            updated_at=updated_at,
+            pushed_at=pushed_at,
+            errors=errors,
+            not_modified=metadata_not_modified and languages_not_modified and readme_not_modified,
+        )
     
     async def fetch_repo_from_url(self, url: str) -> Optional[GitHubRepo]:
         """
@@ -171,128 +255,325 @@ class GitHubClient:
     async def fetch_multiple_repos(self, urls: list[str]) -> list[GitHubRepo]:
         """
         Fetch multiple repositories.
+        
+        With a token, repos are fetched graphql_batch_size at a time with one
+        GraphQL query per batch; GraphQL requires authentication, so without a
+        token each repo takes three REST calls. Results are in the order of urls.
         """
-        results = []
+        if self.use_graphql and self.rate_limiter.authenticated:
+            return await self._fetch_multiple_graphql(urls)
+        return await self._fetch_multiple_rest(urls)
+    
+    async def _fetch_multiple_rest(self, urls: list[str]) -> list[GitHubRepo]:
+        """Fetch repositories over REST, max_concurrency repos at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        for url in urls:
-            try:
-                repo = await self.fetch_repo_from_url(url)
-                if repo:
-                    results.append(repo)
-                else:
-                    # Create error result for invalid URL
-                    results.append(GitHubRepo(
-                        repo_id=0,
-                        full_name=url,
-                        name="invalid",
-                        description=None,
-                        url=url,
-                        stars_count=0,
-                        forks_count=0,
-                        watchers_count=0,
-                        languages={},
-                        primary_language=None,
-                        is_fork=False,
-                        is_private=False,
-                        topics=[],
-                        errors=[f"Invalid GitHub URL: {url}"],
-                    ))
-            except Exception as e:
-                logger.error(f"Error fetching {url}: {e}")
-                results.append(GitHubRepo(
-                    repo_id=0,
-                    full_name=url,
-                    name="error",
-                    description=None,
-                    url=url,
-                    stars_count=0,
-                    forks_count=0,
-                    watchers_count=0,
-                    languages={},
-                    primary_language=None,
-                    is_fork=False,
-                    is_private=False,
-                    topics=[],
-                    errors=[f"Fetch error: {str(e)}"],
-                ))
+        async def fetch(url: str) -> GitHubRepo:
+            async with semaphore:
+                return await self._fetch_one(url)
         
+        return list(await asyncio.gather(*(fetch(url) for url in urls)))
+    
+    async def _fetch_one(self, url: str) -> GitHubRepo:
+        """Fetch one repository, turning an invalid URL or failure into an error result."""
+        try:
+            repo = await self.fetch_repo_from_url(url)
+            if repo:
+                return repo
+            # Create error result for invalid URL
+            return self._error_repo(url, "invalid", f"Invalid GitHub URL: {url}")
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return self._error_repo(url, "error", f"Fetch error: {str(e)}")
+    
+    async def _fetch_multiple_graphql(self, urls: list[str]) -> list[GitHubRepo]:
+        """
+        Fetch repositories in GraphQL batches, max_concurrency batches at a time.
+        
+        A batch whose query fails (HTTP error, rate limit, no data) is fetched
+        over REST instead.
+        """
+        results: list[Optional[GitHubRepo]] = [None] * len(urls)
+        targets = []
+        for index, url in enumerate(urls):
+            parsed = self.parse_repo_url(url)
+            if parsed:
+                targets.append((index, *parsed))
+            else:
+                results[index] = self._error_repo(url, "invalid", f"Invalid GitHub URL: {url}")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(batch: list[tuple[int, str, str]]) -> None:
+            async with semaphore:
+                repos = await self._fetch_batch_graphql([(owner, repo) for _, owner, repo in batch])
+            if repos is None:
+                repos = await self._fetch_multiple_rest([urls[index] for index, _, _ in batch])
+            for (index, _, _), repo in zip(batch, repos):
+                results[index] = repo
+        
+        size = self.graphql_batch_size
+        await asyncio.gather(*(fetch(targets[i:i + size]) for i in range(0, len(targets), size)))
         return results
     
-    async def _fetch_repo_metadata(
-        self, client: httpx.AsyncClient, owner: str, repo: str
-    ) -> Optional[dict]:
-        """Fetch repository metadata."""
+    async def _fetch_batch_graphql(self, repos: list[tuple[str, str]]) -> Optional[list[GitHubRepo]]:
+        """
+        Fetch up to graphql_batch_size repositories with one aliased GraphQL query.
+        
+        Returns None if the query failed as a whole.
+        """
+        declarations = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(len(repos)))
+        selections = "\n".join(
+            f"  repo{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...RepoFields }}"
+            for i in range(len(repos))
+        )
+        variables = {}
+        for i, (owner, repo) in enumerate(repos):
+            variables[f"owner{i}"] = owner
+            variables[f"name{i}"] = repo
+        
         try:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{owner}/{repo}",
-                headers=self.headers,
+            response = await self._send(
+                "POST",
+                f"{self.base_url}/graphql",
+                resource="graphql",
+                json={
+                    "query": f"query({declarations}) {{\n{selections}\n}}\n{self.GRAPHQL_FRAGMENT}",
+                    "variables": variables,
+                },
             )
+            payload = response.json() if response.status_code == 200 else {}
+        except Exception as e:
+            logger.error(f"GitHub GraphQL request failed: {e}")
+            return None
+        
+        data = payload.get("data")
+        if not data:
+            errors = payload.get("errors") or f"HTTP {response.status_code}"
+            logger.error(f"GitHub GraphQL query failed, falling back to REST: {errors}")
+            return None
+        
+        results = []
+        for i, (owner, repo) in enumerate(repos):
+            node = data.get(f"repo{i}")
+            if node:
+                results.append(self._repo_from_graphql(node))
+            else:
+                # Missing or inaccessible repositories come back as null
+                logger.warning(f"Repository not found: {owner}/{repo}")
+                results.append(self._not_found_repo(owner, repo))
+        return results
+    
+    def _repo_from_graphql(self, node: dict) -> GitHubRepo:
+        readme = next(
+            (blob["text"] for i in range(len(self.README_PATHS))
+             if (blob := node.get(f"readme{i}")) and blob.get("text") is not None),
+            None,
+        )
+        return GitHubRepo(
+            repo_id=node.get('databaseId') or 0,
+            full_name=node['nameWithOwner'],
+            name=node['name'],
+            description=node.get('description'),
+            url=node['url'],
+            stars_count=node.get('stargazerCount', 0),
+            forks_count=node.get('forkCount', 0),
+            # REST's watchers_count is the star count as well
+            watchers_count=node.get('stargazerCount', 0),
+            languages={
+                edge['node']['name']: edge['size']
+                for edge in (node.get('languages') or {}).get('edges', [])
+            },
+            primary_language=(node.get('primaryLanguage') or {}).get('name'),
+            is_fork=node.get('isFork', False),
+            is_private=node.get('isPrivate', False),
+            topics=[
+                topic['topic']['name']
+                for topic in (node.get('repositoryTopics') or {}).get('nodes', [])
+            ],
+            readme_content=self._clip_readme(readme) if readme is not None else None,
+            created_at=self._parse_timestamp(node.get('createdAt')),
+            updated_at=self._parse_timestamp(node.get('updatedAt')),
+            pushed_at=self._parse_timestamp(node.get('pushedAt')),
+        )
+    
+    @staticmethod
+    def _error_repo(url: str, name: str, error: str) -> GitHubRepo:
+        return GitHubRepo(
+            repo_id=0,
+            full_name=url,
+            name=name,
+            description=None,
+            url=url,
+            stars_count=0,
+            forks_count=0,
+            watchers_count=0,
+            languages={},
+            primary_language=None,
+            is_fork=False,
+            is_private=False,
+            topics=[],
+            errors=[error],
+        )
+    
+    @staticmethod
+    def _not_found_repo(owner: str, repo: str) -> GitHubRepo:
+        return GitHubRepo(
+            repo_id=0,
+            full_name=f"{owner}/{repo}",
+            name=repo,
+            description=None,
+            url=f"https://github.com/{owner}/{repo}",
+            stars_count=0,
+            forks_count=0,
+            watchers_count=0,
+            languages={},
+            primary_language=None,
+            is_fork=False,
+            is_private=True,
+            topics=[],
+            errors=["Repository not found or not accessible"],
+        )
+    
+    @classmethod
+    def _clip_readme(cls, text: str) -> str:
+        if len(text) > cls.README_MAX_CHARS:
+            return text[:cls.README_MAX_CHARS] + "\n\n[README truncated...]"
+        return text
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        resource: str = "core",
+        headers: Optional[dict] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send a request on the pool token with the most budget left.
+        
+        Waits while the whole pool is spent (GitHubRateLimited if longer than
+        the rate limiter allows) and sends a request rejected for rate limit
+        again, on another token or after the reset.
+        """
+        for _ in range(self.RATE_LIMIT_RETRIES + 1):
+            budget = await self.rate_limiter.acquire(resource)
+            response = None
+            try:
+                request_headers = {**self.headers, **(headers or {})}
+                if budget.token:
+                    request_headers["Authorization"] = f"Bearer {budget.token}"
+                response = await self.http.request(
+                    method, url, headers=request_headers, timeout=self.TIMEOUT, **kwargs
+                )
+            finally:
+                rejected = self.rate_limiter.release(budget, response)
+            if not rejected:
+                break
+        return response
+    
+    async def _conditional_get(self, url: str, parse=None) -> tuple[int, Any, bool]:
+        """
+        GET a REST endpoint, revalidating the cached response if there is one.
+        
+        parse maps the JSON body to the value returned and cached. Returns
+        (status, value, not_modified); a 304 comes back as status 200 with
+        the cached value and not_modified set.
+        """
+        cached = await self.cache.get(url) if self.cache else None
+        response = await self._send("GET", url, headers=cached.conditional_headers() if cached else None)
+        
+        if cached and response.status_code == 304:
+            self.cache.record_hit(cached, authenticated=self.rate_limiter.authenticated)
+            return 200, cached.payload, True
+        if self.cache:
+            self.cache.record_miss()
+        if response.status_code != 200:
+            return response.status_code, None, False
+        
+        value = parse(response.json()) if parse else response.json()
+        if self.cache:
+            await self.cache.set(CachedResponse(
+                url=url,
+                payload=value,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                content_length=len(response.content),
+                stored_at=time.time(),
+            ))
+        return 200, value, False
+    
+    async def _fetch_repo_metadata(self, owner: str, repo: str) -> tuple[Optional[dict], bool]:
+        """Fetch repository metadata, and whether it is unchanged since the cached copy."""
+        try:
+            status, data, not_modified = await self._conditional_get(f"{self.base_url}/repos/{owner}/{repo}")
             
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
+            if status == 200:
+                return data, not_modified
+            elif status == 404:
                 logger.warning(f"Repository not found: {owner}/{repo}")
-                return None
-            elif response.status_code == 403:
-                logger.error(f"GitHub API rate limit exceeded")
-                return None
+                return None, False
+            elif status == 403:
+                logger.error(f"GitHub API access denied for {owner}/{repo}")
+                return None, False
             else:
-                logger.error(f"GitHub API error: {response.status_code}")
-                return None
+                logger.error(f"GitHub API error: {status}")
+                return None, False
                 
+        except GitHubRateLimited:
+            raise
         except Exception as e:
             logger.error(f"Error fetching repo metadata: {e}")
-            return None
+            return None, False
     
-    async def _fetch_languages(
-        self, client: httpx.AsyncClient, owner: str, repo: str
-    ) -> dict[str, int]:
+    async def _fetch_languages(self, owner: str, repo: str) -> tuple[dict[str, int], bool]:
         """Fetch repository languages."""
         try:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{owner}/{repo}/languages",
-                headers=self.headers,
+            status, languages, not_modified = await self._conditional_get(
+                f"{self.base_url}/repos/{owner}/{repo}/languages"
             )
             
-            if response.status_code == 200:
-                return response.json()
-            return {}
+            if status == 200:
+                return languages, not_modified
+            return {}, False
             
+        except GitHubRateLimited:
+            raise
         except Exception as e:
             logger.error(f"Error fetching languages: {e}")
-            return {}
+            return {}, False
     
-    async def _fetch_readme(
-        self, client: httpx.AsyncClient, owner: str, repo: str
-    ) -> Optional[str]:
-        """Fetch repository README content."""
+    async def _fetch_readme(self, owner: str, repo: str) -> tuple[Optional[str], bool]:
+        """Fetch repository README content, cached decoded and clipped."""
         try:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{owner}/{repo}/readme",
-                headers=self.headers,
+            status, readme, not_modified = await self._conditional_get(
+                f"{self.base_url}/repos/{owner}/{repo}/readme",
+                parse=self._decode_readme,
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                content = data.get('content', '')
-                encoding = data.get('encoding', 'base64')
-                
-                if encoding == 'base64' and content:
-                    try:
-                        decoded = base64.b64decode(content).decode('utf-8')
-                        # Truncate if too long
-                        if len(decoded) > 10000:
-                            decoded = decoded[:10000] + "\n\n[README truncated...]"
-                        return decoded
-                    except Exception:
-                        return None
-                return content
-            
-            return None
+            if status == 200:
+                return readme, not_modified
+            return None, False
             
+        except GitHubRateLimited:
+            raise
         except Exception as e:
             logger.error(f"Error fetching README: {e}")
-            return None
+            return None, False
+    
+    @classmethod
+    def _decode_readme(cls, data: dict) -> Optional[str]:
+        content = data.get('content', '')
+        encoding = data.get('encoding', 'base64')
+        
+        if encoding == 'base64' and content:
+            try:
+                decoded = base64.b64decode(content).decode('utf-8')
+                # Truncate if too long
+                return cls._clip_readme(decoded)
+            except Exception:
+                return None
+        return content
     
     @staticmethod
     def _parse_timestamp(ts: Optional[str]) -> Optional[datetime]:
@@ -304,26 +585,48 @@ class GitHubClient:
         except Exception:
             return None
     
-    async def check_rate_limit(self) -> dict:
-        """Check current rate limit status."""
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/rate_limit",
-                headers=self.headers,
+    async def check_rate_limit(self, requests: int = 1) -> dict:
+        """
+        Check current rate limit status of the token pool.
+        
+        Every pool token's core budget is read from /rate_limit, which is not
+        itself rate limited, and added up. predicted_wait_seconds is how long
+        `requests` more REST calls would queue for a reset.
+        """
+        tokens = self.rate_limiter.tokens or [None]
+        
+        async def read(token: Optional[str]) -> Optional[dict]:
+            headers = {**self.headers, "Authorization": f"Bearer {token}"} if token else self.headers
+            try:
+                response = await self.http.get(f"{self.base_url}/rate_limit", headers=headers, timeout=10.0)
+            except Exception as e:
+                logger.error(f"Error checking GitHub rate limit: {e}")
+                return None
+            if response.status_code == 401 and token:
+                self.rate_limiter.remove_token(token)
+                logger.warning(f"GitHub rejected token ...{token[-4:]} (401), removed it from the pool")
+                return None
+            if response.status_code != 200:
+                return None
+            core = response.json().get('resources', {}).get('core', {})
+            self.rate_limiter.observe(
+                token, "core", core.get('limit', 0), core.get('remaining', 0), float(core.get('reset', 0))
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                core = data.get('resources', {}).get('core', {})
-                return {
-                    "limit": core.get('limit', 0),
-                    "remaining": core.get('remaining', 0),
-                    "reset_at": datetime.fromtimestamp(core.get('reset', 0)),
-                    "authenticated": self.token is not None,
-                }
-            
+            return core
+        
+        budgets = [core for core in await asyncio.gather(*(read(token) for token in tokens)) if core]
+        if not budgets:
             return {"error": "Unable to fetch rate limit"}
+        
+        return {
+            "limit": sum(core.get('limit', 0) for core in budgets),
+            "remaining": sum(core.get('remaining', 0) for core in budgets),
+            "reset_at": datetime.fromtimestamp(min(core.get('reset', 0) for core in budgets)),
+            "authenticated": self.rate_limiter.authenticated,
+            "tokens": len(budgets),
+            "predicted_wait_seconds": round(self.rate_limiter.predicted_wait("core", requests), 1),
+        }
 
 
 # Singleton instance for use without explicit initialization
-github_client = GitHubClient()
\ No newline at end of file
+github_client = GitHubClient(cache=github_response_cache if settings.github_cache_enabled else None)
\ No newline at end of file
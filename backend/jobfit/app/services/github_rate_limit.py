@@ -0,0 +1,246 @@
+"""
+Rate-limit-aware token pool for GitHubClient.
+
+GitHub meters each token separately, per resource ("core" for REST,
+"graphql" for GraphQL), and reports the budget on every response in the
+X-RateLimit-Limit/-Remaining/-Reset/-Resource headers. GitHubRateLimiter
+keeps that budget per (token, resource), hands each request the token with
+the most calls left, and queues requests until the earliest reset when the
+whole pool is spent instead of letting them fail. Secondary limits
+(Retry-After on a 403/429) pause the token for the time GitHub asks for,
+and a token GitHub no longer accepts (401) leaves the pool.
+
+A pool serves every request of the client that owns it, so it only holds
+the server's own tokens; a user's OAuth token gets a client of its own
+(GitHubClient.for_token).
+"""
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubRateLimited(Exception):
+    """The token pool is spent for longer than the caller is willing to wait."""
+
+    def __init__(self, resource: str, retry_at: float):
+        self.resource = resource
+        self.retry_at = retry_at
+        super().__init__(
+            f"GitHub API rate limit exceeded, {resource} budget resets in {max(0, int(retry_at - time.time()))}s"
+        )
+
+
+@dataclass
+class TokenBudget:
+    """What GitHub last reported for one token and resource."""
+    token: Optional[str]  # None for unauthenticated requests
+    resource: str
+    limit: int
+    remaining: int
+    reset_at: float = 0.0  # epoch seconds, 0 until GitHub has reported it
+    in_flight: int = 0
+
+    @property
+    def available(self) -> int:
+        return self.remaining - self.in_flight
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters since the process started."""
+    requests: int = 0
+    queued: int = 0  # requests that had to wait for a reset
+    waited_seconds: float = 0.0
+    rate_limited: int = 0  # 403/429 answers for an exhausted budget, retried
+    revoked: int = 0  # tokens dropped after a 401
+
+
+class GitHubRateLimiter:
+    """
+    Pool of GitHub tokens with per-token budgets.
+
+    Budgets start from GitHub's documented hourly limits and follow the
+    response headers from the first answer on. Requests in flight count
+    against the budget they were given, so concurrent fetches do not all
+    pick the same nearly spent token.
+    """
+
+    # Hourly limits before a response has reported the real ones
+    DEFAULT_LIMITS = {"core": 5000, "graphql": 5000}
+    UNAUTHENTICATED_LIMIT = 60
+
+    # Length of a rate limit window, for budgets whose reset GitHub has not reported yet
+    WINDOW_SECONDS = 3600.0
+
+    def __init__(self, tokens: Optional[list[Optional[str]]] = None, max_wait_seconds: float = 60.0):
+        self.max_wait_seconds = max_wait_seconds
+        self.tokens: list[str] = []
+        self.stats = RateLimiterStats()
+        self._budgets: dict[tuple[Optional[str], str], TokenBudget] = {}
+        for token in tokens or []:
+            self.add_token(token)
+
+    @property
+    def authenticated(self) -> bool:
+        return bool(self.tokens)
+
+    def add_token(self, token: Optional[str]) -> None:
+        """Add a token to the pool; duplicates and blanks are ignored."""
+        if token and token not in self.tokens:
+            self.tokens.append(token)
+
+    def remove_token(self, token: str) -> None:
+        """Drop a token and its budgets from the pool."""
+        if token in self.tokens:
+            self.tokens.remove(token)
+        for key in [key for key in self._budgets if key[0] == token]:
+            del self._budgets[key]
+
+    def budgets(self, resource: str = "core") -> list[TokenBudget]:
+        """Budgets of every pool token for a resource, the unauthenticated one if the pool is empty."""
+        budgets = []
+        for token in self.tokens or [None]:
+            budget = self._budgets.get((token, resource))
+            if budget is None:
+                limit = self.DEFAULT_LIMITS.get(resource, 5000) if token else self.UNAUTHENTICATED_LIMIT
+                budget = self._budgets[(token, resource)] = TokenBudget(token, resource, limit, limit)
+            budgets.append(budget)
+        return budgets
+
+    async def acquire(self, resource: str = "core") -> TokenBudget:
+        """
+        Reserve a call on the budget with the most calls left.
+
+        Waits for the earliest reset when every budget is spent, raising
+        GitHubRateLimited if that is more than max_wait_seconds away. Pass
+        the budget back to release() with the response.
+        """
+        self.stats.requests += 1
+        queued = False
+        while True:
+            now = time.time()
+            budgets = self.budgets(resource)
+            for budget in budgets:
+                if budget.reset_at and budget.reset_at <= now:
+                    # New window, GitHub will report the exact numbers on the next answer
+                    budget.remaining = budget.limit
+                    budget.reset_at = now + self.WINDOW_SECONDS
+            best = max(budgets, key=lambda budget: budget.available)
+            if best.available > 0:
+                best.in_flight += 1
+                return best
+
+            retry_at = min(budget.reset_at or now + self.WINDOW_SECONDS for budget in budgets)
+            wait = retry_at - now
+            if wait > self.max_wait_seconds:
+                raise GitHubRateLimited(resource, retry_at)
+            if not queued:
+                queued = True
+                self.stats.queued += 1
+                logger.info(f"GitHub {resource} budget spent, waiting {wait:.1f}s for the reset")
+            # Requests in flight may come back with a better budget before the reset
+            sleep = min(max(wait, 0.05), 1.0)
+            self.stats.waited_seconds += sleep
+            await asyncio.sleep(sleep)
+
+    def release(self, budget: TokenBudget, response: Optional[httpx.Response] = None) -> bool:
+        """
+        Return a reserved call, updating its budget from the response headers.
+
+        Returns True if the response is a rate-limit rejection that should
+        be retried once the budget allows, or a 401 for a pool token, which
+        is removed and the request retried on the rest of the pool.
+        """
+        budget.in_flight -= 1
+        if response is None:
+            return False
+        if response.status_code == 401 and budget.token:
+            self.stats.revoked += 1
+            self.remove_token(budget.token)
+            logger.warning(f"GitHub rejected token ...{budget.token[-4:]} (401), removed it from the pool")
+            return True
+        headers = response.headers
+        now = time.time()
+
+        rejected = response.status_code in (403, 429) and (
+            headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in headers
+        )
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            limit = remaining = None
+            reset_at = 0.0
+
+        if remaining is not None:
+            self._observe(budget, limit, remaining, reset_at)
+
+        if rejected:
+            self.stats.rate_limited += 1
+            retry_after = headers.get("Retry-After")
+            if retry_after is not None:
+                # Secondary rate limit: pause this token for as long as GitHub asks
+                try:
+                    budget.reset_at = max(budget.reset_at, now + float(retry_after))
+                except ValueError:
+                    budget.reset_at = max(budget.reset_at, now + 60.0)
+            budget.remaining = 0
+            logger.warning(f"GitHub {budget.resource} rate limit hit, retrying on another token or after the reset")
+        return rejected
+
+    def observe(self, token: Optional[str], resource: str, limit: int, remaining: int, reset_at: float) -> None:
+        """Record a budget read from elsewhere for a pool token, e.g. the /rate_limit endpoint."""
+        budget = next((budget for budget in self.budgets(resource) if budget.token == token), None)
+        if budget is not None:
+            self._observe(budget, limit, remaining, reset_at)
+
+    @staticmethod
+    def _observe(budget: TokenBudget, limit: int, remaining: int, reset_at: float) -> None:
+        budget.limit = limit
+        if reset_at != budget.reset_at:
+            budget.remaining, budget.reset_at = remaining, reset_at
+        else:
+            # Answers can arrive out of order, the lowest count in a window is the latest
+            budget.remaining = min(budget.remaining, remaining)
+
+    def predicted_wait(self, resource: str = "core", requests: int = 1) -> float:
+        """Seconds until `requests` more calls fit in the pool's budgets, 0 if they fit now."""
+        now = time.time()
+        budgets = self.budgets(resource)
+        available = sum(
+            budget.limit if budget.reset_at and budget.reset_at <= now else max(budget.available, 0)
+            for budget in budgets
+        )
+        if requests <= available:
+            return 0.0
+        # Budgets refill to their limit at their reset, earliest first
+        for budget in sorted(budgets, key=lambda budget: budget.reset_at or now + self.WINDOW_SECONDS):
+            if budget.reset_at and budget.reset_at <= now:
+                continue
+            available += budget.limit - max(budget.available, 0)
+            if requests <= available:
+                return max(0.0, (budget.reset_at or now + self.WINDOW_SECONDS) - now)
+        # More than the pool refills in one window, later windows add every limit again
+        latest_reset = max(budget.reset_at or now + self.WINDOW_SECONDS for budget in budgets)
+        windows = math.ceil((requests - available) / max(sum(budget.limit for budget in budgets), 1))
+        return max(0.0, latest_reset - now) + self.WINDOW_SECONDS * windows
+
+    def snapshot(self, resource: str = "core") -> list[dict]:
+        """Budget per pool token, tokens reduced to their last four characters."""
+        return [
+            {
+                "token": f"...{budget.token[-4:]}" if budget.token else None,
+                "limit": budget.limit,
+                "remaining": budget.remaining,
+                "reset_at": budget.reset_at or None,
+            }
+            for budget in self.budgets(resource)
+        ]
@@ -0,0 +1,304 @@
+"""
+Job text extraction from HTML pages, with pluggable parser engines.
+
+URLIngestService hands each fetched page to an HTMLTextExtractor, which
+drops navigation/footer noise, picks the job content element and flattens it
+to text with line breaks for block elements and "• " for list items.
+
+Engines, fastest first:
+- selectolax (lexbor, C)
+- lxml (libxml2, C)
+- html.parser (BeautifulSoup on the pure-Python parser, always available)
+
+Settings.html_parser_engine picks one; "auto" uses the fastest installed.
+Engines agree on well-formed pages, on broken markup each parser's error
+recovery may nest elements differently.
+"""
+import logging
+import re
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Elements that start a new line in the extracted text
+BLOCK_TAGS = frozenset({'p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+SELECTOR_PATTERN = re.compile(r'^([a-zA-Z][a-zA-Z0-9]*)?(?:#([\w-]+))?(?:\.([\w-]+))?$')
+
+
+@dataclass(frozen=True)
+class SimpleSelector:
+    """
+    A tag, #id and/or .class selector, e.g. "div#content" or ".nav".
+
+    These are the only forms the URLIngestService selector lists use, so they
+    can be matched while walking the tree instead of one select() per selector.
+    """
+    css: str
+    tag: Optional[str]
+    id: Optional[str]
+    class_name: Optional[str]
+
+    @classmethod
+    def parse(cls, css: str) -> "SimpleSelector":
+        match = SELECTOR_PATTERN.match(css.strip())
+        if not match or not any(match.groups()):
+            raise ValueError(f"Unsupported selector: {css!r}")
+        tag, element_id, class_name = match.groups()
+        return cls(css=css, tag=tag and tag.lower(), id=element_id, class_name=class_name)
+
+    def matches(self, tag: str, element_id: Optional[str], classes) -> bool:
+        return (
+            (self.tag is None or self.tag == tag) and
+            (self.id is None or self.id == element_id) and
+            (self.class_name is None or self.class_name in classes)
+        )
+
+
+class SelectorSet:
+    """Matches an element against many simple selectors at once."""
+
+    def __init__(self, selectors: list[SimpleSelector]):
+        self.css = ", ".join(selector.css for selector in selectors)
+        # Single-part selectors become set lookups, the rest are checked in turn
+        self.tags = {s.tag for s in selectors if s.tag and not (s.id or s.class_name)}
+        self.classes = {s.class_name for s in selectors if s.class_name and not (s.tag or s.id)}
+        self.compound = [s for s in selectors if s.tag not in self.tags and s.class_name not in self.classes]
+
+    def matches(self, tag: str, element_id: Optional[str], classes) -> bool:
+        if tag in self.tags:
+            return True
+        if self.classes and not self.classes.isdisjoint(classes):
+            return True
+        return any(selector.matches(tag, element_id, classes) for selector in self.compound)
+
+
+def tidy_text(parts: list[str]) -> str:
+    """Join the walked pieces and collapse the whitespace the markers leave."""
+    text = ''.join(parts)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r' \n', '\n', text)
+    text = re.sub(r'\n ', '\n', text)
+    # A block element opening a list item (<li><p>) stays on the bullet's line
+    text = re.sub(r'\n• *\n+(?=[^\n•])', '\n• ', text)
+    return text.strip()
+
+
+class HTMLTextExtractor:
+    """
+    Base class for parser engines.
+
+    remove_selectors name noise elements to drop; content_selectors is an
+    ordered list of (selector, platform) pairs, the first selector for the
+    page's platform (or for any platform) that matches picks the content root.
+    """
+    name = "base"
+    module: Optional[str] = None
+
+    def __init__(self, remove_selectors: list[str], content_selectors: list[tuple[str, Optional[str]]]):
+        self.remove = SelectorSet([SimpleSelector.parse(css) for css in remove_selectors])
+        self.content_selectors = [
+            (SimpleSelector.parse(css), platform) for css, platform in content_selectors
+        ]
+
+    @classmethod
+    def available(cls) -> bool:
+        return cls.module is None or find_spec(cls.module) is not None
+
+    def candidates(self, platform: Optional[str]) -> list[SimpleSelector]:
+        """Content selectors that apply to a platform, in priority order."""
+        return [
+            selector for selector, selector_platform in self.content_selectors
+            if not selector_platform or selector_platform == platform
+        ]
+
+    def extract(self, html: str, platform: Optional[str] = None) -> str:
+        raise NotImplementedError
+
+    @staticmethod
+    def add_marker(parts: list[str], tag: str) -> None:
+        if tag in BLOCK_TAGS:
+            parts.append('\n')
+        elif tag == 'li':
+            parts.append('\n• ')
+
+    @staticmethod
+    def add_text(parts: list[str], text: str) -> None:
+        text = text.strip()
+        if text:
+            parts.append(text + ' ')
+
+
+class SoupExtractor(HTMLTextExtractor):
+    """
+    BeautifulSoup with the stdlib html.parser, the always-available fallback.
+
+    Noise removal and content selection share one walk over the tree, noise
+    subtrees are not descended into.
+    """
+    name = "html.parser"
+    module = "bs4"
+
+    def extract(self, html: str, platform: Optional[str] = None) -> str:
+        from bs4 import BeautifulSoup, NavigableString, Tag
+
+        soup = BeautifulSoup(html, 'html.parser')
+        candidates = self.candidates(platform)
+        found: list[Optional[Tag]] = [None] * len(candidates)
+        noise = []
+
+        stack = [child for child in reversed(soup.contents) if isinstance(child, Tag)]
+        while stack:
+            node = stack.pop()
+            element_id = node.get('id')
+            classes = node.get('class') or ()
+            if self.remove.matches(node.name, element_id, classes):
+                noise.append(node)
+                continue
+            for i, selector in enumerate(candidates):
+                if found[i] is None and selector.matches(node.name, element_id, classes):
+                    found[i] = node
+            stack.extend(child for child in reversed(node.contents) if isinstance(child, Tag))
+
+        for node in noise:
+            node.decompose()
+
+        content = next((node for node in found if node is not None), None) or soup.body or soup
+
+        parts = []
+        for node in content.descendants:
+            if isinstance(node, Tag):
+                self.add_marker(parts, node.name)
+            elif type(node) is NavigableString:
+                self.add_text(parts, node)
+        return tidy_text(parts)
+
+
+class SelectolaxExtractor(HTMLTextExtractor):
+    """selectolax on the lexbor engine; noise is found with one grouped CSS query."""
+    name = "selectolax"
+    module = "selectolax"
+
+    def extract(self, html: str, platform: Optional[str] = None) -> str:
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+
+        # A node matching several selectors comes back once per match; children
+        # are decomposed before their ancestors
+        seen = set()
+        for node in reversed(tree.css(self.remove.css) if self.remove.css else []):
+            if node.mem_id not in seen:
+                seen.add(node.mem_id)
+                node.decompose()
+
+        content = None
+        for selector in self.candidates(platform):
+            content = tree.css_first(selector.css)
+            if content is not None:
+                break
+        if content is None:
+            content = tree.body or tree.root
+
+        parts = []
+        nodes = content.traverse(include_text=True)
+        next(nodes, None)  # the content root itself
+        for node in nodes:
+            tag = node.tag
+            if tag == '-text':
+                self.add_text(parts, node.text_content)
+            elif tag != '-comment':
+                self.add_marker(parts, tag)
+        return tidy_text(parts)
+
+
+class LxmlExtractor(HTMLTextExtractor):
+    """lxml.html; noise removal and content selection share one iterwalk pass."""
+    name = "lxml"
+    module = "lxml"
+
+    def __init__(self, remove_selectors: list[str], content_selectors: list[tuple[str, Optional[str]]]):
+        super().__init__(remove_selectors, content_selectors)
+        from lxml import html as lxml_html
+        self._parser = lxml_html.HTMLParser(encoding='utf-8')
+
+    def extract(self, html: str, platform: Optional[str] = None) -> str:
+        from lxml import etree, html as lxml_html
+
+        if not html.strip():
+            return ""
+        # Bytes with an explicit encoding, lxml rejects str input that carries
+        # its own encoding declaration
+        root = lxml_html.document_fromstring(html.encode('utf-8'), parser=self._parser)
+
+        candidates = self.candidates(platform)
+        found = [None] * len(candidates)
+        noise = []
+
+        walker = etree.iterwalk(root, events=('start',))
+        for _, node in walker:
+            element_id = node.get('id')
+            classes = (node.get('class') or '').split()
+            if self.remove.matches(node.tag, element_id, classes):
+                noise.append(node)
+                walker.skip_subtree()
+                continue
+            for i, selector in enumerate(candidates):
+                if found[i] is None and selector.matches(node.tag, element_id, classes):
+                    found[i] = node
+
+        # drop_tree keeps the text that follows the dropped element
+        for node in noise:
+            node.drop_tree()
+
+        content = next((node for node in found if node is not None), None)
+        if content is None:
+            content = root.find('body')
+            if content is None:
+                content = root
+
+        parts = []
+        for event, node in etree.iterwalk(content, events=('start', 'end', 'comment')):
+            if event == 'start':
+                if node is not content:
+                    self.add_marker(parts, node.tag)
+                if node.text:
+                    self.add_text(parts, node.text)
+            elif node is not content and node.tail:
+                self.add_text(parts, node.tail)
+        return tidy_text(parts)
+
+
+ENGINES: dict[str, type[HTMLTextExtractor]] = {
+    SelectolaxExtractor.name: SelectolaxExtractor,
+    LxmlExtractor.name: LxmlExtractor,
+    SoupExtractor.name: SoupExtractor,
+}
+
+
+def create_html_extractor(
+    engine: str,
+    remove_selectors: list[str],
+    content_selectors: list[tuple[str, Optional[str]]],
+) -> HTMLTextExtractor:
+    """
+    Build the extractor for an engine name, or the fastest installed one for "auto".
+
+    An engine that is not installed falls back to html.parser with a warning.
+    """
+    if engine == "auto":
+        names = list(ENGINES)
+    elif engine in ENGINES:
+        names = [engine]
+    else:
+        raise ValueError(f"Unknown HTML parser engine: {engine}")
+
+    for name in names:
+        if ENGINES[name].available():
+            return ENGINES[name](remove_selectors, content_selectors)
+
+    logger.warning(f"HTML parser engine {engine} is not installed, using html.parser")
+    return SoupExtractor(remove_selectors, content_selectors)
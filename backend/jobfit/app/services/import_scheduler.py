@@ -0,0 +1,170 @@
+"""
+Concurrent multi-URL job import with per-platform politeness.
+
+URLImportScheduler fetches many job URLs at once through URLIngestService:
+a global cap bounds requests in flight, a token bucket per platform (or per
+host for sites no platform pattern matches) bounds the request rate against
+each job board, and 429/5xx answers are retried with jittered backoff, or
+after the Retry-After the board sent, which also pauses the board's bucket.
+Results are yielded as they complete, not in input order.
+"""
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+from urllib.parse import urlsplit
+
+from app.core.config import get_settings
+from app.services.url_ingestion import URLIngestResult, URLIngestService, url_ingest_service
+
+settings = get_settings()
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` requests per second with bursts of `capacity`.
+
+    Waiters are served in arrival order.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.users = 0  # imports holding this bucket, it is only dropped when none do
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds`, e.g. after a Retry-After."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def idle(self) -> bool:
+        """Unused, unpaused and refilled, so a fresh bucket would behave the same."""
+        now = time.monotonic()
+        refilled = self._tokens + (now - self._updated) * self.rate >= self.capacity
+        return not self.users and now >= self._paused_until and refilled
+
+
+@dataclass
+class ScheduledImport:
+    """One completed URL import."""
+    index: int
+    url: str
+    result: URLIngestResult
+    attempts: int
+
+
+class URLImportScheduler:
+    """
+    Fetches a list of job URLs concurrently, politely.
+
+    The global cap and the token buckets live on the instance, so batches
+    running at the same time through the singleton share one budget per board.
+    """
+
+    # Statuses worth retrying, anything else is final
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    # Upper bound for a single backoff sleep
+    MAX_BACKOFF_SECONDS = 10.0
+
+    # Longest Retry-After honoured, a longer one makes the answer final
+    MAX_RETRY_AFTER_SECONDS = 60.0
+
+    def __init__(
+        self,
+        service: Optional[URLIngestService] = None,
+        concurrency: Optional[int] = None,
+        domain_rate: Optional[float] = None,
+        domain_burst: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+    ):
+        self.service = service or url_ingest_service
+        self.concurrency = concurrency or settings.job_import_concurrency
+        self.domain_rate = domain_rate or settings.job_import_domain_rate
+        self.domain_burst = domain_burst or settings.job_import_domain_burst
+        self.max_retries = settings.job_import_max_retries if max_retries is None else max_retries
+        self.retry_base_seconds = retry_base_seconds or settings.job_import_retry_base_seconds
+        self._buckets: dict[str, TokenBucket] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def run(self, urls: list[str]) -> AsyncIterator[ScheduledImport]:
+        """Import every URL, yielding each result as soon as it is final."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.create_task(self._import(index, url)) for index, url in enumerate(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer went away, stop fetching the rest
+            for task in tasks:
+                task.cancel()
+
+    def bucket_key(self, url: str) -> str:
+        """Platform name for known job boards, the host for everything else."""
+        return self.service._detect_platform(url) or urlsplit(url).netloc.lower()
+
+    async def _import(self, index: int, url: str) -> ScheduledImport:
+        # JS-only platforms are answered without a request, don't spend tokens on them
+        needs_fetch = self.service._detect_platform(url) not in self.service.JS_REQUIRED_PLATFORMS
+        bucket = self._bucket(self.bucket_key(url)) if needs_fetch else None
+        if bucket is not None:
+            bucket.users += 1
+        try:
+            attempts = 0
+            while True:
+                attempts += 1
+                if bucket is not None:
+                    await bucket.acquire()
+                async with self._slots:
+                    result = await self.service.ingest_url(url)
+
+                if result.http_status not in self.RETRY_STATUSES or attempts > self.max_retries:
+                    return ScheduledImport(index=index, url=url, result=result, attempts=attempts)
+
+                if result.retry_after is not None:
+                    if result.retry_after > self.MAX_RETRY_AFTER_SECONDS:
+                        return ScheduledImport(index=index, url=url, result=result, attempts=attempts)
+                    # The board asked every client to hold off, not just this request
+                    if bucket is not None:
+                        bucket.pause(result.retry_after)
+                    await asyncio.sleep(result.retry_after)
+                    continue
+
+                # Full jitter: spread retries so a throttled board is not hit in lockstep
+                backoff = min(self.MAX_BACKOFF_SECONDS, self.retry_base_seconds * 2 ** (attempts - 1))
+                await asyncio.sleep(random.uniform(0, backoff))
+        finally:
+            if bucket is not None:
+                bucket.users -= 1
+
+    def _bucket(self, key: str) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            # One bucket per domain ever seen would grow without bound, drop the idle ones
+            for idle_key in [other for other, other_bucket in self._buckets.items() if other_bucket.idle()]:
+                del self._buckets[idle_key]
+            bucket = self._buckets[key] = TokenBucket(self.domain_rate, self.domain_burst)
+        return bucket
+
+
+# Singleton instance
+url_import_scheduler = URLImportScheduler()
@@ -7,9 +7,23 @@ from .text_cleaner import (
     JobSectionExtractor,
     clean_and_parse_job,
 )
-from .pdf_extract import PDFExtractor, ResumeParser, ExtractedResume
+from .pdf_extract import PDFExtractor, ResumeParser, ExtractedResume, ExtractedPage, PDFExtractionEngine, pdf_engine
+from .extraction_cache import ExtractionCache, extraction_cache
+from .job_ingest import JobIngestService, IngestBatchReport, read_job_records, job_ingest_service
 from .github_client import GitHubClient, GitHubRepo, github_client
-from .url_ingest import URLIngestService, URLIngestResult, url_ingest_service
+from .github_cache import GitHubResponseCache, CachedResponse, github_response_cache
+from .github_rate_limit import GitHubRateLimiter, GitHubRateLimited
+from .html_extract import HTMLTextExtractor, create_html_extractor
+from .structured_data import StructuredJobPosting, extract_job_posting
+from .platform_adapters import PlatformAdapter, PlatformPosting, ADAPTERS
+from .url_cache import URLResponseCache, CachedPage, url_response_cache
+from .url_ingestion import URLIngestService, URLIngestResult, url_ingest_service
+from .import_scheduler import URLImportScheduler, ScheduledImport, TokenBucket, url_import_scheduler
+from .skill_matcher import SkillMatcher, SkillHit
+from .skill_catalog import SkillCatalog, CatalogSnapshot, SkillRecord, bump_catalog_version, skill_catalog
+from .job_skill_worker import JobSkillWorker, WorkerBatchReport, extract_job_skills, job_skill_worker
+from .fit_scoring import FitScorer, FitScore, FitScoringEngine, JobSkillMatrix, BatchFitScore, fit_scoring_engine
+from .job_ranking import JobRankingService, JobRanking, RankedJob, job_ranking_service
 
 __all__ = [
     # Text cleaning
@@ -17,16 +31,70 @@ __all__ = [
     "JobMetadataExtractor", 
     "JobSectionExtractor",
     "clean_and_parse_job",
+    # Bulk job ingestion
+    "JobIngestService",
+    "IngestBatchReport",
+    "read_job_records",
+    "job_ingest_service",
     # PDF extraction
     "PDFExtractor",
     "ResumeParser",
     "ExtractedResume",
+    "ExtractedPage",
+    "PDFExtractionEngine",
+    "pdf_engine",
+    "ExtractionCache",
+    "extraction_cache",
     # GitHub
     "GitHubClient",
     "GitHubRepo",
     "github_client",
+    "GitHubResponseCache",
+    "CachedResponse",
+    "github_response_cache",
+    "GitHubRateLimiter",
+    "GitHubRateLimited",
     # URL ingestion
     "URLIngestService",
     "URLIngestResult",
     "url_ingest_service",
+    "URLResponseCache",
+    "CachedPage",
+    "url_response_cache",
+    "HTMLTextExtractor",
+    "create_html_extractor",
+    "StructuredJobPosting",
+    "extract_job_posting",
+    "PlatformAdapter",
+    "PlatformPosting",
+    "ADAPTERS",
+    "URLImportScheduler",
+    "ScheduledImport",
+    "TokenBucket",
+    "url_import_scheduler",
+    # Skill matching
+    "SkillMatcher",
+    "SkillHit",
+    "SkillCatalog",
+    "CatalogSnapshot",
+    "SkillRecord",
+    "bump_catalog_version",
+    "skill_catalog",
+    # Job skill extraction
+    "JobSkillWorker",
+    "WorkerBatchReport",
+    "extract_job_skills",
+    "job_skill_worker",
+    # Fit scoring
+    "FitScorer",
+    "FitScore",
+    "FitScoringEngine",
+    "JobSkillMatrix",
+    "BatchFitScore",
+    "fit_scoring_engine",
+    # Job ranking
+    "JobRankingService",
+    "JobRanking",
+    "RankedJob",
+    "job_ranking_service",
 ]
\ No newline at end of file
@@ -0,0 +1,301 @@
+"""
+Bulk job ingestion from NDJSON and CSV feeds.
+
+Records are cleaned and parsed with clean_and_parse_job in a process pool,
+then written batch by batch with one INSERT ... ON CONFLICT DO NOTHING
+RETURNING per batch. Jobs are deduplicated on a sha256 of the cleaned text
+and the source url, so re-running a feed only stores postings that are new.
+"""
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator, Optional, TextIO, Union
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import get_settings
+from app.models.job import Job, JobSource, RoleType, SeniorityLevel
+from app.services.text_cleaner import JobMetadata, clean_and_parse_job
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Same bounds as JobCreate.raw_text
+MIN_RAW_TEXT_LENGTH = 50
+MAX_RAW_TEXT_LENGTH = 50000
+
+# A feed record: the raw NDJSON line (decoded in the worker) or a CSV row
+FeedRecord = Union[str, dict]
+
+
+@dataclass
+class IngestBatchReport:
+    """
+    Throughput report for one ingested batch.
+    """
+    batch: int
+    received: int
+    inserted: int
+    duplicates: int
+    failed: int
+    parse_ms: int
+    insert_ms: int
+    records_per_second: float
+    errors: list[str] = field(default_factory=list)
+
+
+def content_hash(cleaned_text: str, source_url: Optional[str]) -> str:
+    """Dedup key of a job: sha256 of its cleaned text and source url."""
+    return hashlib.sha256(f"{cleaned_text}\n{source_url or ''}".encode()).hexdigest()
+
+
+def read_job_records(stream: TextIO, fmt: str) -> Iterator[tuple[int, FeedRecord]]:
+    """
+    Yield (line_number, record) for every record in an NDJSON or CSV feed.
+
+    NDJSON lines are passed through undecoded, json.loads runs in the worker
+    processes along with the parsing. CSV rows are read here since a quoted
+    field may span several lines, line_number is then the row's first line.
+    """
+    if fmt == "ndjson":
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_number, line
+    elif fmt == "csv":
+        reader = csv.DictReader(stream)
+        if reader.fieldnames is None:
+            return
+        line_number = reader.line_num + 1
+        for row in reader:
+            yield line_number, row
+            line_number = reader.line_num + 1
+    else:
+        raise ValueError(f"Unsupported feed format: {fmt}")
+
+
+def job_values(record: dict, default_source: JobSource, metadata: Optional[JobMetadata] = None) -> dict:
+    """
+    Column values for a new Job row, mirroring create_job.
+
+    metadata, when given, replaces the metadata extracted from the text.
+    Raises ValueError if the record has no usable job text.
+    """
+    raw_text = record.get("raw_text") or record.get("description")
+    if not isinstance(raw_text, str) or not MIN_RAW_TEXT_LENGTH <= len(raw_text) <= MAX_RAW_TEXT_LENGTH:
+        raise ValueError(
+            f"raw_text must be between {MIN_RAW_TEXT_LENGTH} and {MAX_RAW_TEXT_LENGTH} characters"
+        )
+
+    title = record.get("title") or None
+    parsed = clean_and_parse_job(raw_text, title, metadata)
+    metadata = parsed["metadata"]
+    sections = parsed["sections"]
+
+    seniority = None
+    if metadata["seniority"]:
+        try:
+            seniority = SeniorityLevel(metadata["seniority"])
+        except ValueError:
+            pass
+
+    role_type = None
+    if metadata["role_type"]:
+        try:
+            role_type = RoleType(metadata["role_type"])
+        except ValueError:
+            pass
+
+    try:
+        source = JobSource(record.get("source") or default_source)
+    except ValueError:
+        source = default_source
+
+    company = record.get("company") or metadata["company"]
+    location = record.get("location") or metadata["location"]
+    source_url = record.get("source_url") or record.get("url") or None
+
+    # Feeds are not validated like the API schemas, clip to the column sizes
+    return dict(
+        title=(title or metadata["title"] or "Untitled Position")[:255],
+        company=company[:255] if company else None,
+        location=location[:255] if location else None,
+        description=parsed["cleaned_text"],
+        raw_text=raw_text,
+        cleaned_text=parsed["cleaned_text"],
+        source=source,
+        source_url=source_url[:1000] if source_url else None,
+        external_id=str(record["external_id"])[:255] if record.get("external_id") else None,
+        content_hash=content_hash(parsed["cleaned_text"], source_url),
+        seniority=seniority,
+        role_type=role_type,
+        remote_type=metadata["remote_type"],
+        salary_min=metadata["salary_min"],
+        salary_max=metadata["salary_max"],
+        salary_currency=metadata["salary_currency"],
+        requirement_section=sections["requirements"],
+        nice_to_have_section=sections["nice_to_have"],
+        responsibilities_section=sections["responsibilities"],
+        benefits_section=sections["benefits"],
+        is_processed=False,
+    )
+
+
+def _prepare_records(
+    records: list[tuple[int, FeedRecord]],
+    default_source: JobSource,
+) -> list[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Decode and parse a chunk of feed records into (line_number, values, error).
+
+    Runs inside a worker process, so it must stay a picklable module-level function.
+    """
+    prepared = []
+    for line_number, record in records:
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+                if not isinstance(record, dict):
+                    raise ValueError("record is not a JSON object")
+            prepared.append((line_number, job_values(record, default_source), None))
+        except Exception as e:
+            prepared.append((line_number, None, f"Line {line_number}: {str(e)}"))
+    return prepared
+
+
+class JobIngestService:
+    """
+    Streams feed records through the parsing pool and into the jobs table.
+
+    Parsing of the next batch starts before the current batch is inserted, so
+    the workers stay busy while the database round trip is in flight.
+    """
+    def __init__(self, max_workers: Optional[int] = None, batch_size: Optional[int] = None):
+        self.max_workers = max_workers or settings.job_ingest_workers
+        self.batch_size = batch_size or settings.job_ingest_batch_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Process pool, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def ingest(
+        self,
+        records: Iterable[tuple[int, FeedRecord]],
+        session_factory: async_sessionmaker[AsyncSession],
+        default_source: JobSource = JobSource.MANUAL,
+    ) -> AsyncIterator[IngestBatchReport]:
+        """
+        Parse and insert records batch by batch, yielding one report per batch.
+
+        Each batch is committed in its own session, a failure part way through a
+        feed keeps the batches already stored and re-running the feed skips them.
+        """
+        records = iter(records)
+        batches = iter(lambda: list(islice(records, self.batch_size)), [])
+        batch = next(batches, None)
+        parsing = self._start_batch(batch, default_source) if batch else None
+        batch_number = 0
+        window_start = time.perf_counter()
+
+        try:
+            while parsing is not None:
+                parse_start, future = parsing
+                batch_number += 1
+                received = len(batch)
+                prepared = await future
+                parse_ms = int((time.perf_counter() - parse_start) * 1000)
+
+                # Keep the pool busy while this batch is written
+                batch = next(batches, None)
+                parsing = self._start_batch(batch, default_source) if batch else None
+
+                errors = [error for _, _, error in prepared if error]
+                rows: dict[str, dict] = {}
+                for _, values, _ in prepared:
+                    if values is not None:
+                        rows.setdefault(values["content_hash"], values)
+
+                insert_start = time.perf_counter()
+                inserted = len(await self.insert_jobs(session_factory, list(rows.values()))) if rows else 0
+                insert_ms = int((time.perf_counter() - insert_start) * 1000)
+
+                now = time.perf_counter()
+                yield IngestBatchReport(
+                    batch=batch_number,
+                    received=received,
+                    inserted=inserted,
+                    duplicates=received - len(errors) - inserted,
+                    failed=len(errors),
+                    parse_ms=parse_ms,
+                    insert_ms=insert_ms,
+                    records_per_second=round(received / max(now - window_start, 1e-6), 1),
+                    errors=errors,
+                )
+                window_start = now
+        finally:
+            # The consumer stopped early or an insert failed, drop the batch in flight
+            if parsing is not None:
+                parsing[1].cancel()
+
+    def _start_batch(
+        self,
+        batch: list[tuple[int, FeedRecord]],
+        default_source: JobSource,
+    ) -> tuple[float, asyncio.Future]:
+        """Submit a batch to the pool as one chunk per worker."""
+        loop = asyncio.get_running_loop()
+        chunk_size = -(-len(batch) // self.max_workers)
+        futures = [
+            loop.run_in_executor(self.executor, _prepare_records, batch[i:i + chunk_size], default_source)
+            for i in range(0, len(batch), chunk_size)
+        ]
+        return time.perf_counter(), asyncio.ensure_future(self._gather(futures))
+
+    async def _gather(self, futures: list[asyncio.Future]) -> list[tuple[int, Optional[dict], Optional[str]]]:
+        try:
+            chunks = await asyncio.gather(*futures)
+        except BrokenProcessPool:
+            logger.error("Job ingestion pool is broken, recreating it")
+            self.shutdown()
+            raise
+        return [item for chunk in chunks for item in chunk]
+
+    @staticmethod
+    async def insert_jobs(session_factory: async_sessionmaker[AsyncSession], rows: list[dict]) -> dict[str, int]:
+        """
+        Insert job rows built by job_values, skipping stored jobs.
+
+        Returns the new job id for each inserted content hash; hashes that were
+        already stored are missing from the result.
+        """
+        statement = (
+            pg_insert(Job)
+            .on_conflict_do_nothing(index_elements=[Job.content_hash])
+            .returning(Job.id, Job.content_hash)
+        )
+        async with session_factory() as session:
+            result = await session.execute(statement, rows)
+            inserted = {job_hash: job_id for job_id, job_hash in result.all()}
+            await session.commit()
+        return inserted
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+job_ingest_service = JobIngestService()
@@ -0,0 +1,213 @@
+"""
+Rank many jobs for one user in a single pass.
+
+JobRankingService loads the jobs' skills and the user's skills with one
+query each, scores the user against all jobs at once with
+FitScorer.score_many() and stores one Analysis row per job: the user's
+previous analyses of those jobs are flipped to is_latest=False in one
+UPDATE and the new rows go in with one INSERT, in the request transaction.
+Jobs the skill worker has not processed yet, or failed to process, have no
+job_skills rows to score and are reported back instead of ranked.
+"""
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    JSON, Boolean, Column, DateTime, Enum, Float, Integer, MetaData, Table, insert, select, update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.services.fit_scoring import FitScoringEngine, fit_scoring_engine, load_user_skills
+from app.services.job_skill_worker import JOB_SKILLS_TABLE, JOBS_TABLE
+
+settings = get_settings()
+
+# analysis columns written by rankings, without the Analysis mapper. A typed
+# Table with its primary key: a multi-row INSERT ... RETURNING sorts its rows
+# by the key, and asyncpg casts every bound value to its column's type
+ANALYSIS_TABLE = Table(
+    "analysis",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer),
+    Column("job_id", Integer),
+    Column("resume_id", Integer),
+    # AnalysisStatus member names, as the analysis_status_enum type stores them
+    Column("status", Enum("PENDING", "PROCESSING", "COMPLETED", "FAILED", name="analysis_status_enum")),
+    Column("overall_score", Float),
+    Column("coverage_score", Float),
+    Column("depth_score", Float),
+    Column("bonus_score", Float),
+    Column("top_strengths", JSON),
+    Column("top_gaps", JSON),
+    Column("is_latest", Boolean),
+    Column("created_at", DateTime(timezone=True)),
+    Column("updated_at", DateTime(timezone=True)),
+)
+
+
+@dataclass
+class RankedJob:
+    """One job of a ranking and the Analysis row stored for it."""
+    rank: int
+    job_id: int
+    job_title: str
+    company: Optional[str]
+    overall_score: float
+    coverage_score: float
+    depth_score: float
+    bonus_score: float
+    matched_skills: int
+    partial_skills: int
+    missing_skills: int
+    top_strengths: list[str] = field(default_factory=list)
+    top_gaps: list[str] = field(default_factory=list)
+    analysis_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class JobRanking:
+    """Jobs by descending fit, with per-skill coverage points per job."""
+    user_id: int
+    jobs: list[RankedJob]
+    skill_coverage: dict[str, dict[int, float]]
+    unknown_job_ids: list[int]
+    unprocessed_job_ids: list[int]
+    scoring_ms: float
+    total_ms: int
+
+
+class JobRankingService:
+    """Scores one user against many jobs and stores the analyses in bulk."""
+
+    def __init__(self, engine: Optional[FitScoringEngine] = None):
+        self.engine = engine or fit_scoring_engine
+
+    async def rank(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        job_ids: Optional[list[int]] = None,
+        resume_id: Optional[int] = None,
+    ) -> JobRanking:
+        """
+        Rank jobs for a user, storing an Analysis per job.
+
+        Args:
+            job_ids: Jobs to rank; defaults to every job the user has analyses for
+        """
+        start = time.perf_counter()
+        if job_ids is None:
+            result = await db.execute(
+                select(ANALYSIS_TABLE.c.job_id).where(ANALYSIS_TABLE.c.user_id == user_id).distinct()
+            )
+            job_ids = list(result.scalars().all())
+        job_ids = list(dict.fromkeys(job_ids))[:settings.analysis_rank_max_jobs]
+
+        jobs = {
+            row["id"]: row
+            for row in (await db.execute(
+                select(
+                    JOBS_TABLE.c.id, JOBS_TABLE.c.title, JOBS_TABLE.c.company,
+                    JOBS_TABLE.c.is_processed, JOBS_TABLE.c.processing_error,
+                ).where(JOBS_TABLE.c.id.in_(job_ids))
+            )).mappings()
+        }
+        # Only jobs with extracted skills are scored; the rest would score 0
+        # and demote the user's last valid analysis of them
+        known = [
+            job_id for job_id in job_ids
+            if job_id in jobs and jobs[job_id]["is_processed"] and jobs[job_id]["processing_error"] is None
+        ]
+        job_skills = (await db.execute(
+            select(JOB_SKILLS_TABLE.c.job_id, JOB_SKILLS_TABLE.c.skill_id, JOB_SKILLS_TABLE.c.importance)
+            .where(JOB_SKILLS_TABLE.c.job_id.in_(known))
+        )).all()
+        user_skills = await load_user_skills(db, user_id)
+
+        scoring_start = time.perf_counter()
+        scorer = self.engine.scorer
+        matrix = scorer.job_matrix(known, job_skills)
+        scores = scorer.score_many(
+            matrix, scorer.user_vector((skill_id, row["strength"]) for skill_id, row in user_skills.items())
+        )
+        records = scorer.snapshot.records
+
+        def names(indexes: list[int]) -> list[str]:
+            return [records[index].display_name or records[index].canonical_name for index in indexes]
+
+        ranked = []
+        # Highest fit first, ties in the requested order
+        for rank, row in enumerate(sorted(range(len(known)), key=lambda row: -scores.overall[row]), start=1):
+            job = jobs[known[row]]
+            ranked.append(RankedJob(
+                rank=rank,
+                job_id=job["id"],
+                job_title=job["title"],
+                company=job["company"],
+                overall_score=float(scores.overall[row]),
+                coverage_score=float(scores.coverage[row]),
+                depth_score=float(scores.depth[row]),
+                bonus_score=float(scores.bonus[row]),
+                matched_skills=int(scores.matched[row]),
+                partial_skills=int(scores.partial[row]),
+                missing_skills=int(scores.missing[row]),
+                top_strengths=names(scores.top_strengths[row]),
+                top_gaps=names(scores.top_gaps[row]),
+            ))
+        skill_coverage = scores.coverage_by_skill(records)
+        scoring_ms = (time.perf_counter() - scoring_start) * 1000
+
+        if ranked:
+            await db.execute(
+                update(ANALYSIS_TABLE)
+                .where(
+                    ANALYSIS_TABLE.c.user_id == user_id,
+                    ANALYSIS_TABLE.c.job_id.in_(known),
+                    ANALYSIS_TABLE.c.is_latest.is_(True),
+                )
+                .values(is_latest=False)
+            )
+            inserted = await db.execute(
+                insert(ANALYSIS_TABLE).returning(
+                    ANALYSIS_TABLE.c.id, ANALYSIS_TABLE.c.created_at, ANALYSIS_TABLE.c.updated_at,
+                    sort_by_parameter_order=True,
+                ),
+                [
+                    {
+                        "user_id": user_id,
+                        "job_id": job.job_id,
+                        "resume_id": resume_id,
+                        "status": "COMPLETED",
+                        "overall_score": job.overall_score,
+                        "coverage_score": job.coverage_score,
+                        "depth_score": job.depth_score,
+                        "bonus_score": job.bonus_score,
+                        "top_strengths": job.top_strengths,
+                        "top_gaps": job.top_gaps,
+                        "is_latest": True,
+                    }
+                    for job in ranked
+                ],
+            )
+            for job, (analysis_id, created_at, updated_at) in zip(ranked, inserted.all()):
+                job.analysis_id, job.created_at, job.updated_at = analysis_id, created_at, updated_at
+
+        return JobRanking(
+            user_id=user_id,
+            jobs=ranked,
+            skill_coverage=skill_coverage,
+            unknown_job_ids=[job_id for job_id in job_ids if job_id not in jobs],
+            unprocessed_job_ids=[job_id for job_id in job_ids if job_id in jobs and job_id not in known],
+            scoring_ms=round(scoring_ms, 3),
+            total_ms=int((time.perf_counter() - start) * 1000),
+        )
+
+
+# Singleton instance
+job_ranking_service = JobRankingService()
@@ -0,0 +1,222 @@
+"""
+Background skill extraction for jobs stored with is_processed=False.
+
+JobSkillWorker claims a batch of unprocessed jobs with SELECT ... FOR UPDATE
+SKIP LOCKED, matches their cleaned text against the skill catalog snapshot,
+replaces their job_skills rows and marks them processed, all in one
+transaction. Rows another worker has locked are skipped rather than waited
+for, and processed rows no longer match the claim, so any number of workers
+(in the API processes and in `python -m app.scripts.skill_worker`
+processes) can run against the same table without processing a job twice.
+A worker that dies mid-batch rolls back and its jobs are claimed again.
+
+Each skill gets one JobSkill row: its importance comes from the most
+important section it is mentioned in (requirements > responsibilities and
+untitled text > nice to have and benefits), mention_count from the number
+of mentions. A job whose extraction fails gets processing_error set and is
+not claimed again until the error is cleared.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import bindparam, column, delete, insert, select, table, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.job import Job
+from app.services.skill_catalog import CatalogSnapshot, SkillCatalog, skill_catalog
+from app.services.text_cleaner import JobSectionExtractor, TextCleaner
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+JOBS_TABLE = Job.__table__
+
+# job_skills columns the worker writes, without the JobSkill mapper
+JOB_SKILLS_TABLE = table(
+    "job_skills",
+    column("job_id"),
+    column("skill_id"),
+    column("importance"),
+    column("confidence"),
+    column("source_section"),
+    column("mention_count"),
+)
+
+# SkillImportance member names (stored by the skill_importance enum) per section
+SECTION_IMPORTANCE = {
+    "requirements": "REQUIRED",
+    "responsibilities": "PREFERRED",
+    "other": "PREFERRED",
+    None: "PREFERRED",  # text before the first section header
+    "nice_to_have": "NICE_TO_HAVE",
+    "benefits": "NICE_TO_HAVE",
+}
+IMPORTANCE_RANK = {"NICE_TO_HAVE": 1, "PREFERRED": 2, "REQUIRED": 3}
+
+# Sections whose header says what the skills in them are for
+TITLED_SECTIONS = {"requirements", "responsibilities", "nice_to_have"}
+
+# Confidence of a skill only mentioned outside TITLED_SECTIONS
+UNTITLED_CONFIDENCE = 0.8
+
+
+def extract_job_skills(job_id: int, text: str, snapshot: CatalogSnapshot) -> list[dict]:
+    """job_skills rows for one job's cleaned text, one per skill mentioned."""
+    spans = JobSectionExtractor.extract_sections(text).spans
+    skills: dict[int, dict] = {}
+    for hit in snapshot.matcher.find(text, spans=spans):
+        importance = SECTION_IMPORTANCE.get(hit.section, "PREFERRED")
+        row = skills.get(hit.skill_id)
+        if row is None:
+            skills[hit.skill_id] = {
+                "job_id": job_id,
+                "skill_id": hit.skill_id,
+                "importance": importance,
+                "source_section": hit.section,
+                "mention_count": 1,
+            }
+            continue
+        row["mention_count"] += 1
+        if IMPORTANCE_RANK[importance] > IMPORTANCE_RANK[row["importance"]]:
+            row["importance"] = importance
+            row["source_section"] = hit.section
+    for row in skills.values():
+        row["confidence"] = 1.0 if row["source_section"] in TITLED_SECTIONS else UNTITLED_CONFIDENCE
+    return list(skills.values())
+
+
+@dataclass
+class WorkerBatchReport:
+    """One claimed batch."""
+    claimed: int
+    processed: int
+    failed: int
+    skills: int
+    elapsed_ms: int
+
+
+class JobSkillWorker:
+    """
+    Claims and processes unprocessed jobs in batches until stopped.
+
+    Sessions come from session_factory (the app's by default), the catalog
+    from the shared skill_catalog snapshot.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        catalog: Optional[SkillCatalog] = None,
+        batch_size: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self.catalog = catalog or skill_catalog
+        self.batch_size = batch_size or settings.skill_worker_batch_size
+        self.idle_seconds = idle_seconds or settings.skill_worker_idle_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def claim_query(self):
+        """The next batch_size unprocessed jobs not locked by another worker."""
+        return (
+            select(JOBS_TABLE.c.id, JOBS_TABLE.c.cleaned_text, JOBS_TABLE.c.raw_text)
+            .where(JOBS_TABLE.c.is_processed.is_(False), JOBS_TABLE.c.processing_error.is_(None))
+            .order_by(JOBS_TABLE.c.id)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+    async def process_batch(self) -> WorkerBatchReport:
+        """Claim, extract and store one batch in a single transaction."""
+        start = time.perf_counter()
+        snapshot = self.catalog.snapshot
+        async with self._session() as session:
+            async with session.begin():
+                jobs = (await session.execute(self.claim_query())).all()
+                if not jobs:
+                    return WorkerBatchReport(0, 0, 0, 0, 0)
+
+                rows, outcomes = [], []
+                for job_id, cleaned_text, raw_text in jobs:
+                    try:
+                        text = cleaned_text or TextCleaner.clean_job_text(raw_text or "")
+                        job_rows = extract_job_skills(job_id, text, snapshot)
+                    except Exception as e:
+                        logger.exception(f"Skill extraction failed for job {job_id}")
+                        outcomes.append({"b_id": job_id, "b_processed": False, "b_error": f"Skill extraction failed: {e}"})
+                        continue
+                    rows.extend(job_rows)
+                    outcomes.append({"b_id": job_id, "b_processed": True, "b_error": None})
+
+                # Reprocessed jobs drop the skills of their previous run
+                await session.execute(
+                    delete(JOB_SKILLS_TABLE).where(JOB_SKILLS_TABLE.c.job_id.in_([job_id for job_id, _, _ in jobs]))
+                )
+                if rows:
+                    await session.execute(insert(JOB_SKILLS_TABLE), rows)
+                await session.execute(
+                    update(JOBS_TABLE)
+                    .where(JOBS_TABLE.c.id == bindparam("b_id"))
+                    .values(is_processed=bindparam("b_processed"), processing_error=bindparam("b_error")),
+                    outcomes,
+                )
+
+        failed = sum(1 for outcome in outcomes if not outcome["b_processed"])
+        return WorkerBatchReport(
+            claimed=len(jobs),
+            processed=len(jobs) - failed,
+            failed=failed,
+            skills=len(rows),
+            elapsed_ms=int((time.perf_counter() - start) * 1000),
+        )
+
+    async def run(self) -> None:
+        """Process batches back to back, sleeping idle_seconds when the queue is empty."""
+        while True:
+            try:
+                if not self.catalog.loaded:
+                    await self.catalog.refresh()
+                report = await self.process_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Transaction rolled back (or the catalog is not loaded yet), tried again later
+                logger.error(f"Skill worker batch failed: {e}")
+                await asyncio.sleep(self.idle_seconds)
+                continue
+            if report.claimed:
+                logger.info(
+                    f"Skill worker: {report.processed} jobs processed, {report.failed} failed, "
+                    f"{report.skills} skills in {report.elapsed_ms} ms"
+                )
+            if report.claimed < self.batch_size:
+                await asyncio.sleep(self.idle_seconds)
+
+    def start(self) -> None:
+        """Run in the background of the current event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _session(self) -> AsyncSession:
+        if self.session_factory is None:
+            from app.core.database import async_session_factory
+
+            self.session_factory = async_session_factory
+        return self.session_factory()
+
+
+# Singleton instance
+job_skill_worker = JobSkillWorker()
@@ -3,13 +3,22 @@ PDF text extraction and resume parsing service.
 """
 
 import re 
+import asyncio
 import hashlib 
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, BinaryIO
+from typing import AsyncIterator, Optional, BinaryIO, Union
 import logging 
 
+from app.core.config import get_settings
+
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 @dataclass
 class ExtractedResume:
@@ -24,10 +33,204 @@ class ExtractedResume:
     extraction_method: str = "pdfplumber"
     errors: list[str] = field(default_factory=list)
 
-class PDFextractor:
+@dataclass
+class ExtractedPage:
+    """
+    One page of a streamed PDF extraction.
+    """
+    page_number: int
+    page_count: int
+    text: str
+    lines: list[str]
+    bullet_points: list[dict]
+    errors: list[str] = field(default_factory=list)
+
+def _page_count(path: str) -> int:
+    """
+    Number of pages of a PDF file, without extracting any text.
+
+    Runs inside a worker process, like _extract_page_range.
+    """
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+def _extract_page_range(path: str, start: int, stop: int) -> tuple[list[str], list[str]]:
+    """
+    Extract text from pages [start, stop) of a PDF file.
+
+    Runs inside a worker process, so it must stay a picklable module-level
+    function; it gets the file's path rather than its bytes, so only the path
+    is pickled per task. Returns the text of each page in the range and any
+    per-page errors.
+    """
+    import pdfplumber 
+
+    pages_text = []
+    errors = []
+
+    with pdfplumber.open(path) as pdf:
+        stop = min(stop, len(pdf.pages))
+
+        for i in range(start, stop):
+            try:
+                text = pdf.pages[i].extract_text() or ""
+                pages_text.append(text)
+            except Exception as e:
+                errors.append(f"Page {i+1}: {str(e)}")
+                pages_text.append("")
+    return pages_text, errors
+
+def hash_file(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+@asynccontextmanager
+async def _pdf_path(source: Union[bytes, str, Path]) -> AsyncIterator[str]:
+    """
+    Path of a PDF given as a path or as bytes.
+
+    Bytes are written to a temporary file, removed on exit, so workers can
+    open the document themselves instead of receiving it pickled.
+    """
+    if not isinstance(source, (bytes, bytearray)):
+        yield str(source)
+        return
+
+    def write() -> str:
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(source)
+            return f.name
+
+    path = await asyncio.to_thread(write)
+    try:
+        yield path
+    finally:
+        Path(path).unlink(missing_ok=True)
+
+class PDFExtractionEngine:
+    """
+    Runs pdfplumber page extraction in a bounded process pool.
+
+    A worker first reads the page count, then every page range is submitted
+    to the pool at once. Workers open the PDF from a file path.
+    """
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pages_per_task: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.max_workers = settings.pdf_extract_workers if max_workers is None else max_workers
+        self.pages_per_task = max(1, settings.pdf_extract_pages_per_task if pages_per_task is None else pages_per_task)
+        self.timeout = settings.pdf_extract_timeout_seconds if timeout is None else timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Process pool, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def extract_pages(self, source: Union[bytes, str, Path]) -> tuple[int, list[str], list[str]]:
+        """
+        Extract the text of every page of a PDF, given as bytes or a file path.
+
+        Raises asyncio.TimeoutError if the whole document takes longer than the
+        configured timeout. Pages already running in a worker are not interrupted,
+        their results are discarded.
+        """
+        async with _pdf_path(source) as path:
+            try:
+                return await asyncio.wait_for(self._extract_pages(path), timeout=self.timeout)
+            except BrokenProcessPool:
+                # A worker died (e.g. pdfminer crashed), start a fresh pool next time
+                logger.error("PDF extraction pool is broken, recreating it")
+                self.shutdown()
+                raise
+
+    async def _extract_pages(self, path: str) -> tuple[int, list[str], list[str]]:
+        loop = asyncio.get_running_loop()
+        step = self.pages_per_task
+
+        page_count = await loop.run_in_executor(self.executor, _page_count, path)
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _extract_page_range, path, start, start + step)
+            for start in range(0, page_count, step)
+        ))
+        pages_text, errors = [], []
+        for range_text, range_errors in results:
+            pages_text.extend(range_text)
+            errors.extend(range_errors)
+        return page_count, pages_text, errors
+
+    async def iter_page_ranges(
+        self, 
+        source: Union[bytes, str, Path], 
+        pages_per_task: Optional[int] = None,
+    ) -> AsyncIterator[tuple[int, int, list[str], list[str]]]:
+        """
+        Yield (first_page_index, page_count, pages_text, errors) per page range, in page order.
+
+        At most max_workers ranges are in flight at once, so a slow consumer
+        does not pile up extracted text. The timeout applies to the whole document.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        step = max(1, self.pages_per_task if pages_per_task is None else pages_per_task)
+
+        def remaining() -> float:
+            return max(0.0, deadline - loop.time())
+
+        pending: deque[tuple[int, asyncio.Future]] = deque()
+        async with _pdf_path(source) as path:
+            try:
+                page_count = await asyncio.wait_for(
+                    loop.run_in_executor(self.executor, _page_count, path), timeout=remaining()
+                )
+                starts = iter(range(0, page_count, step))
+                for start in starts:
+                    pending.append((start, loop.run_in_executor(
+                        self.executor, _extract_page_range, path, start, start + step
+                    )))
+                    if len(pending) >= self.max_workers:
+                        break
+
+                while pending:
+                    start, future = pending.popleft()
+                    pages_text, errors = await asyncio.wait_for(future, timeout=remaining())
+
+                    # Keep the pool busy while the consumer handles this range
+                    next_start = next(starts, None)
+                    if next_start is not None:
+                        pending.append((next_start, loop.run_in_executor(
+                            self.executor, _extract_page_range, path, next_start, next_start + step
+                        )))
+                    yield start, page_count, pages_text, errors
+            except BrokenProcessPool:
+                logger.error("PDF extraction pool is broken, recreating it")
+                self.shutdown()
+                raise
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+class PDFExtractor:
     """
     Extract text from PDF resumes.
-    Uses pdfplumber for extraction.
+    Uses pdfplumber for extraction, run in a process pool by PDFExtractionEngine.
     """
     BULLET_POINTS = [
         re.compile(r'^[\s]*[•●○◦▪▸►‣⁃]\s*(.+)$'),
@@ -53,83 +256,60 @@ class PDFextractor:
     )
     
     @classmethod
-    async def extract_from_file(cls, file_path: Path) -> ExtractedResume:
+    async def extract_from_file(cls, file_path: Path, file_hash: Optional[str] = None) -> ExtractedResume:
         """
         Extract text from a PDF file.
-        """
-        import pdfplumber 
-
-        errors=[]
-        raw_text =""
-        page_count=0
 
+        Workers read the file themselves, its content is never held in memory
+        here. Pass file_hash when the caller has already hashed the content.
+        """
         try:
-            with open(file_path, 'rb') as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-            
-            with pdfplumber.open(file_path) as pdf:
-                page_count = len(pdf.pages)
-                pages_text = []
-
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        text = page.extract_text() or ""
-                        pages_text.append(text)
-                    except Exception as e:
-                        errors.append(f"Page {i+1}: {str(e)}")
-                        pages_text.append("")
-                raw_text ='\n\n'.join(pages_text)
+            file_hash = file_hash or await asyncio.to_thread(hash_file, file_path)
         except Exception as e:
-            logger.error(f"Failed to extract PDF: {str(e)}")
-            errors.append(f"Extraction failed: {str(e)}")
+            logger.error(f"Failed to read PDF: {str(e)}")
             return ExtractedResume(
                 raw_text="",
                 lines=[],
                 bullet_points=[],
                 page_count=0,
                 file_hash="",
-                errors=errors,
+                errors=[f"Extraction failed: {str(e)}"],
             )
-        #Process extratcted text
-        lines = cls._segment_lines(raw_text)
-        bullet_points =cls._extract_bullet_points(lines)
-
-        return ExtractedResume(
-            raw_text = raw_text,
-            lines = lines,
-            bullet_points = bullet_points,
-            page_count = page_count,
-            file_hash = file_hash,
-            errors = errors,
-        )
+        return await cls._extract(Path(file_path), Path(file_path).name, file_hash)
     
     @classmethod
-    async def extract_from_bytes(cls, file_content: bytes, filename:str = "resume.pdf")->ExtractedResume:
+    async def extract_from_bytes(
+        cls, 
+        file_content: bytes, 
+        filename:str = "resume.pdf", 
+        file_hash: Optional[str] = None,
+    )->ExtractedResume:
         """
         Extract text from PDF bytes.
+
+        Page extraction runs in the shared process pool so the event loop
+        stays free while pdfplumber works. Pass file_hash when the caller has
+        already hashed the content.
         """
-        import pdfplumber 
-        from io import BytesIO
+        file_hash = file_hash or hashlib.sha256(file_content).hexdigest()
+        return await cls._extract(file_content, filename, file_hash)
 
+    @classmethod
+    async def _extract(cls, source: Union[bytes, Path], filename: str, file_hash: str) -> ExtractedResume:
         errors=[]
-        raw_text =""
-        page_count=0
-
-        file_hash = hashlib.sha256(file_content).hexdigest()
-
         try:
-            with pdfplumber.open(BytesIO(file_content)) as pdf:
-                page_count = len(pdf.pages)
-                pages_text = []
-
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        text = page.extract_text() or ""
-                        pages_text.append(text)
-                    except Exception as e:
-                        errors.append(f"Page {i+1}: {str(e)}")
-                        pages_text.append("")
-                raw_text ='\n\n'.join(pages_text)
+            page_count, pages_text, errors = await pdf_engine.extract_pages(source)
+        except asyncio.TimeoutError:
+            logger.error(f"PDF extraction timed out for {filename}")
+            errors.append(f"Extraction timed out after {pdf_engine.timeout:g} seconds")
+            return ExtractedResume(
+                raw_text="",
+                lines=[],
+                bullet_points=[],
+                page_count=0,
+                file_hash=file_hash,
+                errors=errors,
+            )
         except Exception as e:
             logger.error(f"PDF extraction failed: {e}")
             errors.append(f"Extraction failed: {str(e)}")
@@ -141,6 +321,8 @@ class PDFextractor:
                 file_hash=file_hash,
                 errors=errors,
             )
+        raw_text ='\n\n'.join(pages_text)
+
         # Process extracted text
         lines = cls._segment_lines(raw_text)
         bullet_points =cls._extract_bullet_points(lines)
@@ -153,7 +335,41 @@ class PDFextractor:
             errors = errors,
         )
     @classmethod
-    def _segmet_lines(cls, raw_text:str) -> list[str]:
+    async def iter_pages(
+        cls, 
+        source: Union[bytes, str, Path], 
+        pages_per_task: int = 1,
+    ) -> AsyncIterator[ExtractedPage]:
+        """
+        Extract a PDF, given as bytes or a file path, page by page.
+
+        Yields each page's lines and bullet points as soon as it and every page
+        before it are extracted. Line numbers and section context run across
+        pages, so the concatenated output equals extract_from_bytes. The
+        iterator keeps no page after yielding it and at most max_workers
+        ranges are in flight; a caller that collects the pages holds them all.
+
+        Raises asyncio.TimeoutError if the document exceeds the extraction timeout.
+        """
+        classifier = ResumeLineClassifier()
+
+        async for start, page_count, pages_text, errors in pdf_engine.iter_page_ranges(
+            source, pages_per_task
+        ):
+            for offset, text in enumerate(pages_text):
+                page_number = start + offset + 1
+                lines = cls._segment_lines(text)
+                yield ExtractedPage(
+                    page_number = page_number,
+                    page_count = page_count,
+                    text = text,
+                    lines = lines,
+                    bullet_points = classifier.classify(lines),
+                    errors = [e for e in errors if e.startswith(f"Page {page_number}:")],
+                )
+
+    @classmethod
+    def _segment_lines(cls, raw_text:str) -> list[str]:
         """
         Segment text into meaningful lines.
         """
@@ -187,56 +403,131 @@ class PDFextractor:
         """
         Extract bullet points with context.
         """
-        bullet_points=[]
-        current_context=None 
-        current_section=None
+        return ResumeLineClassifier().classify(lines)
 
-        for i, line in enumerate(lines):
-            # Check for section headers
-            for section, pattern in cls.SECTION_PATTERNS.items():
-                if pattern.match(line):
-                    current_section = section
-                    current_context = None  
-                    break
+class ResumeLineClassifier:
+    """
+    Single-pass line classifier behind PDFExtractor._extract_bullet_points.
 
-                if current_section=='experience':
-                    company_match=cls.COMPANY_TITLE_PATTERN.match(line)
-                    if company_match:
-                        current_context = f"{company_match.group(1).strip()} - {company_match.group(2).strip()}"
-                        break
-                
-                for pattern in cls.BULLET_POINTS:
-                    match = pattern.match(line)
-                    if match:
-                        bullet_text = match.group(1).strip() if match.groups() else line.strip()
-                        
-                        if len(bullet_text) < 5:
-                            continue
-
-                        bullet_points.append({
-                            'text': bullet_text,
-                            'line_number': i,
-                            'context': current_context,
-                            'section': current_section,
-                        })
-                        break
-                else:
-                    if (current_section == 'experience' and 
-                    len(line) > 30 and 
-                    not any(p.match(line) for p in cls.SECTION_PATTERNS.values())):
-                        # Heuristic: Lines with action verbs at start are likely accomplishments
-                        if re.match(r'^(Developed|Built|Created|Implemented|Managed|Led|Designed|'
-                                r'Improved|Increased|Reduced|Achieved|Delivered|Launched|Established)',
-                                line, re.I):
-                            bullet_points.append({
-                                "text": line,
-                                "context": current_context,
-                                "line_number": i,
-                                "section": current_section,
-                            })
-            
+    Every line is matched once against one alternation with a named group per
+    line kind. Inside the experience section the alternation also carries the
+    company/title pattern and the action verb heuristic. The current section
+    and company context are carried from line to line, so the classifier can
+    be fed a document in several pieces (e.g. page by page).
+    """
+    # Heuristic: Lines with action verbs at start are likely accomplishments
+    ACTION_VERB_PATTERN = re.compile(
+        r'^(Developed|Built|Created|Implemented|Managed|Led|Designed|'
+        r'Improved|Increased|Reduced|Achieved|Delivered|Launched|Established)',
+        re.I
+    )
+
+    # Compiled by _compile(). Alternatives keep the old precedence: section
+    # header > company/title > bullet marker (BULLET_POINTS order) > action verb,
+    # except that inside the experience section only the experience header
+    # comes before company/title, so "Projects Lead - Acme Corp" is a title
+    LINE_PATTERN: re.Pattern = None
+    LINE_KINDS: dict[str, tuple[str, object]] = {}
+    EXPERIENCE_LINE_PATTERN: re.Pattern = None
+    EXPERIENCE_LINE_KINDS: dict[str, tuple[str, object]] = {}
+
+    def __init__(self, line_offset: int = 0):
+        self.line_number = line_offset
+        self.current_section: Optional[str] = None
+        self.current_context: Optional[str] = None
+
+    @classmethod
+    def _compile(cls) -> None:
+        """Build the combined patterns from PDFExtractor's patterns."""
+        cls.LINE_PATTERN, cls.LINE_KINDS = cls._combine(experience=False)
+        cls.EXPERIENCE_LINE_PATTERN, cls.EXPERIENCE_LINE_KINDS = cls._combine(experience=True)
+
+    @classmethod
+    def _combine(cls, experience: bool) -> tuple[re.Pattern, dict]:
+        headers = [
+            (section, pattern, 'section', section)
+            for section, pattern in PDFExtractor.SECTION_PATTERNS.items()
+        ]
+        if experience:
+            company = ('company', PDFExtractor.COMPANY_TITLE_PATTERN, 'company', None)
+            alternatives = [
+                *(header for header in headers if header[0] == 'experience'),
+                company,
+                *(header for header in headers if header[0] != 'experience'),
+            ]
+        else:
+            alternatives = headers
+        alternatives.extend(
+            (f"bullet_{i}", pattern, 'bullet', None)
+            for i, pattern in enumerate(PDFExtractor.BULLET_POINTS)
+        )
+        if experience:
+            alternatives.append(('action_verb', cls.ACTION_VERB_PATTERN, 'action_verb', None))
+
+        parts = []
+        kinds = {}
+        group = 0
+        for name, pattern, kind, value in alternatives:
+            flags = '(?i:' if pattern.flags & re.I else '(?:'
+            parts.append(f"(?P<{name}>{flags}{pattern.pattern}))")
+            # Groups of the wrapped pattern directly follow the named group
+            if kind == 'bullet':
+                value = group + 2
+            elif kind == 'company':
+                value = (group + 2, group + 3)
+            kinds[name] = (kind, value)
+            group += 1 + pattern.groups
+        return re.compile('|'.join(parts)), kinds
+
+    def classify(self, lines: list[str]) -> list[dict]:
+        """
+        Classify lines and return the bullet points found in them.
+        """
+        bullet_points = []
+        current_section = self.current_section
+        current_context = self.current_context
+
+        for i, line in enumerate(lines, start=self.line_number):
+            if current_section == 'experience':
+                match = self.EXPERIENCE_LINE_PATTERN.match(line)
+                kinds = self.EXPERIENCE_LINE_KINDS
+            else:
+                match = self.LINE_PATTERN.match(line)
+                kinds = self.LINE_KINDS
+            if not match:
+                continue
+            kind, value = kinds[match.lastgroup]
+
+            if kind == 'section':
+                current_section = value
+                current_context = None
+            elif kind == 'company':
+                current_context = f"{match.group(value[0]).strip()} - {match.group(value[1]).strip()}"
+            elif kind == 'bullet':
+                bullet_text = match.group(value).strip()
+                if len(bullet_text) >= 5:
+                    bullet_points.append({
+                        'text': bullet_text,
+                        'line_number': i,
+                        'context': current_context,
+                        'section': current_section,
+                    })
+            elif len(line) > 30:
+                # Action verb line in the experience section
+                bullet_points.append({
+                    "text": line,
+                    "context": current_context,
+                    "line_number": i,
+                    "section": current_section,
+                })
+
+        self.line_number += len(lines)
+        self.current_section = current_section
+        self.current_context = current_context
         return bullet_points
 
+ResumeLineClassifier._compile()
+
 class ResumeParser:
     """
     Parsed structured data from resume text.    
@@ -258,7 +549,7 @@ class ResumeParser:
         current_section ='summary'
 
         for line in lines:
-            for section, pattern in PDFextractor.SECTION_PATTERNS.items():
+            for section, pattern in PDFExtractor.SECTION_PATTERNS.items():
                 if pattern.match(line):
                     current_section = section
                     break
@@ -313,4 +604,8 @@ class ResumeParser:
                 if skill and len(skill) > 1 and len(skill) < 50:
                     skills.append(skill)
         
-        return skills
\ No newline at end of file
+        return skills
+
+
+# Singleton instance
+pdf_engine = PDFExtractionEngine()
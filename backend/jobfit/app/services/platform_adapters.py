@@ -0,0 +1,240 @@
+"""
+Public JSON job APIs of the ATS platforms URLIngestService detects.
+
+Each adapter rewrites a posting URL on its platform to the platform's public
+job API and maps the JSON answer to job text and JobMetadata, keeping the
+platform's own fields (departments, teams, employment type, ...) alongside.
+The JSON is a fraction of the size of the HTML page and needs no DOM parse.
+
+- Greenhouse: boards-api.greenhouse.io/v1/boards/{board}/jobs/{id}
+- Lever: api.lever.co/v0/postings/{site}/{id}
+- Ashby: api.ashbyhq.com/posting-api/job-board/{org}, the whole board; Ashby
+  has no public per-posting endpoint
+"""
+import re
+from dataclasses import dataclass, field
+from html import escape
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from app.services.structured_data import description_to_text, title_metadata
+from app.services.text_cleaner import JobMetadata
+
+
+@dataclass
+class PlatformPosting:
+    """A posting read from a platform API."""
+    text: str
+    metadata: JobMetadata
+    external_id: Optional[str] = None
+    fields: dict = field(default_factory=dict)  # platform-specific extras
+
+
+class PlatformAdapter:
+    """
+    Base class: URL rewriting and JSON mapping for one platform.
+
+    board_level adapters fetch every posting of a board in one response, so
+    URLIngestService keeps those responses briefly for the next posting of
+    the same board.
+    """
+    platform = "base"
+    board_level = False
+
+    def api_url(self, url: str) -> Optional[str]:
+        """The API URL for a posting URL, or None if the URL is not a posting."""
+        raise NotImplementedError
+
+    def parse(self, data: Any, url: str) -> Optional[PlatformPosting]:
+        """Map the API response to a posting, None if it does not contain it."""
+        raise NotImplementedError
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _names(items: Any) -> list[str]:
+    return [item["name"] for item in items or [] if isinstance(item, dict) and item.get("name")]
+
+
+class GreenhouseAdapter(PlatformAdapter):
+    """Greenhouse Job Board API, one posting per request."""
+    platform = "greenhouse"
+
+    URL_PATTERN = re.compile(r'^(?:job-)?boards\.greenhouse\.io$', re.I)
+    PATH_PATTERN = re.compile(r'^/([\w-]+)/jobs/(\d+)')
+    API_URL = "https://boards-api.greenhouse.io/v1/boards/{board}/jobs/{job_id}?pay_transparency=true"
+
+    def api_url(self, url: str) -> Optional[str]:
+        parts = urlsplit(url)
+        if not self.URL_PATTERN.match(parts.hostname or ""):
+            return None
+        match = self.PATH_PATTERN.match(parts.path)
+        if match:
+            return self.API_URL.format(board=match.group(1), job_id=match.group(2))
+        # Embedded application form: /embed/job_app?for={board}&token={id}
+        query = parse_qs(parts.query)
+        if parts.path.startswith("/embed/job_app") and query.get("for") and query.get("token"):
+            return self.API_URL.format(board=query["for"][0], job_id=query["token"][0])
+        return None
+
+    def parse(self, data: Any, url: str) -> Optional[PlatformPosting]:
+        if not isinstance(data, dict) or not data.get("content"):
+            return None
+        metadata = title_metadata(data.get("title") or "")
+        metadata.company = data.get("company_name") or None
+        metadata.location = (data.get("location") or {}).get("name") or None
+        if metadata.location and "remote" in metadata.location.lower():
+            metadata.remote_type = metadata.remote_type or "remote"
+
+        pay_ranges = data.get("pay_input_ranges") or []
+        if pay_ranges:
+            low, high = _int(pay_ranges[0].get("min_cents")), _int(pay_ranges[0].get("max_cents"))
+            metadata.salary_min = low // 100 if low is not None else None
+            metadata.salary_max = high // 100 if high is not None else None
+            metadata.salary_currency = pay_ranges[0].get("currency_type") or None
+
+        return PlatformPosting(
+            text=description_to_text(data["content"]),
+            metadata=metadata,
+            external_id=str(data["id"]) if data.get("id") else None,
+            fields={
+                "departments": _names(data.get("departments")),
+                "offices": _names(data.get("offices")),
+                "requisition_id": data.get("requisition_id"),
+                "updated_at": data.get("updated_at"),
+                "custom_fields": {
+                    item["name"]: item.get("value")
+                    for item in data.get("metadata") or [] if isinstance(item, dict) and item.get("name")
+                },
+            },
+        )
+
+
+class LeverAdapter(PlatformAdapter):
+    """Lever Postings API, one posting per request."""
+    platform = "lever"
+
+    URL_PATTERN = re.compile(r'^jobs\.(eu\.)?lever\.co$', re.I)
+    PATH_PATTERN = re.compile(r'^/([\w.-]+)/([0-9a-f-]{36})(?:/apply)?/?$', re.I)
+    API_URL = "https://api.{region}lever.co/v0/postings/{site}/{posting_id}"
+
+    # Lever workplaceType to JobMetadata.remote_type
+    WORKPLACE_TYPES = {"remote": "remote", "hybrid": "hybrid", "on-site": "onsite", "onsite": "onsite"}
+
+    def api_url(self, url: str) -> Optional[str]:
+        parts = urlsplit(url)
+        host = self.URL_PATTERN.match(parts.hostname or "")
+        match = self.PATH_PATTERN.match(parts.path)
+        if not host or not match:
+            return None
+        return self.API_URL.format(region=host.group(1) or "", site=match.group(1), posting_id=match.group(2))
+
+    def parse(self, data: Any, url: str) -> Optional[PlatformPosting]:
+        if not isinstance(data, dict) or not (data.get("description") or data.get("lists")):
+            return None
+        categories = data.get("categories") or {}
+
+        # Description, then each titled list, then the closing section, as on the page
+        html = [data.get("description") or ""]
+        for section in data.get("lists") or []:
+            html.append(f"<h3>{escape(section.get('text') or '')}</h3><ul>{section.get('content') or ''}</ul>")
+        html.append(data.get("additional") or "")
+
+        metadata = title_metadata(data.get("text") or "")
+        metadata.location = categories.get("location") or None
+        metadata.remote_type = self.WORKPLACE_TYPES.get(
+            (data.get("workplaceType") or "").lower(), metadata.remote_type
+        )
+        salary = data.get("salaryRange") or {}
+        if salary.get("interval") == "per-year-salary":
+            metadata.salary_min = _int(salary.get("min"))
+            metadata.salary_max = _int(salary.get("max"))
+            metadata.salary_currency = salary.get("currency") or None
+
+        return PlatformPosting(
+            text=description_to_text("".join(html)),
+            metadata=metadata,
+            external_id=data.get("id"),
+            fields={
+                "commitment": categories.get("commitment"),
+                "department": categories.get("department"),
+                "team": categories.get("team"),
+                "all_locations": categories.get("allLocations") or [],
+                "workplace_type": data.get("workplaceType"),
+                "created_at": data.get("createdAt"),
+                "apply_url": data.get("applyUrl"),
+            },
+        )
+
+
+class AshbyAdapter(PlatformAdapter):
+    """Ashby public job posting API, which returns a whole job board."""
+    platform = "ashby"
+    board_level = True
+
+    URL_PATTERN = re.compile(r'^jobs\.ashbyhq\.com$', re.I)
+    PATH_PATTERN = re.compile(r'^/([^/]+)/([0-9a-f-]{36})(?:/application)?/?$', re.I)
+    API_URL = "https://api.ashbyhq.com/posting-api/job-board/{org}?includeCompensation=true"
+
+    WORKPLACE_TYPES = {"remote": "remote", "hybrid": "hybrid", "onsite": "onsite"}
+
+    def api_url(self, url: str) -> Optional[str]:
+        parts = urlsplit(url)
+        match = self.PATH_PATTERN.match(parts.path)
+        if not self.URL_PATTERN.match(parts.hostname or "") or not match:
+            return None
+        return self.API_URL.format(org=match.group(1))
+
+    def parse(self, data: Any, url: str) -> Optional[PlatformPosting]:
+        match = self.PATH_PATTERN.match(urlsplit(url).path)
+        if not match or not isinstance(data, dict):
+            return None
+        posting_id = match.group(2).lower()
+        job = next((job for job in data.get("jobs") or [] if str(job.get("id", "")).lower() == posting_id), None)
+        if job is None or not job.get("descriptionHtml"):
+            return None
+
+        metadata = title_metadata(job.get("title") or "")
+        locations = [job.get("location")] + [
+            item.get("location") for item in job.get("secondaryLocations") or [] if isinstance(item, dict)
+        ]
+        metadata.location = "; ".join(dict.fromkeys(location for location in locations if location)) or None
+        workplace_type = (job.get("workplaceType") or "").lower()
+        if job.get("isRemote") and not workplace_type:
+            workplace_type = "remote"
+        metadata.remote_type = self.WORKPLACE_TYPES.get(workplace_type, metadata.remote_type)
+
+        compensation = job.get("compensation") or {}
+        salary = next((
+            component for component in compensation.get("summaryComponents") or []
+            if component.get("compensationType") == "Salary" and component.get("interval") == "1 YEAR"
+        ), None)
+        if salary:
+            metadata.salary_min = _int(salary.get("minValue"))
+            metadata.salary_max = _int(salary.get("maxValue"))
+            metadata.salary_currency = salary.get("currencyCode") or None
+
+        return PlatformPosting(
+            text=description_to_text(job["descriptionHtml"]),
+            metadata=metadata,
+            external_id=job.get("id"),
+            fields={
+                "department": job.get("department"),
+                "team": job.get("team"),
+                "employment_type": job.get("employmentType"),
+                "workplace_type": job.get("workplaceType"),
+                "published_at": job.get("publishedAt"),
+                "apply_url": job.get("applyUrl"),
+                "compensation_summary": compensation.get("compensationTierSummary"),
+            },
+        )
+
+
+ADAPTERS: dict[str, PlatformAdapter] = {
+    adapter.platform: adapter for adapter in (GreenhouseAdapter(), LeverAdapter(), AshbyAdapter())
+}
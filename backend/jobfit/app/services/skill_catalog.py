@@ -0,0 +1,284 @@
+"""
+Versioned in-memory snapshot of the skills catalog.
+
+Skill matching and scoring need the whole skills table on every request.
+CatalogSnapshot holds it once per worker as immutable slotted records with
+id and name indexes and the SkillMatcher built from them. Readers take
+`skill_catalog.snapshot` once and keep using that object, so a reload never
+changes a catalog under a request that is using it.
+
+The catalog version is a counter in the Redis instance named by
+Settings.redis_url. bump_catalog_version() increments it after the skills
+table changes (seed_skills.py calls it), and each worker's refresher polls
+it every skill_catalog_check_seconds, loads the table again when it moved
+and swaps the new snapshot in with one assignment. Without Redis, workers
+reload every skill_catalog_max_age_seconds instead.
+"""
+import asyncio
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, Optional
+
+from sqlalchemy import JSON, column, select, table
+
+from app.core.config import get_settings
+from app.services.skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+VERSION_KEY = "jobfit:skill_catalog:version"
+
+# The columns of the skills table the snapshot keeps, read without the ORM
+SKILLS_TABLE = table(
+    "skills",
+    column("id"),
+    column("canonical_name"),
+    column("display_name"),
+    column("category"),
+    column("aliases", JSON),
+    column("related_skills", JSON),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SkillRecord:
+    """One skill of the catalog snapshot."""
+    id: int
+    canonical_name: str
+    display_name: Optional[str]
+    category: str
+    aliases: tuple[str, ...]
+    related_skills: tuple[str, ...]
+
+
+class CatalogSnapshot:
+    """Immutable skills catalog at one version."""
+
+    __slots__ = ("version", "records", "loaded_at", "matcher", "_by_id", "_by_term")
+
+    def __init__(self, records: Iterable[SkillRecord], version: int = 0):
+        self.version = version
+        self.records: tuple[SkillRecord, ...] = tuple(records)
+        self.loaded_at = time.time()
+        self._by_id = {record.id: record for record in self.records}
+        # Canonical names, display names and aliases, lowercased
+        self._by_term: dict[str, SkillRecord] = {}
+        for record in self.records:
+            for term in (*record.aliases, record.display_name, record.canonical_name):
+                if term:
+                    self._by_term[term.lower()] = record
+        self.matcher = SkillMatcher(
+            (record.id, record.canonical_name, (record.display_name or "", *record.aliases))
+            for record in self.records
+        )
+
+    @classmethod
+    def from_records(cls, records: list[dict], version: int = 0) -> "CatalogSnapshot":
+        """
+        Build from skills table rows or seed-file dicts.
+
+        Records without an "id" are numbered from 1 in order, as in
+        SkillMatcher.from_records.
+        """
+        return cls(
+            (
+                SkillRecord(
+                    id=record.get("id", index),
+                    canonical_name=record["canonical_name"],
+                    display_name=record.get("display_name"),
+                    category=str(record.get("category") or "other"),
+                    aliases=tuple(str(alias) for alias in record.get("aliases") or ()),
+                    related_skills=tuple(str(skill) for skill in record.get("related_skills") or ()),
+                )
+                for index, record in enumerate(records, start=1)
+            ),
+            version=version,
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, skill_id: int) -> Optional[SkillRecord]:
+        return self._by_id.get(skill_id)
+
+    def lookup(self, name: str) -> Optional[SkillRecord]:
+        """The skill a canonical name, display name or alias belongs to."""
+        return self._by_term.get(name.strip().lower())
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by this snapshot, its indexes and matcher."""
+        seen = set()
+        stack = [self.records, self._by_id, self._by_term, *self.matcher.__dict__.values()]
+        total = sys.getsizeof(self)
+        while stack:
+            item = stack.pop()
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            total += sys.getsizeof(item)
+            if isinstance(item, dict):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+            elif isinstance(item, SkillRecord):
+                stack.extend(getattr(item, name) for name in SkillRecord.__slots__)
+        return total
+
+
+async def load_catalog_rows() -> list[dict]:
+    """Read the skills table as plain rows."""
+    from app.core.database import async_session_factory
+
+    async with async_session_factory() as session:
+        result = await session.execute(select(SKILLS_TABLE).order_by(SKILLS_TABLE.c.id))
+        return [dict(row) for row in result.mappings()]
+
+
+class SkillCatalog:
+    """
+    Holds the current CatalogSnapshot of a worker and swaps in new versions.
+
+    The loader and version reader default to the skills table and the Redis
+    counter; tests and scripts can pass their own.
+    """
+
+    # Seconds to wait before trying Redis again after a connection failure
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], Awaitable[list[dict]]]] = None,
+        version_reader: Optional[Callable[[], Awaitable[Optional[int]]]] = None,
+        check_seconds: Optional[float] = None,
+        max_age_seconds: Optional[float] = None,
+        redis_url: Optional[str] = None,
+    ):
+        self.loader = loader or load_catalog_rows
+        self.version_reader = version_reader or self._read_redis_version
+        self.check_seconds = check_seconds or settings.skill_catalog_check_seconds
+        self.max_age_seconds = max_age_seconds or settings.skill_catalog_max_age_seconds
+        self.redis_url = redis_url or settings.redis_url
+        self.swaps = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._redis = None
+        self._redis_available = True
+        self._redis_retry_at = 0.0
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """The current snapshot; take it once per request and keep the reference."""
+        if self._snapshot is None:
+            raise RuntimeError("Skill catalog not loaded yet, await refresh() first")
+        return self._snapshot
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Load the catalog again if its version moved, or if it is too old
+        when no version is available. Returns True if a new snapshot was swapped in.
+        """
+        async with self._lock:
+            version = await self.version_reader()
+            current = self._snapshot
+            if current is not None and not force:
+                if version is not None and version == current.version:
+                    return False
+                if version is None and time.time() - current.loaded_at < self.max_age_seconds:
+                    return False
+
+            start = time.perf_counter()
+            rows = await self.loader()
+            # Building the matcher is CPU work, keep it off the event loop
+            snapshot = await asyncio.to_thread(
+                CatalogSnapshot.from_records, rows, version if version is not None else 0
+            )
+            self._snapshot = snapshot
+            self.swaps += 1
+            logger.info(
+                f"Skill catalog v{snapshot.version}: {len(snapshot)} skills, "
+                f"{snapshot.matcher.term_count} terms, {snapshot.memory_bytes() / 1024:.0f} KB, "
+                f"loaded in {(time.perf_counter() - start) * 1000:.0f} ms"
+            )
+            return True
+
+    def start(self) -> None:
+        """Poll for new versions in the background; call once the event loop runs."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Keep serving the snapshot we have
+                logger.error(f"Skill catalog refresh failed: {e}")
+            await asyncio.sleep(self.check_seconds)
+
+    async def _read_redis_version(self) -> Optional[int]:
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            value = await client.get(VERSION_KEY)
+        except Exception as e:
+            logger.warning(f"Skill catalog version read failed: {e}")
+            self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+            return None
+        return int(value) if value is not None else 0
+
+    def _get_redis(self):
+        if not self._redis_available or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            try:
+                import redis.asyncio as redis_asyncio
+            except ImportError:
+                logger.warning("redis package not installed, skill catalog reloads by age only")
+                self._redis_available = False
+                return None
+            self._redis = redis_asyncio.from_url(self.redis_url, socket_connect_timeout=1.0)
+        return self._redis
+
+
+async def bump_catalog_version(redis_url: Optional[str] = None) -> Optional[int]:
+    """
+    Mark the skills table as changed, so every worker reloads its snapshot.
+
+    Returns the new version, or None if Redis is not reachable (workers then
+    pick the change up within skill_catalog_max_age_seconds).
+    """
+    try:
+        import redis.asyncio as redis_asyncio
+    except ImportError:
+        return None
+    client = redis_asyncio.from_url(redis_url or settings.redis_url, socket_connect_timeout=1.0)
+    try:
+        return await client.incr(VERSION_KEY)
+    except Exception as e:
+        logger.warning(f"Skill catalog version bump failed: {e}")
+        return None
+    finally:
+        await client.aclose()
+
+
+# Singleton instance
+skill_catalog = SkillCatalog()
@@ -0,0 +1,229 @@
+"""
+Skill mention matching against the canonical skills catalog.
+
+Every canonical name, display name and alias in the catalog is compiled into
+one Aho-Corasick automaton over word tokens. Text is lowercased and split
+into runs of letters/digits and single punctuation characters, whitespace
+dropped, so "Node.js", "node.js" and "node . js" are the same three tokens
+and a term only ever matches whole words: "go" does not match inside
+"google", "java" does not match inside "javascript". The scan visits each
+token once, so its cost depends on the length of the text and the number of
+mentions, not on the size of the catalog.
+
+Overlapping mentions are resolved leftmost-longest: "node.js" wins over the
+"js" inside it, "asp.net core" over "asp.net". A term shared by several
+skills (e.g. "tf") yields one hit per skill.
+"""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Runs of letters/digits, or one punctuation character
+TOKEN_PATTERN = re.compile(r'[^\W_]+|[^\w\s]|_')
+
+SEED_FILE = Path(__file__).resolve().parents[1] / "data" / "skills_seed.yml"
+
+
+@dataclass
+class SkillHit:
+    """One skill mention, as offsets into the scanned text."""
+    skill_id: int
+    canonical_name: str
+    start: int
+    end: int
+    section: Optional[str] = None  # job section name or resume section of the text
+
+
+def _lower(text: str) -> str:
+    """Lowercase text without changing character offsets."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters lowercase to two ("İ"), keep those as they are
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def tokenize(text: str) -> list[tuple[str, int, int]]:
+    """(token, start, end) for each word token of the text, lowercased."""
+    return [(match.group(), match.start(), match.end()) for match in TOKEN_PATTERN.finditer(_lower(text))]
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over the catalog's terms.
+
+    Built once per catalog and read-only afterwards, so one instance can be
+    shared by concurrent requests.
+    """
+
+    def __init__(self, skills: Iterable[tuple[int, str, Iterable[str]]]):
+        """
+        Args:
+            skills: (skill_id, canonical_name, terms) per skill; the canonical
+                name is matched too
+        """
+        self.names: dict[int, str] = {}
+        # Node 0 is the root; per node: token -> child, failure link, output
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Output of a node: (term length in tokens, skill ids) for the term ending there
+        self._output: list[Optional[tuple[int, tuple[int, ...]]]] = [None]
+        # Nearest node down the failure chain that has an output
+        self._output_link: list[int] = [0]
+        self.term_count = 0
+
+        for skill_id, canonical_name, terms in skills:
+            self.names[skill_id] = canonical_name
+            for term in {canonical_name, *terms}:
+                self._add_term(term, skill_id)
+        self._build_links()
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "SkillMatcher":
+        """
+        Build from seed-file style dicts (canonical_name, display_name, aliases).
+
+        Records without an "id" are numbered from 1 in file order.
+        """
+        return cls(
+            (
+                record.get("id", index),
+                record["canonical_name"],
+                [record.get("display_name") or "", *(str(alias) for alias in record.get("aliases") or [])],
+            )
+            for index, record in enumerate(records, start=1)
+        )
+
+    @classmethod
+    def from_seed_file(cls, path: Optional[Path] = None) -> "SkillMatcher":
+        """Build from skills_seed.yml, numbering skills in file order."""
+        import yaml
+
+        with open(path or SEED_FILE, encoding="utf-8") as f:
+            return cls.from_records(yaml.safe_load(f).get("skills", []))
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[Any]) -> "SkillMatcher":
+        """Build from Skill rows."""
+        return cls(
+            (skill.id, skill.canonical_name, [skill.display_name or "", *(skill.aliases or [])])
+            for skill in skills
+        )
+
+    @classmethod
+    async def load(cls, db: AsyncSession) -> "SkillMatcher":
+        """Build from the skills table."""
+        from app.models.skill import Skill
+
+        result = await db.execute(select(Skill.id, Skill.canonical_name, Skill.display_name, Skill.aliases))
+        return cls(
+            (skill_id, canonical_name, [display_name or "", *(aliases or [])])
+            for skill_id, canonical_name, display_name, aliases in result.all()
+        )
+
+    def find(self, text: str, section: Optional[str] = None, spans: Optional[list] = None) -> list[SkillHit]:
+        """
+        Skill mentions in text, in text order.
+
+        Args:
+            text: Job cleaned_text, a resume bullet or any other text
+            section: Section name given to every hit
+            spans: Job section spans (SectionSpan or their dicts, as in
+                clean_and_parse_job()["sections"]["spans"]); a hit gets the
+                name of the span it starts in
+        """
+        tokens = tokenize(text)
+        goto, fail, output, output_link = self._goto, self._fail, self._output, self._output_link
+
+        # (first token, last token, skill ids) of every term occurrence
+        matches = []
+        state = 0
+        for position, (token, _, _) in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            node = state if output[state] else output_link[state]
+            while node:
+                length, skill_ids = output[node]
+                matches.append((position - length + 1, position, skill_ids))
+                node = output_link[node]
+        if not matches:
+            return []
+
+        # Leftmost-longest, non-overlapping
+        matches.sort(key=lambda match: (match[0], -match[1]))
+        span_starts, span_names = self._section_index(spans)
+        hits = []
+        next_free = 0
+        for first, last, skill_ids in matches:
+            if first < next_free:
+                continue
+            next_free = last + 1
+            start, end = tokens[first][1], tokens[last][2]
+            hit_section = section
+            if span_starts:
+                index = bisect_right(span_starts, start) - 1
+                hit_section = span_names[index] if index >= 0 else section
+            for skill_id in skill_ids:
+                hits.append(SkillHit(skill_id, self.names[skill_id], start, end, hit_section))
+        return hits
+
+    def find_in_bullets(self, bullets: list[dict]) -> list[list[SkillHit]]:
+        """
+        Skill mentions per resume bullet point, offsets into each bullet's text.
+
+        Bullets are the dicts ResumeParser returns; their section is the hits' section.
+        """
+        return [self.find(bullet.get("text") or "", section=bullet.get("section")) for bullet in bullets]
+
+    def _add_term(self, term: str, skill_id: int) -> None:
+        tokens = [token for token, _, _ in tokenize(term)]
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            child = self._goto[node].get(token)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][token] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._output_link.append(0)
+            node = child
+        previous = self._output[node]
+        if previous is None:
+            self._output[node] = (len(tokens), (skill_id,))
+            self.term_count += 1
+        elif skill_id not in previous[1]:
+            self._output[node] = (len(tokens), previous[1] + (skill_id,))
+
+    def _build_links(self) -> None:
+        """Breadth-first failure and output links."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                fail = self._fail[child]
+                self._output_link[child] = fail if self._output[fail] else self._output_link[fail]
+
+    @staticmethod
+    def _section_index(spans: Optional[list]) -> tuple[list[int], list[str]]:
+        if not spans:
+            return [], []
+        starts, names = [], []
+        for span in spans:
+            start, name = (span["start"], span["name"]) if isinstance(span, dict) else (span.start, span.name)
+            starts.append(start)
+            names.append(name)
+        return starts, names
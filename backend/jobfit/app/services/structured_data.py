@@ -0,0 +1,205 @@
+"""
+schema.org JobPosting extraction from JSON-LD blocks.
+
+Greenhouse, Lever, Ashby, Workable and most career site generators embed the
+posting as <script type="application/ld+json">. When a page has one,
+URLIngestService takes the description and metadata from it instead of
+parsing the DOM and regex-guessing title, company, location and salary.
+
+The script blocks are found with a regex over the raw HTML, no DOM is built.
+"""
+import json
+import logging
+import re
+from dataclasses import dataclass
+from html import unescape
+from typing import Any, Optional
+
+from app.services.html_extract import BLOCK_TAGS, tidy_text
+from app.services.text_cleaner import JobMetadata, JobMetadataExtractor
+
+logger = logging.getLogger(__name__)
+
+LD_JSON_PATTERN = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.I | re.S,
+)
+
+TAG_PATTERN = re.compile(r'<!--.*?-->|<(/?)([a-zA-Z][a-zA-Z0-9]*)\b[^>]*>', re.S)
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# baseSalary.value.unitText values kept as annual salaries
+ANNUAL_UNITS = {None, "YEAR", "ANNUAL", "YEARLY"}
+
+
+@dataclass
+class StructuredJobPosting:
+    """Description text and metadata read from a JobPosting block."""
+    text: str
+    metadata: JobMetadata
+
+
+def extract_job_posting(html: str) -> Optional[StructuredJobPosting]:
+    """
+    Return the first JobPosting with a description embedded in the page, if any.
+    """
+    for match in LD_JSON_PATTERN.finditer(html):
+        data = _load_json(match.group(1))
+        posting = _find_job_posting(data) if data is not None else None
+        if posting is None:
+            continue
+        description = posting.get("description")
+        if not isinstance(description, str) or not description.strip():
+            continue
+        return StructuredJobPosting(
+            text=description_to_text(description),
+            metadata=job_posting_metadata(posting),
+        )
+    return None
+
+
+def description_to_text(description: str) -> str:
+    """
+    Flatten a JobPosting description (HTML, often entity-escaped) to text.
+
+    Uses the same markers as HTMLTextExtractor: a line break before block
+    elements and "• " before list items.
+    """
+    if '<' not in description and '&lt;' in description:
+        description = unescape(description)
+
+    parts = []
+    position = 0
+    for match in TAG_PATTERN.finditer(description):
+        parts.append(WHITESPACE_PATTERN.sub(' ', unescape(description[position:match.start()])))
+        position = match.end()
+        tag = match.group(2)
+        if tag and not match.group(1):
+            tag = tag.lower()
+            if tag in BLOCK_TAGS:
+                parts.append('\n')
+            elif tag == 'li':
+                parts.append('\n• ')
+    parts.append(WHITESPACE_PATTERN.sub(' ', unescape(description[position:])))
+    return tidy_text(parts)
+
+
+def job_posting_metadata(posting: dict) -> JobMetadata:
+    """
+    Map JobPosting properties onto JobMetadata.
+
+    Seniority, role type and remote type have no schema.org property, they come
+    from the metadata patterns run over the title only. A TELECOMMUTE
+    jobLocationType marks the job remote.
+    """
+    metadata = title_metadata(_text(posting.get("title")))
+    metadata.company = _text(_name(posting.get("hiringOrganization")))
+    metadata.location = _location(posting.get("jobLocation"))
+    location_types = posting.get("jobLocationType")
+    if "TELECOMMUTE" in (location_types if isinstance(location_types, list) else [location_types]):
+        metadata.remote_type = "remote"
+
+    salary = posting.get("baseSalary") or posting.get("estimatedSalary")
+    if isinstance(salary, list):
+        salary = salary[0] if salary else None
+    if isinstance(salary, dict):
+        value = salary.get("value")
+        if isinstance(value, dict):
+            unit = value.get("unitText")
+            low, high = value.get("minValue"), value.get("maxValue")
+            if low is None and high is None:
+                low = high = value.get("value")
+        else:
+            unit, low, high = salary.get("unitText"), value, value
+        if (unit.upper() if isinstance(unit, str) else unit) in ANNUAL_UNITS:
+            metadata.salary_min = _int(low)
+            metadata.salary_max = _int(high)
+            if metadata.salary_min or metadata.salary_max:
+                metadata.salary_currency = _text(salary.get("currency")) or None
+
+    return metadata
+
+
+def title_metadata(title: str) -> JobMetadata:
+    """
+    JobMetadata with the title and what the metadata patterns find in it.
+
+    For sources that give the description and the metadata separately, where
+    only the title is worth scanning for seniority, role and remote type.
+    """
+    if not title:
+        return JobMetadata()
+    metadata = JobMetadataExtractor.extract_metadata(title, title)
+    metadata.hits = []
+    metadata.salary_min = metadata.salary_max = metadata.salary_currency = None
+    return metadata
+
+
+def _load_json(payload: str) -> Any:
+    payload = payload.strip()
+    # Some generators still wrap the block in a CDATA section or HTML comment
+    for prefix, suffix in (("<![CDATA[", "]]>"), ("<!--", "-->")):
+        if payload.startswith(prefix) and payload.endswith(suffix):
+            payload = payload[len(prefix):-len(suffix)].strip()
+    try:
+        # strict=False accepts the raw newlines some descriptions contain
+        return json.loads(payload, strict=False)
+    except ValueError as e:
+        logger.debug(f"Skipping invalid JSON-LD block: {e}")
+        return None
+
+
+def _find_job_posting(data: Any, depth: int = 0) -> Optional[dict]:
+    """Find a JobPosting in a JSON-LD document, a list of them or an @graph."""
+    if depth > 3:
+        return None
+    if isinstance(data, list):
+        for item in data:
+            posting = _find_job_posting(item, depth + 1)
+            if posting is not None:
+                return posting
+        return None
+    if not isinstance(data, dict):
+        return None
+    types = data.get("@type")
+    if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+        return data
+    if "@graph" in data:
+        return _find_job_posting(data["@graph"], depth + 1)
+    return None
+
+
+def _text(value: Any) -> str:
+    return WHITESPACE_PATTERN.sub(' ', unescape(value)).strip() if isinstance(value, str) else ""
+
+
+def _name(value: Any) -> Any:
+    return value.get("name") if isinstance(value, dict) else value
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(float(str(value).replace(",", "")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _location(value: Any) -> Optional[str]:
+    """Join the locality, region and country of each jobLocation Place."""
+    places = value if isinstance(value, list) else [value]
+    locations = []
+    for place in places:
+        address = place.get("address") if isinstance(place, dict) else place
+        if isinstance(address, dict):
+            fields = (
+                address.get("addressLocality"),
+                address.get("addressRegion"),
+                _name(address.get("addressCountry")),
+            )
+            location = ", ".join(dict.fromkeys(text for text in map(_text, fields) if text))
+        else:
+            location = _text(address) or _text(_name(place))
+        if location and location not in locations:
+            locations.append(location)
+    return "; ".join(locations) or None
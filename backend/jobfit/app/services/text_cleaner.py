@@ -2,9 +2,20 @@
 Text cleaning and metadata extraction service for job descriptions.
 """
 import re
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field, replace
 from typing import Optional
 from html import unescape
+from itertools import chain
+
+
+@dataclass
+class MetadataHit:
+    """One metadata pattern match, as offsets into the scanned text."""
+    dimension: str  # seniority, role_type, remote_type or salary
+    label: str
+    start: int
+    end: int
 
 
 @dataclass
@@ -19,6 +30,16 @@ class JobMetadata:
     salary_min: Optional[int] = None
     salary_max: Optional[int] = None
     salary_currency: Optional[str] = None
+    hits: list[MetadataHit] = field(default_factory=list)
+
+
+@dataclass
+class SectionSpan:
+    """One section of a job description, as offsets into the text."""
+    name: str  # requirements, nice_to_have, responsibilities, benefits or other
+    header: str
+    start: int  # first character after the header line
+    end: int
 
 
 @dataclass
@@ -28,6 +49,7 @@ class ExtractedSections:
     nice_to_have: Optional[str] = None
     responsibilities: Optional[str] = None
     benefits: Optional[str] = None
+    spans: list[SectionSpan] = field(default_factory=list)
 
 
 class TextCleaner:
@@ -79,6 +101,16 @@ class TextCleaner:
         re.compile(r'^[\s]*(accept|reject)\s*(all\s*)?cookies[\s]*$', re.I | re.MULTILINE),
     ]
     
+    # All boilerplate patterns as one alternation, tried in list order. Every
+    # pattern starts with ^[\s]* and none continues with whitespace, so the
+    # shared prefix is matched once instead of once per pattern.
+    BOILERPLATE_PATTERN = re.compile(
+        r'^[\s]*(?:' + '|'.join(
+            '(?:' + pattern.pattern.removeprefix(r'^[\s]*') + ')' for pattern in BOILERPLATE_PATTERNS
+        ) + ')',
+        re.I | re.MULTILINE
+    )
+    
     # Unicode replacements
     UNICODE_REPLACEMENTS = {
         '\u2019': "'",  # Right single quote
@@ -124,8 +156,7 @@ class TextCleaner:
             text = text.replace(old, new)
         
         # De-boilerplate scrub - remove common job board UI junk
-        for pattern in cls.BOILERPLATE_PATTERNS:
-            text = pattern.sub('', text)
+        text = cls._remove_boilerplate(text)
         
         # Normalize whitespace (preserve newlines for structure)
         text = cls.MULTI_SPACE_PATTERN.sub(' ', text)
@@ -137,6 +168,43 @@ class TextCleaner:
         
         return text.strip()
     
+    @classmethod
+    def _remove_boilerplate(cls, text: str) -> str:
+        """
+        Remove boilerplate lines with one scan of BOILERPLATE_PATTERN.
+        
+        The patterns' whitespace runs can span newlines, so applying them one
+        after another is not always the same as one combined pass: removing
+        one junk line can let a later pattern match across the gap. That only
+        happens when a match spans several lines, two matches are separated
+        by whitespace alone, or the scrubbed text still matches. Those
+        texts are scrubbed pattern by pattern as before.
+        """
+        matches = list(cls.BOILERPLATE_PATTERN.finditer(text))
+        if not matches:
+            return text
+        
+        pieces = []
+        position = 0
+        sequential = False
+        for match in matches:
+            gap = text[position:match.start()]
+            if (position and (not gap or gap.isspace())) or '\n' in match.group().strip():
+                sequential = True
+                break
+            pieces.append(gap)
+            position = match.end()
+        
+        if not sequential:
+            pieces.append(text[position:])
+            scrubbed = ''.join(pieces)
+            if not cls.BOILERPLATE_PATTERN.search(scrubbed):
+                return scrubbed
+        
+        for pattern in cls.BOILERPLATE_PATTERNS:
+            text = pattern.sub('', text)
+        return text
+    
     @classmethod
     def clean_resume_text(cls, raw_text: str) -> str:
         """
@@ -172,6 +240,50 @@ class TextCleaner:
         return text.strip()
 
 
+def _lookahead_alternations(patterns: list[re.Pattern], flags: int) -> list[re.Pattern]:
+    """
+    Compile lookahead alternations for scanning with several patterns at once.
+    
+    Pattern i is captured by group p<i>. Element i of the result tries
+    patterns[i:], so after a hit on pattern i the same position can be
+    re-checked for the rest (see _iter_lookahead_hits). Runs of patterns
+    with the same leading anchor (\\b or ^) share one anchor in front of
+    their lookaheads, which keeps the scan cheap where the anchor fails.
+    """
+    def alternation(start: int) -> re.Pattern:
+        parts = []
+        run_anchor, run = None, []
+        for i in range(start, len(patterns)):
+            source = patterns[i].pattern
+            anchor = next((a for a in (r'\b', '^') if source.startswith(a)), '')
+            if anchor != run_anchor and run:
+                parts.append(run_anchor + '(?:' + '|'.join(run) + ')')
+                run = []
+            run_anchor = anchor
+            run.append(f'(?=(?P<p{i}>{source[len(anchor):]}))')
+        if run:
+            parts.append(run_anchor + '(?:' + '|'.join(run) + ')')
+        return re.compile('|'.join(parts) or r'(?!)', flags)
+    
+    return [alternation(i) for i in range(len(patterns) + 1)]
+
+
+def _iter_lookahead_hits(alternations: list[re.Pattern], text: str, matches):
+    """
+    Yield (pattern index, start, end) for every pattern matching where one
+    of matches (from alternations[0]) matched, in pattern order.
+    """
+    for match in matches:
+        if not match:
+            continue
+        position = match.start()
+        while match:
+            index = int(match.lastgroup[1:])
+            yield index, position, position + len(match.group(match.lastgroup))
+            # Patterns after this one may match at the same position too
+            match = alternations[index + 1].match(text, position)
+
+
 class JobMetadataExtractor:
     """Extract metadata from job descriptions using heuristics and patterns."""
     
@@ -218,6 +330,38 @@ class JobMetadataExtractor:
         re.I
     )
     
+    # Dimensions filled from METADATA_PATTERNS: the first label (in dict
+    # order) with a match anywhere in the text wins
+    DIMENSIONS = {
+        'seniority': SENIORITY_PATTERNS,
+        'role_type': ROLE_PATTERNS,
+        'remote_type': REMOTE_PATTERNS,
+    }
+    
+    # Every (dimension, label, pattern) in priority order, salary last
+    METADATA_PATTERNS = [
+        (dimension, label, pattern)
+        for dimension, patterns in DIMENSIONS.items()
+        for label, pattern in patterns.items()
+    ] + [('salary', 'salary', SALARY_PATTERN)]
+    
+    # Every METADATA_PATTERNS match starts with one of these (lowercased
+    # text), so scan() only tries the patterns where a trigger begins.
+    # Triggers consume one word at most, so none can hide the next one.
+    # Keep in sync when adding patterns.
+    TRIGGERS = (
+        # Seniority
+        'intern', 'junior', 'jr', 'entry', 'associate', 'mid', 'intermediate', 'senior', 'sr',
+        'staff', 'principal', 'lead', 'tech', 'manager', 'engineering', 'director', 'vp', 'vice',
+        # Role type
+        'back', 'server', 'front', 'ui', 'user', r'full(?=[\s-]?stack)', r'dev(?=[\s-]?ops)', 'platform',
+        'sre', 'site', 'data', 'ml', 'machine', 'mobile', 'ios', 'android', 'security', 'infosec',
+        'cybersecurity', 'qa', 'quality', 'test', 'sdet',
+        # Remote type
+        r'full(?=y?\s*remote)', '100', 'remote', 'hybrid', 'flex', r'on(?=[\s-]?site)', r'in(?=[\s-]?office)', 'office',
+    )
+    TRIGGER_PATTERN = re.compile(r'\b(?:' + '|'.join(TRIGGERS) + r')|\$')
+    
     # Title extraction patterns (first line often contains title)
     TITLE_PATTERN = re.compile(
         r'^(.{10,100}?(engineer|developer|architect|scientist|manager|director|lead|analyst|designer))',
@@ -243,26 +387,22 @@ class JobMetadataExtractor:
             if title_match:
                 metadata.title = title_match.group(1).strip()
         
-        # Extract seniority (check full text)
-        for level, pattern in cls.SENIORITY_PATTERNS.items():
-            if pattern.search(text):
-                metadata.seniority = level
-                break
+        # Seniority, role type, remote type and salary in one scan
+        metadata.hits = cls.scan(text)
         
-        # Extract role type
-        for role, pattern in cls.ROLE_PATTERNS.items():
-            if pattern.search(text):
-                metadata.role_type = role
-                break
+        labels = {}
+        for hit in metadata.hits:
+            current = labels.get(hit.dimension)
+            if current is None or cls._PRIORITY[hit.dimension, hit.label] < cls._PRIORITY[hit.dimension, current]:
+                labels[hit.dimension] = hit.label
         
-        # Extract remote type
-        for remote_type, pattern in cls.REMOTE_PATTERNS.items():
-            if pattern.search(text):
-                metadata.remote_type = remote_type
-                break
+        metadata.seniority = labels.get('seniority')
+        metadata.role_type = labels.get('role_type')
+        metadata.remote_type = labels.get('remote_type')
         
-        # Extract salary
-        salary_match = cls.SALARY_PATTERN.search(text)
+        # Extract salary (hits are in text order, so this is the first one)
+        salary_hit = next((hit for hit in metadata.hits if hit.dimension == 'salary'), None)
+        salary_match = cls.SALARY_PATTERN.match(text, salary_hit.start) if salary_hit else None
         if salary_match:
             groups = salary_match.groups()
             try:
@@ -283,6 +423,46 @@ class JobMetadataExtractor:
                 pass
         
         return metadata
+    
+    @classmethod
+    def scan(cls, text: str) -> list[MetadataHit]:
+        """
+        Find every match of every metadata pattern in one pass.
+        
+        A case-sensitive scan of the lowercased text for TRIGGERS finds the
+        candidate positions, then the patterns themselves are tried there.
+        Each pattern is wrapped in a lookahead, so matches never consume text
+        and overlapping hits are all reported. Hits come back ordered by
+        position, then by pattern priority.
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text) and 'ı' not in lowered and 'ſ' not in lowered:
+            candidates = cls.TRIGGER_PATTERN.finditer(lowered)
+            matches = (cls._SCAN_PATTERNS[0].match(text, trigger.start()) for trigger in candidates)
+        else:
+            # Case folding moved offsets or re.I folds a character to ASCII
+            # (ı, ſ) that lower() keeps: try every position instead
+            matches = cls._SCAN_PATTERNS[0].finditer(text)
+        
+        hits = []
+        for index, start, end in _iter_lookahead_hits(cls._SCAN_PATTERNS, text, matches):
+            dimension, label, _ = cls.METADATA_PATTERNS[index]
+            hits.append(MetadataHit(dimension, label, start, end))
+        return hits
+    
+    @classmethod
+    def _compile(cls) -> None:
+        """Build the lookahead alternations used by scan()."""
+        cls._SCAN_PATTERNS = _lookahead_alternations(
+            [pattern for _, _, pattern in cls.METADATA_PATTERNS], re.I
+        )
+        cls._PRIORITY = {
+            (dimension, label): i
+            for i, (dimension, label, _) in enumerate(cls.METADATA_PATTERNS)
+        }
+
+
+JobMetadataExtractor._compile()
 
 
 class JobSectionExtractor:
@@ -326,46 +506,119 @@ class JobSectionExtractor:
         re.I | re.MULTILINE
     )
     
+    # Named headers in the order their fields are filled, SECTION_END last
+    HEADER_PATTERNS = {
+        'requirements': REQUIREMENTS_HEADERS,
+        'nice_to_have': NICE_TO_HAVE_HEADERS,
+        'responsibilities': RESPONSIBILITIES_HEADERS,
+        'benefits': BENEFITS_HEADERS,
+    }
+    
+    # Every header above starts with one of these after its bullets and
+    # whitespace. Keep in sync when adding headers.
+    HEADER_TRIGGERS = (
+        'requirement', 'qualification', r'what\s*(?:you|we)', 'must', 'minimum', 'nice', 'preferred',
+        'bonus', 'plus', 'desired', 'additional', 'responsibilities', 'role', 'duties',
+        r'the\s*(?:job|team)', 'benefits', 'perks', 'compensation', 'why', 'about', r'our\s*company',
+        r'how\s*to',
+    )
+    
+    # Newlines followed by a line that may be a header. The literal newline
+    # lets re skip from one line to the next, and the first-letter class
+    # rejects most lines before the triggers are tried one by one.
+    HEADER_LINE_PATTERN = re.compile(
+        r'\n(?=[\s•\-\*]*(?=[' + ''.join(sorted({trigger[0] for trigger in HEADER_TRIGGERS})) + '])'
+        r'(?:' + '|'.join(HEADER_TRIGGERS) + '))',
+        re.I
+    )
+    
     @classmethod
     def extract_sections(cls, text: str) -> ExtractedSections:
-        """Extract major sections from job description."""
-        sections = ExtractedSections()
+        """
+        Extract major sections from job description.
         
-        sections.requirements = cls._extract_section(text, cls.REQUIREMENTS_HEADERS)
-        sections.nice_to_have = cls._extract_section(text, cls.NICE_TO_HAVE_HEADERS)
-        sections.responsibilities = cls._extract_section(text, cls.RESPONSIBILITIES_HEADERS)
-        sections.benefits = cls._extract_section(text, cls.BENEFITS_HEADERS)
+        All header lines are found in one pass. Each named field runs from
+        the first matching header to the next SECTION_END header, or is the
+        next 2000 characters when there is none. spans lists every
+        recognised header in text order, each running to the next one.
+        """
+        sections = ExtractedSections()
+        names = list(cls.HEADER_PATTERNS)
         
-        return sections
-    
-    @classmethod
-    def _extract_section(cls, text: str, header_pattern: re.Pattern) -> Optional[str]:
-        """Extract a section starting from header pattern."""
-        match = header_pattern.search(text)
-        if not match:
-            return None
+        # Header patterns only match at line starts: the start of the text
+        # and after the newlines HEADER_LINE_PATTERN picks out
+        scan = cls._SCAN_PATTERNS[0]
+        line_starts = chain([0], (newline.end() for newline in cls.HEADER_LINE_PATTERN.finditer(text)))
+        matches = (scan.match(text, line_start) for line_start in line_starts)
         
-        start = match.end()
+        first_header = {}
+        section_ends = []
+        headers = {}
+        for index, start, end in _iter_lookahead_hits(cls._SCAN_PATTERNS, text, matches):
+            if index < len(names):
+                first_header.setdefault(names[index], end)
+            elif not section_ends or start >= section_ends[-1][1]:
+                # The matches SECTION_END.finditer would return
+                section_ends.append((start, end))
+            
+            # Every line start in the blank lines above a header matches too;
+            # they all end where the header line does
+            name = names[index] if index < len(names) else 'other'
+            header = headers.setdefault(end, [name, start])
+            header[1] = start
+            if header[0] == 'other':
+                header[0] = name
         
-        # Find next section header
-        remaining = text[start:]
-        end_match = cls.SECTION_END.search(remaining)
+        end_positions = [end for _, end in section_ends]
+        for name, start in first_header.items():
+            following = bisect_right(end_positions, start)
+            if following < len(section_ends):
+                section_text = text[start:max(start, section_ends[following][0])]
+            else:
+                # Take up to 2000 chars if no clear end
+                section_text = text[start:start + 2000]
+            setattr(sections, name, section_text.strip() or None)
         
-        if end_match:
-            section_text = remaining[:end_match.start()]
-        else:
-            # Take up to 2000 chars if no clear end
-            section_text = remaining[:2000]
+        header_ends = sorted(headers)
+        for i, end in enumerate(header_ends):
+            name, header_start = headers[end]
+            next_start = headers[header_ends[i + 1]][1] if i + 1 < len(header_ends) else len(text)
+            sections.spans.append(SectionSpan(
+                name=name,
+                header=text[header_start:end].strip(),
+                start=end,
+                end=max(end, next_start),
+            ))
         
-        return section_text.strip() if section_text.strip() else None
+        return sections
+    
+    @classmethod
+    def _compile(cls) -> None:
+        """Build the lookahead alternations used by extract_sections()."""
+        cls._SCAN_PATTERNS = _lookahead_alternations(
+            list(cls.HEADER_PATTERNS.values()) + [cls.SECTION_END], re.I | re.MULTILINE
+        )
+
 
+JobSectionExtractor._compile()
 
-def clean_and_parse_job(raw_text: str, title: Optional[str] = None) -> dict:
+
+def clean_and_parse_job(
+    raw_text: str,
+    title: Optional[str] = None,
+    metadata: Optional[JobMetadata] = None,
+) -> dict:
     """
     Full job text processing pipeline.
+
+    metadata that is already known (e.g. from a page's JSON-LD JobPosting)
+    is used as is instead of being extracted from the text.
     """
     cleaned = TextCleaner.clean_job_text(raw_text)
-    metadata = JobMetadataExtractor.extract_metadata(cleaned, title)
+    if metadata is None:
+        metadata = JobMetadataExtractor.extract_metadata(cleaned, title)
+    elif title:
+        metadata = replace(metadata, title=title)
     sections = JobSectionExtractor.extract_sections(cleaned)
     
     return {
@@ -380,11 +633,13 @@ def clean_and_parse_job(raw_text: str, title: Optional[str] = None) -> dict:
             "salary_min": metadata.salary_min,
             "salary_max": metadata.salary_max,
             "salary_currency": metadata.salary_currency,
+            "hits": [asdict(hit) for hit in metadata.hits],
         },
         "sections": {
             "requirements": sections.requirements,
             "nice_to_have": sections.nice_to_have,
             "responsibilities": sections.responsibilities,
             "benefits": sections.benefits,
+            "spans": [asdict(span) for span in sections.spans],
         }
     }
\ No newline at end of file
@@ -0,0 +1,257 @@
+"""
+HTTP validator cache for URL ingestion.
+
+Stores the ETag/Last-Modified of each fetched job page together with the text
+extracted from it, keyed on the normalized URL. URLIngestService sends them
+back as If-None-Match/If-Modified-Since and, on a 304, reuses the stored text
+without downloading or parsing the page again.
+
+Entries live in a local directory or in the Redis instance named by
+Settings.redis_url, chosen with Settings.url_cache_backend.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"gclid", "fbclid", "gh_src", "lever-source", "lever-origin"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Cache key form of a URL.
+
+    The scheme and host are lowercased, default ports, fragments, utm_* and
+    other tracking parameters are dropped, remaining parameters are sorted.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+@dataclass
+class CachedPage:
+    """Validators and extracted text of one job page."""
+    url: str
+    raw_text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    detected_platform: Optional[str]
+    content_length: int
+    stored_at: float
+    metadata: Optional[dict] = None  # JobMetadata fields from a JSON-LD JobPosting or platform API
+    external_id: Optional[str] = None
+    platform_fields: Optional[dict] = None
+    api_url: Optional[str] = None  # Set when the text came from a platform API, the validators are the API's
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class URLCacheStats:
+    """Counters since the process started."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+
+class URLResponseCache:
+    """
+    Conditional-GET cache for job pages, on disk or in Redis.
+
+    Disk entries expire after ttl_seconds and the oldest are evicted once the
+    directory grows past max_bytes. Redis entries expire with the key TTL and
+    size is left to the server's maxmemory policy. Redis is optional: if the
+    package is missing or the server is down, lookups are misses.
+    """
+
+    KEY_PREFIX = "jobfit:urlcache:"
+
+    # Dataclass stored per URL, with url, etag, last_modified, content_length and stored_at fields
+    ENTRY_TYPE = CachedPage
+
+    # Seconds to wait before trying Redis again after a connection failure
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        directory: Optional[Path] = None,
+        ttl_seconds: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        redis_url: Optional[str] = None,
+    ):
+        self.backend = backend or settings.url_cache_backend
+        if self.backend not in ("disk", "redis"):
+            raise ValueError(f"Unknown URL cache backend: {self.backend}")
+        self.directory = Path(directory or settings.url_cache_dir)
+        self.ttl_seconds = ttl_seconds or settings.url_cache_ttl_seconds
+        self.max_bytes = max_bytes or settings.url_cache_max_bytes
+        self.redis_url = redis_url or settings.redis_url
+        self.stats = URLCacheStats()
+        self._disk_bytes: Optional[int] = None
+        self._redis = None
+        self._redis_available = True
+        self._redis_retry_at = 0.0
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+    async def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for a URL if it has not expired."""
+        if self.backend == "redis":
+            payload = await self._redis_call("get", self.KEY_PREFIX + self.key(url))
+        else:
+            payload = await asyncio.to_thread(self._read_file, self.key(url))
+        if not payload:
+            return None
+        try:
+            page = self.ENTRY_TYPE(**json.loads(payload))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Discarding corrupt URL cache entry for {url}: {e}")
+            return None
+        if page.stored_at + self.ttl_seconds < time.time():
+            return None
+        return page
+
+    async def set(self, page: CachedPage) -> None:
+        """Store a page that came with an ETag or Last-Modified header."""
+        if not (page.etag or page.last_modified):
+            return
+        payload = json.dumps(asdict(page))
+        if self.backend == "redis":
+            await self._redis_call("set", self.KEY_PREFIX + self.key(page.url), payload, ex=self.ttl_seconds)
+        else:
+            await asyncio.to_thread(self._write_file, self.key(page.url), payload)
+        self.stats.stores += 1
+
+    def record_hit(self, page: CachedPage) -> None:
+        """A 304 was answered from this page, its body did not have to be downloaded."""
+        self.stats.hits += 1
+        self.stats.bytes_saved += page.content_length
+
+    def record_miss(self) -> None:
+        self.stats.misses += 1
+
+    # Disk backend
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_file(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            payload = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        # Reads count as use for eviction
+        os.utime(path)
+        return payload
+
+    def _write_file(self, key: str, payload: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A temp file of its own per write, concurrent stores of one key must not share one
+        tmp = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f"{key}.", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(payload)
+            try:
+                previous = path.stat().st_size
+            except FileNotFoundError:
+                previous = 0
+            os.replace(tmp.name, path)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(f.stat().st_size for f in self.directory.glob("*/*.json"))
+        else:
+            self._disk_bytes += path.stat().st_size - previous
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones, down to 90% of max_bytes."""
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        expired_before = time.time() - self.ttl_seconds
+        target = self.max_bytes * 0.9
+        for mtime, size, path in entries:
+            if total <= target and mtime >= expired_before:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+        self._disk_bytes = total
+
+    # Redis backend
+
+    async def _redis_call(self, method: str, *args, **kwargs):
+        """Run a Redis command, treating any failure as a cache miss."""
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            return await getattr(client, method)(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"URL cache Redis {method} failed: {e}")
+            self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+            return None
+
+    def _get_redis(self):
+        if not self._redis_available or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            try:
+                import redis.asyncio as redis_asyncio
+            except ImportError:
+                logger.warning("redis package not installed, URL cache is disabled")
+                self._redis_available = False
+                return None
+            self._redis = redis_asyncio.from_url(self.redis_url, socket_connect_timeout=1.0)
+        return self._redis
+
+
+# Singleton instance
+url_response_cache = URLResponseCache()
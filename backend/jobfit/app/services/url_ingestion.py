@@ -8,15 +8,27 @@ Handles:
 - Basic HTML parsing to extract job content
 """
 import re
+import codecs
+import json
 import logging
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
 from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+
+from app.core.config import get_settings
+from app.core.http_client import SharedHTTPClient, http_client
+from app.services.html_extract import HTMLTextExtractor, create_html_extractor
+from app.services.platform_adapters import ADAPTERS, PlatformAdapter
+from app.services.structured_data import extract_job_posting
+from app.services.text_cleaner import JobMetadata, MetadataHit
+from app.services.url_cache import CachedPage, URLResponseCache, url_response_cache
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 @dataclass
@@ -35,6 +47,27 @@ class URLIngestResult:
     content_length: int = 0
     fetch_time_ms: int = 0
     http_status: Optional[int] = None
+    retry_after: Optional[float] = None  # Seconds the server asked to wait, from Retry-After
+    from_cache: bool = False  # 304 answered from the URL cache
+    # Set when the text came from a JSON-LD JobPosting or a platform API instead of the DOM
+    metadata: Optional[JobMetadata] = None
+    # Set when the posting was read from the platform's JSON API
+    api_url: Optional[str] = None
+    external_id: Optional[str] = None
+    platform_fields: Optional[dict] = None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given as seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
 
 class URLIngestService:
@@ -86,26 +119,53 @@ class URLIngestService:
         'script', 'style', 'noscript',
     ]
     
+    # Headers for platform JSON APIs
+    API_HEADERS = {
+        'User-Agent': 'JobFit/1.0',
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip, deflate',
+    }
+    
+    # Board-level API responses (every posting of a board) may be larger than one page
+    MAX_API_CONTENT_LENGTH = 5_000_000
+    
+    # Seconds a board-level API response is reused for other postings of the board
+    BOARD_RESPONSE_TTL = 300.0
+    
+    # Board-level API responses kept at once
+    MAX_BOARD_RESPONSES = 16
+    
     def __init__(
         self,
         timeout: float = 15.0,
         max_content_length: int = 500_000,  # 500KB
+        cache: Optional[URLResponseCache] = None,
+        html_parser_engine: Optional[str] = None,
+        http: Optional[SharedHTTPClient] = None,
+        use_platform_apis: bool = True,
     ):
         self.timeout = timeout
         self.max_content_length = max_content_length
+        self.cache = cache
+        self.http = http or http_client
+        self.adapters: dict[str, PlatformAdapter] = ADAPTERS if use_platform_apis else {}
+        self._board_responses: dict[str, tuple[float, object]] = {}
+        self.html_extractor: HTMLTextExtractor = create_html_extractor(
+            html_parser_engine or settings.html_parser_engine,
+            self.REMOVE_SELECTORS,
+            self.JOB_CONTENT_SELECTORS,
+        )
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
             'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
         }
     
     async def ingest_url(self, url: str) -> URLIngestResult:
         """
         Attempt to fetch and parse a job description from a URL.
         """
-        import time
         start_time = time.time()
         
         # Validate URL
@@ -139,17 +199,41 @@ class URLIngestService:
                 fallback_message=f"This {platform.title()} job page requires JavaScript to load. Please copy and paste the job description text directly.",
             )
         
-        # Attempt to fetch
+        # Revalidate a cached copy instead of downloading the page again. An
+        # entry holds the validators of the response it came from, an API
+        # answer's ETag means nothing to the HTML page and the other way round
+        cached = await self.cache.get(url) if self.cache else None
+        
+        # Greenhouse, Lever and Ashby postings are read from the platform's JSON API,
+        # the HTML page is only fetched if the API has no such posting
+        adapter = self.adapters.get(platform)
+        api_url = adapter.api_url(url) if adapter else None
+        if api_url:
+            api_cached = cached if cached and cached.api_url == api_url else None
+            result = await self._ingest_from_api(url, api_url, adapter, api_cached, start_time)
+            if result is not None:
+                return result
+        
+        if cached and cached.api_url:
+            cached = None
+        headers = {**self.headers, **cached.conditional_headers()} if cached else self.headers
+        
+        # Attempt to fetch over the shared pooled client, streaming the body
         try:
-            async with httpx.AsyncClient(
+            async with self.http.stream(
+                "GET",
+                url,
+                headers=headers,
                 timeout=self.timeout,
                 follow_redirects=True,
-                headers=self.headers,
-            ) as client:
-                response = await client.get(url)
-                
+            ) as response:
                 fetch_time_ms = int((time.time() - start_time) * 1000)
                 
+                if cached and response.status_code == 304:
+                    return self._cached_result(url, cached, platform, fetch_time_ms)
+                if self.cache:
+                    self.cache.record_miss()
+                
                 # Check response
                 if response.status_code == 403:
                     return URLIngestResult(
@@ -179,14 +263,17 @@ class URLIngestService:
                         source_url=url,
                         detected_platform=platform,
                         http_status=response.status_code,
+                        retry_after=parse_retry_after(response.headers.get("retry-after")),
                         fetch_time_ms=fetch_time_ms,
                         error_message=f"HTTP {response.status_code}",
                         fallback_message="Could not access this page. Please copy and paste the job description text directly.",
                     )
                 
-                # Check content length
-                content_length = len(response.content)
-                if content_length > self.max_content_length:
+                # Read the body up to the size cap, a larger page is dropped as soon as
+                # it crosses the cap instead of being downloaded in full first
+                raw_html, content_length = await self._read_capped(response)
+                fetch_time_ms = int((time.time() - start_time) * 1000)
+                if raw_html is None:
                     return URLIngestResult(
                         success=False,
                         source_url=url,
@@ -197,37 +284,55 @@ class URLIngestService:
                         error_message="Page too large",
                         fallback_message="This page is too large to process. Please copy and paste the job description text directly.",
                     )
-                
-                raw_html = response.text
-                
-                # Parse HTML and extract text
+            
+            # Parse HTML and extract text, after the connection is back in the pool.
+            # A JSON-LD JobPosting carries the description and metadata already,
+            # the DOM is only parsed for pages without one.
+            metadata = None
+            posting = extract_job_posting(raw_html)
+            if posting and len(posting.text) >= 100:
+                raw_text, metadata = posting.text, posting.metadata
+            else:
                 raw_text = self._extract_job_text(raw_html, platform)
-                
-                # Check if we got meaningful content
-                if not raw_text or len(raw_text.strip()) < 100:
-                    return URLIngestResult(
-                        success=False,
-                        source_url=url,
-                        detected_platform=platform,
-                        raw_html=raw_html[:10000] if raw_html else None,  # Store partial for debugging
-                        http_status=200,
-                        content_length=content_length,
-                        fetch_time_ms=fetch_time_ms,
-                        requires_js=True,  # Likely JS-rendered
-                        fallback_message="This page appears to require JavaScript to display content. Please copy and paste the job description text directly.",
-                    )
-                
+            
+            # Check if we got meaningful content
+            if not raw_text or len(raw_text.strip()) < 100:
                 return URLIngestResult(
-                    success=True,
-                    raw_text=raw_text,
-                    raw_html=raw_html,
+                    success=False,
                     source_url=url,
                     detected_platform=platform,
+                    raw_html=raw_html[:10000] if raw_html else None,  # Store partial for debugging
                     http_status=200,
                     content_length=content_length,
                     fetch_time_ms=fetch_time_ms,
+                    requires_js=True,  # Likely JS-rendered
+                    fallback_message="This page appears to require JavaScript to display content. Please copy and paste the job description text directly.",
                 )
-                
+            
+            if self.cache:
+                await self.cache.set(CachedPage(
+                    url=url,
+                    raw_text=raw_text,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                    detected_platform=platform,
+                    content_length=content_length,
+                    stored_at=time.time(),
+                    metadata=asdict(metadata) if metadata else None,
+                ))
+            
+            return URLIngestResult(
+                success=True,
+                raw_text=raw_text,
+                raw_html=raw_html,
+                source_url=url,
+                detected_platform=platform,
+                http_status=200,
+                content_length=content_length,
+                fetch_time_ms=fetch_time_ms,
+                metadata=metadata,
+            )
+            
         except httpx.TimeoutException:
             return URLIngestResult(
                 success=False,
@@ -256,6 +361,205 @@ class URLIngestService:
                 fallback_message="An error occurred while fetching this page. Please copy and paste the job description text directly.",
             )
     
+    async def _ingest_from_api(
+        self,
+        url: str,
+        api_url: str,
+        adapter: PlatformAdapter,
+        cached: Optional[CachedPage],
+        start_time: float,
+    ) -> Optional[URLIngestResult]:
+        """
+        Read a posting from its platform's JSON API.
+        
+        Returns None when the API has no such posting (404) or its answer
+        cannot be parsed (oversized, not JSON, unexpected payload, no posting
+        text), so the caller falls back to the HTML page. Any other error
+        status or a failed request is the import's result, with http_status
+        set so throttling (429) and server errors (5xx) are retried.
+        """
+        data = None
+        content_length = 0
+        etag = last_modified = None
+        if adapter.board_level:
+            expires_at, data = self._board_responses.get(api_url, (0.0, None))
+            if expires_at < time.monotonic():
+                data = None
+        
+        if data is None:
+            headers = {**self.API_HEADERS, **cached.conditional_headers()} if cached else self.API_HEADERS
+            try:
+                async with self.http.stream(
+                    "GET",
+                    api_url,
+                    headers=headers,
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                ) as response:
+                    fetch_time_ms = int((time.time() - start_time) * 1000)
+                    if cached and response.status_code == 304:
+                        return self._cached_result(url, cached, adapter.platform, fetch_time_ms)
+                    if response.status_code == 404:
+                        logger.info(f"{adapter.platform} API has no posting for {url}")
+                        return None
+                    if response.status_code != 200:
+                        return URLIngestResult(
+                            success=False,
+                            source_url=url,
+                            detected_platform=adapter.platform,
+                            http_status=response.status_code,
+                            retry_after=parse_retry_after(response.headers.get("retry-after")),
+                            fetch_time_ms=fetch_time_ms,
+                            error_message=f"{adapter.platform.title()} API answered HTTP {response.status_code}",
+                            fallback_message="Could not load this job posting right now. Please try again later or paste the job description text directly.",
+                            api_url=api_url,
+                        )
+                    body, content_length = await self._read_capped(response, self.MAX_API_CONTENT_LENGTH)
+                    etag = response.headers.get("etag")
+                    last_modified = response.headers.get("last-modified")
+            except httpx.TimeoutException:
+                return URLIngestResult(
+                    success=False,
+                    source_url=url,
+                    detected_platform=adapter.platform,
+                    fetch_time_ms=int(self.timeout * 1000),
+                    error_message="Request timed out",
+                    fallback_message="The page took too long to load. Please copy and paste the job description text directly.",
+                    api_url=api_url,
+                )
+            except httpx.HTTPError as e:
+                logger.warning(f"{adapter.platform} API request for {url} failed: {e}")
+                return URLIngestResult(
+                    success=False,
+                    source_url=url,
+                    detected_platform=adapter.platform,
+                    error_message=str(e),
+                    fallback_message="Could not connect to this website. Please copy and paste the job description text directly.",
+                    api_url=api_url,
+                )
+            if body is None:
+                return None
+            try:
+                data = json.loads(body)
+            except ValueError as e:
+                logger.warning(f"{adapter.platform} API answered non-JSON for {url}: {e}")
+                return None
+            if adapter.board_level:
+                self._remember_board(api_url, data)
+        
+        try:
+            posting = adapter.parse(data, url)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Unexpected {adapter.platform} API response for {url}: {e}")
+            return None
+        if posting is None or len(posting.text) < 100:
+            return None
+        
+        if self.cache:
+            self.cache.record_miss()
+            await self.cache.set(CachedPage(
+                url=url,
+                raw_text=posting.text,
+                etag=etag,
+                last_modified=last_modified,
+                detected_platform=adapter.platform,
+                content_length=content_length,
+                stored_at=time.time(),
+                metadata=asdict(posting.metadata),
+                external_id=posting.external_id,
+                platform_fields=posting.fields,
+                api_url=api_url,
+            ))
+        
+        return URLIngestResult(
+            success=True,
+            raw_text=posting.text,
+            source_url=url,
+            detected_platform=adapter.platform,
+            http_status=200,
+            content_length=content_length,
+            fetch_time_ms=int((time.time() - start_time) * 1000),
+            metadata=posting.metadata,
+            api_url=api_url,
+            external_id=posting.external_id,
+            platform_fields=posting.fields,
+        )
+    
+    def _remember_board(self, api_url: str, data: object) -> None:
+        """
+        Keep a board-level API answer for BOARD_RESPONSE_TTL seconds.
+
+        Expired answers are dropped here, and the oldest beyond
+        MAX_BOARD_RESPONSES, since each may be several megabytes.
+        """
+        now = time.monotonic()
+        self._board_responses.pop(api_url, None)
+        # Insertion order is expiry order, every entry gets the same TTL
+        for key, (expires_at, _) in list(self._board_responses.items()):
+            if expires_at >= now and len(self._board_responses) < self.MAX_BOARD_RESPONSES:
+                break
+            del self._board_responses[key]
+        self._board_responses[api_url] = (now + self.BOARD_RESPONSE_TTL, data)
+    
+    def _cached_result(
+        self,
+        url: str,
+        cached: CachedPage,
+        platform: Optional[str],
+        fetch_time_ms: int,
+    ) -> URLIngestResult:
+        """Result for a 304 answer, built from the cached page."""
+        self.cache.record_hit(cached)
+        metadata = None
+        if cached.metadata:
+            hits = [MetadataHit(**hit) for hit in cached.metadata.get("hits", [])]
+            metadata = JobMetadata(**{**cached.metadata, "hits": hits})
+        return URLIngestResult(
+            success=True,
+            raw_text=cached.raw_text,
+            source_url=url,
+            detected_platform=platform,
+            http_status=304,
+            content_length=cached.content_length,
+            fetch_time_ms=fetch_time_ms,
+            from_cache=True,
+            metadata=metadata,
+            external_id=cached.external_id,
+            platform_fields=cached.platform_fields,
+        )
+    
+    async def _read_capped(
+        self,
+        response: httpx.Response,
+        max_length: Optional[int] = None,
+    ) -> tuple[Optional[str], int]:
+        """
+        Read and decode a streamed body of at most max_length bytes
+        (max_content_length by default).
+
+        Returns (text, bytes_read); text is None when the page is over the cap,
+        either by its Content-Length or once the bytes read cross it.
+        """
+        max_length = max_length or self.max_content_length
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > max_length:
+            return None, int(declared)
+        
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        
+        parts = []
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            if received > max_length:
+                return None, received
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts), received
+    
     def _detect_platform(self, url: str) -> Optional[str]:
         """Detect the job board/ATS platform from URL."""
         for platform, pattern in self.PLATFORM_PATTERNS.items():
@@ -268,64 +572,13 @@ class URLIngestService:
         Extract job description text from HTML.
         """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove unwanted elements
-            for selector in self.REMOVE_SELECTORS:
-                for element in soup.select(selector):
-                    element.decompose()
-            
-            # Try platform-specific and generic selectors
-            content = None
-            for selector, selector_platform in self.JOB_CONTENT_SELECTORS:
-                # Skip platform-specific selectors for other platforms
-                if selector_platform and selector_platform != platform:
-                    continue
-                
-                elements = soup.select(selector)
-                if elements:
-                    content = elements[0]
-                    break
-            
-            # Fallback to body
-            if not content:
-                content = soup.body or soup
-            
-            # Extract text with some structure preservation
-            text = self._extract_text_with_structure(content)
-            
-            return text
-            
+            return self.html_extractor.extract(html, platform)
         except Exception as e:
             logger.error(f"Error parsing HTML: {e}")
             return ""
-    
-    def _extract_text_with_structure(self, element) -> str:
-        """
-        Extract text while preserving some structure (lists, paragraphs).
-        """
-        lines = []
-        
-        for child in element.descendants:
-            if child.name in ['p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                lines.append('\n')
-            elif child.name == 'li':
-                lines.append('\n• ')
-            elif child.string:
-                text = child.string.strip()
-                if text:
-                    lines.append(text + ' ')
-        
-        text = ''.join(lines)
-        
-        # Clean up whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r' \n', '\n', text)
-        text = re.sub(r'\n ', '\n', text)
-        
-        return text.strip()
 
 
 # Singleton instance
-url_ingest_service = URLIngestService()
\ No newline at end of file
+url_ingest_service = URLIngestService(
+    cache=url_response_cache if settings.url_cache_enabled else None,
+)
\ No newline at end of file
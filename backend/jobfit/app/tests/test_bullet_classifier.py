@@ -0,0 +1,37 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.pdf_extract import PDFExtractor, ResumeLineClassifier
+
+FIXTURES = Path(__file__).parent / "fixtures" / "resume_lines"
+CORPUS = sorted(FIXTURES.glob("*.txt"))
+
+
+def load_case(path: Path) -> tuple[list[str], list[dict]]:
+    lines = PDFExtractor._segment_lines(path.read_text(encoding="utf-8"))
+    golden = json.loads(path.with_name(f"{path.stem}.golden.json").read_text(encoding="utf-8"))
+    return lines, golden
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=[p.stem for p in CORPUS])
+def test_bullet_points_match_golden_output(path):
+    lines, golden = load_case(path)
+
+    bullet_points = PDFExtractor._extract_bullet_points(lines)
+
+    # Compare serialized output so key order is pinned as well
+    assert json.dumps(bullet_points) == json.dumps(golden)
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=[p.stem for p in CORPUS])
+def test_classifier_state_carries_across_pieces(path):
+    lines, golden = load_case(path)
+
+    classifier = ResumeLineClassifier()
+    bullet_points = []
+    for start in range(0, len(lines), 7):
+        bullet_points.extend(classifier.classify(lines[start:start + 7]))
+
+    assert bullet_points == golden
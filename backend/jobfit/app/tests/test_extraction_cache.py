@@ -0,0 +1,127 @@
+import asyncio
+
+from app.services.extraction_cache import ExtractionCache
+from app.services.pdf_extract import ExtractedResume
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class DownRedis:
+    calls = 0
+
+    async def get(self, key):
+        DownRedis.calls += 1
+        raise ConnectionError("connection refused")
+
+    async def set(self, key, value, ex=None):
+        DownRedis.calls += 1
+        raise ConnectionError("connection refused")
+
+
+def extracted(file_hash: str) -> ExtractedResume:
+    return ExtractedResume(
+        raw_text="Jane Doe\n- Built pipelines",
+        lines=["Jane Doe", "- Built pipelines"],
+        bullet_points=[{"text": "Built pipelines", "line_index": 1}],
+        page_count=1,
+        file_hash=file_hash,
+    )
+
+
+def structure() -> dict:
+    return {"sections": {"experience": [1]}, "contact_hints": {}, "skills_raw": []}
+
+
+def test_hit_and_miss():
+    cache = ExtractionCache(max_entries=4)
+
+    async def scenario():
+        assert await cache.get("a") is None
+        await cache.set("a", extracted("a"), structure())
+        return await cache.get("a")
+
+    entry = asyncio.run(scenario())
+    assert entry.extracted == extracted("a")
+    assert entry.parsed_structure == structure()
+
+
+def test_results_with_errors_are_not_cached():
+    cache = ExtractionCache(max_entries=4)
+    failed = extracted("a")
+    failed.errors.append("Extraction timed out after 30 seconds")
+
+    async def scenario():
+        await cache.set("a", failed, structure())
+        return await cache.get("a")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_hits_are_copies():
+    cache = ExtractionCache(max_entries=4)
+    original = extracted("a")
+
+    async def scenario():
+        await cache.set("a", original, structure())
+        original.lines.append("changed after caching")
+        first = await cache.get("a")
+        first.extracted.lines.append("extra")
+        first.extracted.bullet_points[0]["text"] = "edited"
+        first.extracted.errors.append("No text could be extracted from PDF.")
+        first.parsed_structure["sections"]["experience"].append(2)
+        return await cache.get("a")
+
+    second = asyncio.run(scenario())
+    assert second.extracted == extracted("a")
+    assert second.parsed_structure == structure()
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ExtractionCache(max_entries=2)
+
+    async def scenario():
+        await cache.set("a", extracted("a"), structure())
+        await cache.set("b", extracted("b"), structure())
+        await cache.get("a")
+        await cache.set("c", extracted("c"), structure())
+        return [key for key in "abc" if await cache.get(key) is not None]
+
+    assert asyncio.run(scenario()) == ["a", "c"]
+
+
+def test_redis_tier_refills_the_process_tier():
+    cache = ExtractionCache(max_entries=2)
+    cache._redis = FakeRedis()
+
+    async def scenario():
+        await cache.set("a", extracted("a"), structure())
+        cache.clear()
+        return await cache.get("a")
+
+    entry = asyncio.run(scenario())
+    assert entry.extracted == extracted("a")
+    assert "a" in cache._entries
+
+
+def test_unavailable_redis_falls_back_to_the_process_tier():
+    cache = ExtractionCache(max_entries=2)
+    cache._redis = DownRedis()
+
+    async def scenario():
+        await cache.set("a", extracted("a"), structure())
+        return await cache.get("a"), await cache.get("missing")
+
+    hit, miss = asyncio.run(scenario())
+    assert hit.extracted == extracted("a")
+    assert miss is None
+    # The failed set backs Redis off, so later misses do not retry it
+    assert DownRedis.calls == 1
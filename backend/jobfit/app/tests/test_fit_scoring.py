@@ -0,0 +1,199 @@
+import asyncio
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from app.services.fit_scoring import (
+    DEFAULT_WEIGHTS, MATCH_THRESHOLD, FitScorer, FitScoringEngine, importance_weight,
+)
+from app.services.skill_catalog import CatalogSnapshot
+
+ROWS = [
+    {"id": 10, "canonical_name": "python", "category": "language"},
+    {"id": 11, "canonical_name": "django", "category": "framework"},
+    {"id": 12, "canonical_name": "kubernetes", "category": "devops"},
+    {"id": 13, "canonical_name": "react", "category": "frontend"},
+    {"id": 14, "canonical_name": "postgresql", "category": "database"},
+    {"id": 15, "canonical_name": "terraform", "category": "iac"},
+]
+
+JOB = [(10, "REQUIRED"), (11, "REQUIRED"), (12, "PREFERRED"), (13, "NICE_TO_HAVE")]
+
+
+@pytest.fixture
+def scorer() -> FitScorer:
+    return FitScorer(CatalogSnapshot.from_records(ROWS))
+
+
+def test_coverage_counts_partial_matches_half(scorer):
+    # python matched, django partial, kubernetes and react missing
+    score = scorer.score(scorer.job_vector(JOB), scorer.user_vector([(10, 0.9), (11, 0.4)]))
+
+    assert score.coverage == pytest.approx(100 * (3 + 0.5 * 3) / 9, abs=0.01)
+    breakdown = score.breakdown()
+    assert (breakdown["matched_skills"], breakdown["partial_skills"], breakdown["missing_skills"]) == (1, 1, 2)
+    assert breakdown["total_required_skills"] == 4
+    assert breakdown["weights"] == DEFAULT_WEIGHTS
+    assert score.depth == pytest.approx(100 * (0.9 * 3 + 0.4 * 3) / 6, abs=0.01)
+    assert score.overall == pytest.approx(0.6 * score.coverage + 0.3 * score.depth + 0.1 * score.bonus, abs=0.01)
+
+
+def test_bonus_skills_follow_job_demand(scorer):
+    job = scorer.job_vector(JOB)
+
+    # postgresql is a data skill, the job asks for none; terraform is devops like kubernetes
+    data_only = scorer.score(job, scorer.user_vector([(14, 1.0)]))
+    devops_extra = scorer.score(job, scorer.user_vector([(15, 1.0)]))
+
+    assert data_only.bonus == 0.0
+    assert list(devops_extra.bonus_skills) == [5]
+    assert devops_extra.bonus_relevance[0] == pytest.approx(2 / 9)
+    assert devops_extra.bonus > 0
+
+
+def test_radar_scores_job_skills_or_user_profile(scorer):
+    score = scorer.score(scorer.job_vector(JOB), scorer.user_vector([(10, 1.0), (12, 0.5), (14, 0.8)]))
+
+    assert score.radar["backend"] == pytest.approx(50.0)  # python 1.0 and django 0, both required
+    assert score.radar["devops"] == pytest.approx(50.0)
+    assert score.radar["frontend"] == 0.0
+    assert score.radar["data"] == pytest.approx(80.0)  # not in the job, the user's own strength
+    assert score.radar["security"] == 0.0
+
+
+def test_empty_inputs_score_zero(scorer):
+    score = scorer.score(scorer.job_vector([]), scorer.user_vector([(99, 1.0)]))
+
+    assert (score.overall, score.coverage, score.depth, score.bonus) == (0.0, 0.0, 0.0, 0.0)
+    assert not np.any(scorer.user_vector([(10, 3.0)]) > 1.0)
+    assert importance_weight("PREFERRED") == 2 and importance_weight(3) == 3
+
+
+def test_job_matrix_keeps_highest_weight_per_skill(scorer):
+    rows = [(2, 12, "PREFERRED"), (1, 10, "NICE_TO_HAVE"), (1, 10, "REQUIRED"), (1, 99, "REQUIRED"), (5, 10, "REQUIRED")]
+    matrix = scorer.job_matrix([1, 2, 3], rows)
+
+    assert matrix.job_ids.tolist() == [1, 2, 3]
+    assert matrix.indptr.tolist() == [0, 1, 2, 2]
+    assert matrix.indices.tolist() == [0, 2]
+    assert matrix.data.tolist() == [3.0, 2.0]
+    assert matrix.matvec(np.ones(scorer.size)).tolist() == [3.0, 2.0, 0.0]
+
+
+def test_score_many_matches_score_per_job(scorer):
+    jobs = {
+        1: JOB,
+        2: [(10, "NICE_TO_HAVE"), (14, "REQUIRED"), (15, "REQUIRED")],
+        3: [],
+        4: [(13, "REQUIRED"), (12, "REQUIRED"), (11, "PREFERRED"), (10, "PREFERRED")],
+    }
+    user = scorer.user_vector([(10, 0.9), (11, 0.4), (12, 0.2), (14, 0.7), (15, 0.5)])
+    matrix = scorer.job_matrix(jobs, [(job_id, *skill) for job_id, skills in jobs.items() for skill in skills])
+
+    batch = scorer.score_many(matrix, user)
+    coverage_points = batch.coverage_by_skill(scorer.snapshot.records)
+    for row, (job_id, skills) in enumerate(jobs.items()):
+        single = scorer.score(scorer.job_vector(skills), user)
+        assert batch.overall[row] == pytest.approx(single.overall, abs=0.01)
+        assert batch.coverage[row] == pytest.approx(single.coverage, abs=0.01)
+        assert batch.depth[row] == pytest.approx(single.depth, abs=0.01)
+        assert batch.bonus[row] == pytest.approx(single.bonus, abs=0.01)
+        assert (batch.matched[row], batch.partial[row], batch.missing[row]) == (
+            single.matched.size, single.partial.size, single.missing.size,
+        )
+        points = sum(per_job.get(job_id, 0.0) for per_job in coverage_points.values())
+        assert points == pytest.approx(single.coverage, abs=0.05)
+
+    assert batch.top_strengths[0] == [0]  # python
+    assert batch.top_gaps[0] == [1, 2, 3]  # django, kubernetes, react by importance
+    assert batch.top_strengths[2] == [] and batch.top_gaps[2] == []
+
+
+SCHEMA_NAMES = [
+    "AnalysisJsonDetail", "BonusSkillItem", "EvidenceItem", "GapRoadmapItem", "RadarScores",
+    "ScoreBreakdown", "SkillTableRow",
+]
+
+
+@pytest.fixture
+def schemas(monkeypatch):
+    """app.schemas.analysis with each model replaced by a plain keyword record."""
+    module = types.ModuleType("app.schemas.analysis")
+    for name in SCHEMA_NAMES:
+        setattr(module, name, type(name, (types.SimpleNamespace,), {}))
+    monkeypatch.setitem(sys.modules, "app.schemas.analysis", module)
+    return module
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def one(self):
+        return self.rows[0]
+
+    def all(self):
+        return self.rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeSession:
+    def __init__(self, *results):
+        self.results = list(results)
+
+    async def execute(self, statement):
+        return FakeResult(self.results.pop(0))
+
+
+USER_SKILLS = {
+    10: {"skill_id": 10, "strength": 0.9, "years_experience": 4.0, "best_evidence_text": "Built the billing API",
+         "evidence": [{"source": "resume", "text": "Built the billing API", "similarity": 1.4}]},
+    11: {"skill_id": 11, "strength": 0.4, "years_experience": None, "evidence": None},
+    12: {"skill_id": 12, "strength": 0.7, "years_experience": 2.0, "evidence": []},
+    15: {"skill_id": 15, "strength": 1.0, "years_experience": 1.0, "evidence": []},
+}
+
+
+def test_analyze_assembles_the_json_detail(schemas):
+    engine = FitScoringEngine(catalog=types.SimpleNamespace(snapshot=CatalogSnapshot.from_records(ROWS)))
+    db = FakeSession(
+        [{"id": 1, "title": "Backend Engineer", "company": "Acme"}],
+        JOB,
+        list(USER_SKILLS.values()),
+    )
+
+    detail = asyncio.run(engine.analyze(db, user_id=5, job_id=1, resume_id=9))
+    score = engine.scorer.score(
+        engine.scorer.job_vector(JOB),
+        engine.scorer.user_vector((skill_id, row["strength"]) for skill_id, row in USER_SKILLS.items()),
+    )
+
+    assert isinstance(detail, schemas.AnalysisJsonDetail)
+    assert (detail.job_id, detail.job_title, detail.company, detail.resume_id) == (1, "Backend Engineer", "Acme", 9)
+    assert detail.overall_score == score.overall
+
+    # Importance first, then strength
+    table = detail.skills_table
+    assert [row.skill_name for row in table] == ["python", "django", "kubernetes", "react"]
+    assert [row.required for row in table] == [True, True, False, False]
+    assert table[0].user_years == 4.0 and table[0].best_evidence_preview == "Built the billing API"
+    assert table[0].evidence[0].similarity_score == 1.0
+    assert table[1].evidence == [] and table[3].user_years is None
+
+    assert [gap.skill_name for gap in detail.gaps] == ["django", "react"]
+    assert detail.gaps[0].importance == 3 and detail.gaps[0].target_strength == MATCH_THRESHOLD
+    assert detail.gaps[0].why_it_matters == "django is required for Backend Engineer at Acme."
+    assert detail.top_strengths == ["python", "kubernetes"]
+    assert detail.top_gaps == ["django", "react"]
+
+    assert [bonus.skill_name for bonus in detail.bonus_skills] == ["terraform"]
+    assert detail.radar.__dict__ == score.radar
+    assert detail.score_breakdown.__dict__ == score.breakdown()
+    assert detail.score_breakdown.matched_skills == 2
@@ -0,0 +1,161 @@
+import asyncio
+import base64
+import json
+
+import httpx
+
+from app.core.http_client import SharedHTTPClient
+from app.services.github_cache import GitHubResponseCache
+from app.services.github_client import GitHubClient
+
+
+class FakeGitHub:
+    """Async MockTransport handler recording paths and peak concurrency."""
+
+    def __init__(self, delays: dict[str, float] = None, graphql_status: int = 200):
+        self.delays = delays or {}
+        self.graphql_status = graphql_status
+        self.version = "v1"  # ETag of every REST response
+        self.not_modified = 0
+        self.paths: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.paths.append(path)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if path == "/graphql":
+                return self.graphql(request)
+            repo = path.split("/")[3]
+            await asyncio.sleep(self.delays.get(repo, 0.01))
+            if repo.startswith("missing"):
+                return httpx.Response(404, json={"message": "Not Found"})
+            etag = f'"{self.version}"'
+            if request.headers.get("if-none-match") == etag:
+                self.not_modified += 1
+                return httpx.Response(304, headers={"ETag": etag})
+            return self.rest(path, repo, etag)
+        finally:
+            self.in_flight -= 1
+
+    def rest(self, path: str, repo: str, etag: str) -> httpx.Response:
+        headers = {"ETag": etag}
+        if path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 1000}, headers=headers)
+        if path.endswith("/readme"):
+            readme = f"# {repo} {self.version}".encode()
+            return httpx.Response(200, json={"content": base64.b64encode(readme).decode()}, headers=headers)
+        return httpx.Response(200, json={"id": 1, "name": repo, "full_name": f"octo/{repo}"}, headers=headers)
+
+    def graphql(self, request: httpx.Request) -> httpx.Response:
+        if self.graphql_status != 200:
+            return httpx.Response(self.graphql_status, json={"message": "Bad gateway"})
+        variables = json.loads(request.content)["variables"]
+        data = {}
+        for key, owner in variables.items():
+            if not key.startswith("owner"):
+                continue
+            i = key[len("owner"):]
+            repo = variables[f"name{i}"]
+            data[f"repo{i}"] = None if repo.startswith("missing") else {
+                "databaseId": 1, "name": repo, "nameWithOwner": f"{owner}/{repo}",
+                "url": f"https://github.com/{owner}/{repo}", "stargazerCount": 5, "forkCount": 1,
+                "languages": {"edges": [{"size": 1000, "node": {"name": "Python"}}]},
+                "repositoryTopics": {"nodes": [{"topic": {"name": "fastapi"}}]},
+                "readme0": None, "readme1": {"text": f"# {repo}"},
+            }
+        return httpx.Response(200, json={"data": data})
+
+
+def make_client(github: FakeGitHub, **kwargs) -> GitHubClient:
+    http = SharedHTTPClient(transport=httpx.MockTransport(github), max_connections_per_host=10)
+    return GitHubClient(base_url="https://api.github.test", http=http, **kwargs)
+
+
+def test_results_keep_input_order():
+    # The first repo answers last
+    github = FakeGitHub(delays={"slow": 0.05})
+    client = make_client(github, use_graphql=False)
+    urls = [
+        "https://github.com/octo/slow",
+        "not a github url",
+        "https://github.com/octo/missing",
+        "https://github.com/octo/fast",
+    ]
+
+    repos = asyncio.run(client.fetch_multiple_repos(urls))
+
+    assert [repo.name for repo in repos] == ["slow", "invalid", "missing", "fast"]
+    assert repos[0].readme_content == "# slow v1" and repos[0].languages == {"Python": 1000}
+    assert repos[1].errors == ["Invalid GitHub URL: not a github url"]
+    assert repos[2].errors == ["Repository not found or not accessible"]
+
+
+def test_fan_out_is_bounded():
+    github = FakeGitHub()
+    client = make_client(github, max_concurrency=3, use_graphql=False)
+    urls = [f"https://github.com/octo/repo-{i}" for i in range(9)]
+
+    asyncio.run(client.fetch_multiple_repos(urls))
+
+    # Three repos at a time, languages and README together for each
+    assert 3 < github.peak <= 6
+    assert len(github.paths) == 27
+
+
+def test_missing_repo_skips_languages_and_readme():
+    github = FakeGitHub()
+    client = make_client(github)
+
+    repo = asyncio.run(client.fetch_repo("octo", "missing-repo"))
+
+    assert repo.errors
+    assert github.paths == ["/repos/octo/missing-repo"]
+
+
+def test_graphql_fetches_each_batch_in_one_request():
+    github = FakeGitHub()
+    client = make_client(github, token="test-token", graphql_batch_size=4)
+    urls = ["not a github url"] + [
+        f"https://github.com/octo/{'missing' if i == 5 else 'repo'}-{i}" for i in range(10)
+    ]
+
+    repos = asyncio.run(client.fetch_multiple_repos(urls))
+
+    assert github.paths == ["/graphql"] * 3
+    assert [repo.name for repo in repos] == ["invalid"] + [f"{'missing' if i == 5 else 'repo'}-{i}" for i in range(10)]
+    assert repos[1].languages == {"Python": 1000} and repos[1].topics == ["fastapi"]
+    assert repos[1].readme_content == "# repo-0"
+    assert repos[6].errors == ["Repository not found or not accessible"]
+
+
+def test_graphql_failure_falls_back_to_rest():
+    github = FakeGitHub(graphql_status=502)
+    client = make_client(github, token="test-token")
+
+    [repo] = asyncio.run(client.fetch_multiple_repos(["https://github.com/octo/repo"]))
+
+    assert repo.readme_content == "# repo v1" and not repo.errors
+    assert github.paths[0] == "/graphql" and len(github.paths) == 4
+
+
+def test_refetch_revalidates_with_etags(tmp_path):
+    github = FakeGitHub()
+    cache = GitHubResponseCache(backend="disk", directory=tmp_path)
+    client = make_client(github, token="test-token", cache=cache)
+
+    first = asyncio.run(client.fetch_repo("octo", "repo"))
+    second = asyncio.run(client.fetch_repo("octo", "repo"))
+
+    assert not first.not_modified and second.not_modified
+    assert github.not_modified == 3
+    assert (second.readme_content, second.languages) == (first.readme_content, first.languages)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.rate_limit_saved) == (3, 3, 3)
+
+    # A new README is downloaded, the result is no longer unchanged
+    github.version = "v2"
+    third = asyncio.run(client.fetch_repo("octo", "repo"))
+    assert not third.not_modified and third.readme_content == "# repo v2"
@@ -0,0 +1,135 @@
+import asyncio
+import math
+import time
+
+import httpx
+
+from app.core.http_client import SharedHTTPClient
+from app.services.github_client import GitHubClient
+from app.services.github_rate_limit import GitHubRateLimiter
+
+
+class MeteredGitHub:
+    """MockTransport handler metering calls per token like GitHub's core rate limit."""
+
+    def __init__(self, budgets: dict[str, int], reset_in: float = 3600.0):
+        self.remaining = dict(budgets)
+        self.reset_at = math.ceil(time.time() + reset_in)
+        self.calls: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        self.calls.append(token)
+        if time.time() >= self.reset_at:
+            self.remaining[token] = 100
+        headers = {
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Remaining": str(max(self.remaining[token] - 1, 0)),
+            "X-RateLimit-Reset": str(self.reset_at),
+            "X-RateLimit-Resource": "core",
+        }
+        if self.remaining[token] == 0:
+            return httpx.Response(403, json={"message": "API rate limit exceeded"}, headers=headers)
+        self.remaining[token] -= 1
+        repo = request.url.path.split("/")[3]
+        if request.url.path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 1000}, headers=headers)
+        if request.url.path.endswith("/readme"):
+            return httpx.Response(404, json={"message": "Not Found"}, headers=headers)
+        return httpx.Response(200, json={"id": 1, "name": repo, "full_name": f"octo/{repo}"}, headers=headers)
+
+
+def make_client(github: MeteredGitHub, tokens: list[str], **kwargs) -> GitHubClient:
+    http = SharedHTTPClient(transport=httpx.MockTransport(github))
+    return GitHubClient(
+        token=tokens[0], tokens=tokens[1:], base_url="https://api.github.test", http=http,
+        use_graphql=False, **kwargs,
+    )
+
+
+def test_requests_move_to_the_token_with_budget_left():
+    github = MeteredGitHub({"token-a": 1, "token-b": 100})
+    client = make_client(github, ["token-a", "token-b"])
+
+    repos = asyncio.run(client.fetch_multiple_repos([f"https://github.com/octo/repo-{i}" for i in range(4)]))
+
+    assert not any(repo.errors for repo in repos)
+    # Token A is rejected once its single call is spent, the request is retried on B
+    assert github.calls.count("token-a") <= 2
+    assert client.rate_limiter.stats.rate_limited <= 1
+    assert {budget.token: budget.remaining for budget in client.rate_limiter.budgets()}["token-a"] == 0
+
+
+def test_spent_pool_queues_until_the_reset():
+    github = MeteredGitHub({"token-a": 0}, reset_in=0.5)
+    client = make_client(github, ["token-a"])
+
+    repo = asyncio.run(client.fetch_repo("octo", "repo"))
+
+    assert not repo.errors and repo.languages == {"Python": 1000}
+    assert client.rate_limiter.stats.rate_limited == 1
+    assert client.rate_limiter.stats.queued >= 1
+
+
+def test_wait_beyond_the_limit_fails_with_the_reset_time():
+    github = MeteredGitHub({"token-a": 0}, reset_in=3600)
+    client = make_client(github, ["token-a"], max_rate_limit_wait=1.0)
+
+    repo = asyncio.run(client.fetch_repo("octo", "repo"))
+
+    assert repo.errors and "rate limit exceeded" in repo.errors[0]
+    assert github.calls == ["token-a"]
+
+
+def test_predicted_wait():
+    limiter = GitHubRateLimiter(["token-a", "token-b"])
+    now = time.time()
+    limiter.observe("token-a", "core", 100, 10, now + 600)
+    limiter.observe("token-b", "core", 100, 5, now + 1200)
+
+    assert limiter.predicted_wait("core", 15) == 0
+    # Token A's reset adds its 100 calls
+    assert 590 < limiter.predicted_wait("core", 50) <= 600
+    assert 1190 < limiter.predicted_wait("core", 200) <= 1200
+    assert limiter.predicted_wait("core", 300) > 3600
+
+
+def test_user_token_is_used_only_for_that_users_client():
+    github = MeteredGitHub({"server": 100, "user-a": 100})
+    shared = make_client(github, ["server"])
+
+    user_client = shared.for_token("user-a")
+    asyncio.run(user_client.fetch_repo("octo", "private-repo"))
+    asyncio.run(shared.fetch_repo("octo", "public-repo"))
+
+    assert github.calls == ["user-a"] * 3 + ["server"] * 3
+    assert shared.rate_limiter.tokens == ["server"]
+    assert user_client.rate_limiter.tokens == ["user-a"]
+    assert shared.for_token(None) is shared
+
+
+def test_revoked_token_leaves_the_pool():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        calls.append(token)
+        if token == "revoked":
+            return httpx.Response(401, json={"message": "Bad credentials"})
+        return httpx.Response(200, json={"id": 1, "name": "repo", "full_name": "octo/repo"})
+
+    limiter = GitHubRateLimiter(["revoked", "valid"])
+    # The revoked token looks like the better one
+    limiter.observe("valid", "core", 5000, 10, time.time() + 600)
+    client = GitHubClient(
+        base_url="https://api.github.test", http=SharedHTTPClient(transport=httpx.MockTransport(handler)),
+        use_graphql=False,
+    )
+    client.rate_limiter = limiter
+
+    repo = asyncio.run(client.fetch_repo("octo", "repo"))
+
+    assert not repo.errors
+    assert calls[0] == "revoked" and calls.count("revoked") == 1
+    assert limiter.tokens == ["valid"] and limiter.stats.revoked == 1
+    assert all(budget.token == "valid" for budget in limiter.budgets())
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from app.services.html_extract import ENGINES, SimpleSelector, SoupExtractor, create_html_extractor
+from app.services.url_ingestion import URLIngestService
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_html"
+
+
+def make_extractor(name: str):
+    engine = ENGINES[name]
+    if not engine.available():
+        pytest.skip(f"{name} not installed")
+    return engine(URLIngestService.REMOVE_SELECTORS, URLIngestService.JOB_CONTENT_SELECTORS)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("page, platform", [("greenhouse", "greenhouse"), ("lever", "lever"), ("generic", None)])
+def test_engines_extract_saved_pages(engine, page, platform):
+    html = (FIXTURES / f"{page}.html").read_text(encoding="utf-8")
+    expected = (FIXTURES / f"{page}.txt").read_text(encoding="utf-8").strip()
+
+    assert make_extractor(engine).extract(html, platform) == expected
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_inline_text_and_comments(engine):
+    html = (
+        "<html><body><nav>Menu</nav><div id='content'><!-- tracking -->"
+        "<p>Build <b>APIs</b> in <a href='#'>Python</a></p><ul><li>Go</li></ul>"
+        "<div class='social-share'>Share</div></div></body></html>"
+    )
+
+    text = make_extractor(engine).extract(html, "greenhouse")
+
+    assert text == "Build APIs in Python\n• Go"
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_paragraph_in_list_item_stays_on_the_bullet(engine):
+    html = "<html><body><div id='content'><ul><li><p>Ship APIs</p></li><li>Go</li></ul></div></body></html>"
+
+    assert make_extractor(engine).extract(html, "greenhouse") == "• Ship APIs\n• Go"
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_falls_back_to_body(engine):
+    html = "<html><body><header>Logo</header><section>Rust engineer</section></body></html>"
+
+    assert make_extractor(engine).extract(html) == "Rust engineer"
+
+
+def test_simple_selector_parse():
+    selector = SimpleSelector.parse("div#content")
+
+    assert (selector.tag, selector.id, selector.class_name) == ("div", "content", None)
+    assert selector.matches("div", "content", [])
+    assert not selector.matches("section", "content", [])
+    with pytest.raises(ValueError):
+        SimpleSelector.parse("div > p")
+
+
+def test_create_html_extractor():
+    remove, content = URLIngestService.REMOVE_SELECTORS, URLIngestService.JOB_CONTENT_SELECTORS
+
+    assert isinstance(create_html_extractor("html.parser", remove, content), SoupExtractor)
+    assert create_html_extractor("auto", remove, content).available()
+    with pytest.raises(ValueError):
+        create_html_extractor("html5lib", remove, content)
@@ -0,0 +1,119 @@
+import asyncio
+
+import httpcore
+import httpx
+import pytest
+
+from app.core.http_client import CachingNetworkBackend, PooledTransport, SharedHTTPClient
+
+
+class FailingBackend(httpcore.AsyncMockBackend):
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        raise httpcore.ConnectTimeout(f"timed out connecting to {host}")
+
+
+def client_on(backend: httpcore.AsyncNetworkBackend) -> httpx.AsyncClient:
+    pool = httpcore.AsyncConnectionPool(network_backend=CachingNetworkBackend(60.0, backend=backend))
+    return httpx.AsyncClient(transport=PooledTransport(pool))
+
+
+def test_pooled_transport_round_trip():
+    backend = httpcore.AsyncMockBackend([
+        b"HTTP/1.1 200 OK\r\n",
+        b"Content-Type: text/plain\r\n",
+        b"Content-Length: 13\r\n",
+        b"\r\n",
+        b"Hello, world!",
+    ])
+
+    async def scenario():
+        async with client_on(backend) as client:
+            return await client.get("http://127.0.0.1:8080/jobs?page=2")
+
+    response = asyncio.run(scenario())
+
+    assert response.status_code == 200
+    assert response.text == "Hello, world!"
+    assert response.headers["content-type"] == "text/plain"
+
+
+def test_pooled_transport_raises_httpx_errors():
+    async def scenario():
+        async with client_on(FailingBackend([])) as client:
+            await client.get("http://127.0.0.1:8080/")
+
+    with pytest.raises(httpx.ConnectTimeout, match="timed out connecting"):
+        asyncio.run(scenario())
+
+
+def test_idle_hosts_release_their_limit():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    shared = SharedHTTPClient(transport=transport, max_connections_per_host=2)
+    seen = []
+
+    async def fetch(url: str):
+        async with shared.stream("GET", url):
+            seen.append(dict((key, slots.users) for key, slots in shared._host_limits.items()))
+
+    async def scenario():
+        await asyncio.gather(*(fetch(f"https://board-{n % 2}.example.com/jobs/{n}") for n in range(6)))
+        idle = dict(shared._host_limits)
+        await shared.aclose()
+        return idle
+
+    idle = asyncio.run(scenario())
+
+    assert {"https://board-0.example.com", "https://board-1.example.com"} <= set().union(*seen)
+    assert idle == {}
+
+
+class RecordingBackend(httpcore.AsyncMockBackend):
+    """Mock backend that records where each connection goes."""
+
+    def __init__(self, buffer):
+        super().__init__(buffer)
+        self.connected = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.connected.append((host, port))
+        return await super().connect_tcp(host, port, timeout, local_address, socket_options)
+
+
+@pytest.fixture
+def clean_proxy_env(monkeypatch):
+    for name in ("http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+
+def test_environment_proxies_are_used(monkeypatch, clean_proxy_env):
+    backend = RecordingBackend([
+        b"HTTP/1.1 200 Connection established\r\n\r\n",
+        b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok",
+    ])
+    monkeypatch.setattr(httpcore, "AnyIOBackend", lambda: backend)
+    monkeypatch.setenv("HTTPS_PROXY", "http://10.0.0.1:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+    shared = SharedHTTPClient(http2=False)
+
+    async def scenario():
+        response = await shared.get("https://boards.example.com/jobs/1")
+        await shared.aclose()
+        return response
+
+    response = asyncio.run(scenario())
+
+    # Tunnelled through the proxy, whose pool shares the caching backend
+    assert response.text == "ok"
+    assert backend.connected == [("10.0.0.1", 3128)]
+
+    mounts = SharedHTTPClient._proxy_mounts({"http2": False})
+    assert set(mounts) == {"https://", "all://*internal.example.com"}
+    assert mounts["all://*internal.example.com"] is None
+
+
+def test_no_proxy_wildcard_disables_proxies(monkeypatch, clean_proxy_env):
+    monkeypatch.setenv("HTTPS_PROXY", "http://10.0.0.1:3128")
+    monkeypatch.setenv("NO_PROXY", "*")
+
+    assert SharedHTTPClient._proxy_mounts({}) == {}
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+from app.services.import_scheduler import TokenBucket, URLImportScheduler
+from app.services.url_ingestion import URLIngestResult, URLIngestService, parse_retry_after
+
+
+class ScriptedIngestService(URLIngestService):
+    """Answers each URL with a scripted sequence of HTTP statuses."""
+
+    def __init__(self, statuses: dict[str, list[int]], retry_after: float = None):
+        super().__init__()
+        self.statuses = statuses
+        self.retry_after = retry_after
+        self.calls: list[str] = []
+        self.times: list[float] = []
+
+    async def ingest_url(self, url: str) -> URLIngestResult:
+        self.calls.append(url)
+        self.times.append(time.monotonic())
+        status = self.statuses[url].pop(0) if self.statuses.get(url) else 200
+        return URLIngestResult(
+            success=status == 200,
+            source_url=url,
+            http_status=status,
+            retry_after=self.retry_after if status != 200 else None,
+        )
+
+
+def collect(scheduler: URLImportScheduler, urls: list[str]) -> list:
+    async def run():
+        return [item async for item in scheduler.run(urls)]
+    return asyncio.run(run())
+
+
+def test_throttled_and_failing_urls_are_retried():
+    urls = [
+        "https://boards.greenhouse.io/acme/jobs/1",
+        "https://jobs.lever.co/acme/2",
+        "https://careers.example.com/3",
+    ]
+    service = ScriptedIngestService({urls[0]: [429, 503], urls[2]: [404]})
+    scheduler = URLImportScheduler(service=service, retry_base_seconds=0.001)
+
+    results = {item.url: item for item in collect(scheduler, urls)}
+
+    assert results[urls[0]].attempts == 3 and results[urls[0]].result.success
+    assert results[urls[1]].attempts == 1
+    # 404 is final
+    assert results[urls[2]].attempts == 1 and results[urls[2]].result.http_status == 404
+
+
+def test_retries_stop_after_max_retries():
+    url = "https://boards.greenhouse.io/acme/jobs/1"
+    service = ScriptedIngestService({url: [500] * 10})
+    scheduler = URLImportScheduler(service=service, max_retries=2, retry_base_seconds=0.001)
+
+    [item] = collect(scheduler, [url])
+
+    assert item.attempts == 3
+    assert item.result.http_status == 500
+
+
+def test_retry_after_pauses_the_board():
+    urls = ["https://boards.greenhouse.io/acme/jobs/1", "https://boards.greenhouse.io/acme/jobs/2"]
+    service = ScriptedIngestService({urls[0]: [429]}, retry_after=0.2)
+    scheduler = URLImportScheduler(service=service, domain_rate=1000, domain_burst=1, retry_base_seconds=0.001)
+
+    results = {item.url: item for item in collect(scheduler, urls)}
+
+    assert results[urls[0]].attempts == 2 and results[urls[0]].result.success
+    # The other posting of the board waited out the Retry-After too
+    assert service.calls[:2] == urls
+    assert service.times[1] - service.times[0] >= 0.19
+
+
+def test_retry_after_beyond_the_limit_is_final():
+    url = "https://jobs.lever.co/acme/1"
+    service = ScriptedIngestService({url: [503]}, retry_after=3600)
+
+    [item] = collect(URLImportScheduler(service=service), [url])
+
+    assert item.attempts == 1 and item.result.http_status == 503
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert 25 < parse_retry_after(time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 30))) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None and parse_retry_after(None) is None
+
+
+def test_idle_buckets_are_dropped():
+    service = ScriptedIngestService({})
+    scheduler = URLImportScheduler(service=service, domain_rate=1000, domain_burst=1)
+
+    for n in range(20):
+        collect(scheduler, [f"https://careers-{n}.example.com/jobs/1"])
+        time.sleep(0.002)
+
+    assert len(scheduler._buckets) <= 2
+    assert "careers-19.example.com" in scheduler._buckets
+
+
+def test_buckets_are_keyed_by_platform_then_host():
+    scheduler = URLImportScheduler(service=ScriptedIngestService({}))
+
+    assert scheduler.bucket_key("https://boards.greenhouse.io/a/jobs/1") == "greenhouse"
+    assert scheduler.bucket_key("https://boards.greenhouse.io/b/jobs/2") == "greenhouse"
+    assert scheduler.bucket_key("https://Careers.Example.com/jobs/3") == "careers.example.com"
+
+
+def test_token_bucket_limits_rate_after_burst():
+    async def run():
+        bucket = TokenBucket(rate=100.0, capacity=5)
+        start = time.monotonic()
+        for _ in range(15):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # 5 tokens up front, the other 10 arrive at 100 per second
+    assert 0.09 <= asyncio.run(run()) < 0.5
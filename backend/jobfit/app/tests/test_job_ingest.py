@@ -0,0 +1,58 @@
+import io
+import json
+
+from app.models.job import JobSource
+from app.services.job_ingest import _prepare_records, content_hash, read_job_records
+
+JOB_TEXT = (
+    "Senior Backend Engineer\n"
+    "Requirements\n- 5+ years of Python\n- PostgreSQL and Kafka\n"
+    "Benefits\n- Remote-first\n"
+)
+
+
+def test_ndjson_records_keep_line_numbers_and_skip_blank_lines():
+    feed = io.StringIO('{"raw_text": "a"}\n\n  \n{"raw_text": "b"}\n')
+
+    assert list(read_job_records(feed, "ndjson")) == [
+        (1, '{"raw_text": "a"}\n'),
+        (4, '{"raw_text": "b"}\n'),
+    ]
+
+
+def test_csv_records_report_the_first_line_of_multiline_rows():
+    feed = io.StringIO('title,raw_text\nBackend,"line one\nline two"\nFrontend,text\n', newline="")
+
+    records = list(read_job_records(feed, "csv"))
+
+    assert [line for line, _ in records] == [2, 4]
+    assert records[0][1] == {"title": "Backend", "raw_text": "line one\nline two"}
+
+
+def test_prepare_records_reports_bad_records_by_line():
+    records = [
+        (1, json.dumps({"raw_text": JOB_TEXT, "source_url": "https://jobs.example.com/1"})),
+        (2, "{not json"),
+        (3, json.dumps({"raw_text": "too short"})),
+        (4, json.dumps(["not", "an", "object"])),
+    ]
+
+    prepared = _prepare_records(records, JobSource.MANUAL)
+
+    assert [line for line, _, _ in prepared] == [1, 2, 3, 4]
+    values = prepared[0][1]
+    assert values["title"] == "Senior Backend Engineer"
+    assert values["description"] == values["cleaned_text"]
+    assert values["content_hash"] == content_hash(values["cleaned_text"], "https://jobs.example.com/1")
+    assert all(values is None and error.startswith(f"Line {line}:") for line, values, error in prepared[1:])
+
+
+def test_content_hash_includes_source_url():
+    values = [v for _, v, _ in _prepare_records([
+        (1, {"raw_text": JOB_TEXT, "source_url": "https://jobs.example.com/1"}),
+        (2, {"raw_text": JOB_TEXT, "source_url": "https://jobs.example.com/1"}),
+        (3, {"raw_text": JOB_TEXT, "source_url": "https://jobs.example.com/2"}),
+    ], JobSource.MANUAL)]
+
+    assert values[0]["content_hash"] == values[1]["content_hash"]
+    assert values[0]["content_hash"] != values[2]["content_hash"]
@@ -0,0 +1,99 @@
+import asyncio
+import types
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services.fit_scoring import FitScoringEngine
+from app.services.job_ranking import ANALYSIS_TABLE, JobRankingService
+from app.services.skill_catalog import CatalogSnapshot
+
+ROWS = [
+    {"id": 10, "canonical_name": "python", "category": "language"},
+    {"id": 11, "canonical_name": "django", "category": "framework"},
+    {"id": 12, "canonical_name": "kubernetes", "category": "devops"},
+    {"id": 13, "canonical_name": "react", "category": "frontend"},
+]
+
+SCHEMA = [
+    """CREATE TABLE jobs (
+        id INTEGER PRIMARY KEY, title TEXT NOT NULL, company TEXT,
+        is_processed BOOLEAN NOT NULL, processing_error TEXT
+    )""",
+    "CREATE TABLE job_skills (job_id INTEGER, skill_id INTEGER, importance TEXT)",
+    """CREATE TABLE user_skills (
+        user_id INTEGER, skill_id INTEGER, strength REAL, years_experience REAL, evidence JSON, best_evidence_text TEXT
+    )""",
+    """CREATE TABLE analysis (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL, job_id INTEGER NOT NULL,
+        resume_id INTEGER, status TEXT NOT NULL, overall_score REAL, coverage_score REAL,
+        depth_score REAL, bonus_score REAL, top_strengths JSON, top_gaps JSON, is_latest BOOLEAN NOT NULL,
+        created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )""",
+    # 1 asks for python and django, 2 for python only, 3 for react only;
+    # 4 is waiting for the skill worker and 5 failed extraction
+    """INSERT INTO jobs VALUES
+        (1, 'Backend Engineer', 'Acme', 1, NULL),
+        (2, 'Python Developer', 'Globex', 1, NULL),
+        (3, 'Frontend Engineer', NULL, 1, NULL),
+        (4, 'Platform Engineer', 'Initech', 0, NULL),
+        (5, 'Data Engineer', 'Umbrella', 1, 'Extraction failed')""",
+    """INSERT INTO job_skills VALUES
+        (1, 10, 'REQUIRED'), (1, 11, 'REQUIRED'), (2, 10, 'REQUIRED'), (3, 13, 'REQUIRED')""",
+    "INSERT INTO user_skills (user_id, skill_id, strength) VALUES (7, 10, 1.0), (7, 12, 0.8)",
+    # Earlier analyses of user 7, one of them for the unprocessed job
+    """INSERT INTO analysis (user_id, job_id, status, overall_score, is_latest) VALUES
+        (7, 1, 'COMPLETED', 10.0, 1), (7, 4, 'COMPLETED', 55.0, 1), (8, 1, 'COMPLETED', 30.0, 1)""",
+]
+
+
+def test_rank_stores_one_analysis_per_job():
+    service = JobRankingService(FitScoringEngine(catalog=types.SimpleNamespace(snapshot=CatalogSnapshot.from_records(ROWS))))
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            for statement in SCHEMA:
+                await conn.execute(text(statement))
+        async with AsyncSession(engine) as db:
+            ranking = await service.rank(db, user_id=7, job_ids=[3, 1, 99, 2, 4, 5], resume_id=9)
+            await db.commit()
+            rows = (await db.execute(text(
+                "SELECT id, user_id, job_id, resume_id, overall_score, is_latest FROM analysis ORDER BY id"
+            ))).all()
+        await engine.dispose()
+        return ranking, rows
+
+    ranking, rows = asyncio.run(scenario())
+
+    assert [job.job_id for job in ranking.jobs] == [2, 1, 3]
+    assert [job.rank for job in ranking.jobs] == [1, 2, 3]
+    assert [job.overall_score for job in ranking.jobs] == sorted((job.overall_score for job in ranking.jobs), reverse=True)
+    assert ranking.jobs[0].top_strengths == ["python"]
+    assert ranking.unknown_job_ids == [99]
+    assert ranking.unprocessed_job_ids == [4, 5]
+
+    # The earlier analysis of job 1 is demoted; user 8's and job 4's stay latest
+    assert [tuple(row[1:3]) + (row[5],) for row in rows[:3]] == [(7, 1, 0), (7, 4, 1), (8, 1, 1)]
+
+    # Each new row comes back with its own id and timestamps
+    stored = {row[0]: row for row in rows[3:]}
+    assert len(stored) == 3
+    for job in ranking.jobs:
+        _, user_id, job_id, resume_id, overall_score, is_latest = stored[job.analysis_id]
+        assert (user_id, job_id, resume_id, is_latest) == (7, job.job_id, 9, 1)
+        assert overall_score == job.overall_score
+        assert job.created_at is not None and job.updated_at is not None
+
+
+def test_bulk_insert_compiles_for_asyncpg_executemany():
+    statement = ANALYSIS_TABLE.insert().returning(ANALYSIS_TABLE.c.id, sort_by_parameter_order=True)
+    compiled = statement.compile(
+        dialect=asyncpg.dialect(), for_executemany=True, column_keys=["user_id", "job_id", "status", "is_latest"],
+    )
+
+    assert compiled._insertmanyvalues is not None
+    assert "::analysis_status_enum" in str(compiled)
+    assert "RETURNING analysis.id" in str(compiled)
@@ -0,0 +1,96 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.job_skill_worker import JobSkillWorker, UNTITLED_CONFIDENCE, extract_job_skills
+from app.services.skill_catalog import CatalogSnapshot
+
+ROWS = [
+    {"id": 1, "canonical_name": "python", "display_name": "Python", "aliases": ["py"]},
+    {"id": 2, "canonical_name": "kubernetes", "display_name": "Kubernetes", "aliases": ["k8s"]},
+    {"id": 3, "canonical_name": "terraform", "display_name": "Terraform", "aliases": []},
+    {"id": 4, "canonical_name": "go", "display_name": "Go", "aliases": ["golang"]},
+]
+
+JOB_TEXT = """We run Python services on Kubernetes.
+
+Requirements:
+- 5+ years of Python
+- Production Kubernetes experience
+
+Nice to have:
+- Terraform
+- Python packaging
+
+Responsibilities:
+- Port services to Golang
+"""
+
+
+def test_importance_follows_most_important_section():
+    rows = {row["skill_id"]: row for row in extract_job_skills(7, JOB_TEXT, CatalogSnapshot.from_records(ROWS))}
+
+    assert set(rows) == {1, 2, 3, 4}
+    assert all(row["job_id"] == 7 for row in rows.values())
+    assert rows[1]["importance"] == "REQUIRED" and rows[1]["source_section"] == "requirements"
+    assert rows[1]["mention_count"] == 3
+    assert rows[2]["importance"] == "REQUIRED" and rows[2]["mention_count"] == 2
+    assert rows[3]["importance"] == "NICE_TO_HAVE" and rows[3]["confidence"] == 1.0
+    assert rows[4]["importance"] == "PREFERRED" and rows[4]["source_section"] == "responsibilities"
+
+
+def test_untitled_text_has_lower_confidence():
+    snapshot = CatalogSnapshot.from_records(ROWS)
+
+    [row] = extract_job_skills(1, "Our stack is mostly Go.", snapshot)
+    assert row["importance"] == "PREFERRED"
+    assert row["source_section"] is None
+    assert row["confidence"] == UNTITLED_CONFIDENCE
+    assert extract_job_skills(1, "No known skills here.", snapshot) == []
+
+
+def test_claim_skips_rows_locked_by_other_workers():
+    sql = str(JobSkillWorker(batch_size=25).claim_query().compile(dialect=postgresql.dialect()))
+
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "jobs.is_processed IS false" in sql
+    assert "jobs.processing_error IS NULL" in sql
+    assert "LIMIT" in sql
+
+
+class FlakyCatalog:
+    """Fails its first load, like a database that is not up yet."""
+
+    def __init__(self):
+        self.loaded = False
+        self.attempts = 0
+
+    async def refresh(self):
+        self.attempts += 1
+        if self.attempts == 1:
+            raise ConnectionError("database is starting up")
+        self.loaded = True
+
+
+def test_failed_catalog_load_is_retried():
+    catalog = FlakyCatalog()
+    worker = JobSkillWorker(catalog=catalog, batch_size=10, idle_seconds=0.01)
+    batches = []
+
+    async def process_batch():
+        batches.append(catalog.attempts)
+        raise asyncio.CancelledError
+
+    worker.process_batch = process_batch
+
+    async def scenario():
+        worker.start()
+        try:
+            await asyncio.wait_for(worker._task, timeout=1)
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(scenario())
+
+    assert catalog.attempts == 2 and catalog.loaded
+    assert batches == [2]
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services import pdf_extract
+from app.services.pdf_extract import PDFExtractionEngine, PDFExtractor
+
+
+PAGES = [[f"Page {n} heading", f"Line on page number {n}"] for n in range(1, 6)]
+
+
+def thread_engine(**kwargs) -> PDFExtractionEngine:
+    """An engine on a thread pool, so tests can patch the worker functions."""
+    engine = PDFExtractionEngine(**kwargs)
+    engine._executor = ThreadPoolExecutor(max_workers=engine.max_workers)
+    return engine
+
+
+def test_pages_come_back_in_order(make_pdf):
+    engine = PDFExtractionEngine(max_workers=2, pages_per_task=2, timeout=30)
+    try:
+        page_count, pages_text, errors = asyncio.run(engine.extract_pages(make_pdf(PAGES)))
+    finally:
+        engine.shutdown()
+
+    assert page_count == 5 and errors == []
+    assert [text.splitlines()[0] for text in pages_text] == [f"Page {n} heading" for n in range(1, 6)]
+
+
+def test_workers_get_a_path_and_ranges_are_submitted_together(monkeypatch, tmp_path, make_pdf):
+    calls, active, peak = [], [0], [0]
+    lock = threading.Lock()
+    release = threading.Event()
+    original = pdf_extract._extract_page_range
+
+    def recording(path, start, stop):
+        with lock:
+            calls.append((type(path), start))
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            if active[0] == 3:
+                release.set()
+        # Every range waits until all three run at once (or gives up)
+        release.wait(timeout=2)
+        try:
+            return original(path, start, stop)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    monkeypatch.setattr(pdf_extract, "_extract_page_range", recording)
+    engine = thread_engine(max_workers=3, pages_per_task=2, timeout=30)
+    pdf_path = tmp_path / "resume.pdf"
+    pdf_path.write_bytes(make_pdf(PAGES))
+
+    page_count, pages_text, _ = asyncio.run(engine.extract_pages(pdf_path))
+    engine.shutdown()
+
+    assert page_count == 5 and len(pages_text) == 5
+    assert all(kind is str for kind, _ in calls)
+    assert sorted(start for _, start in calls) == [0, 2, 4]
+    assert peak[0] == 3
+
+
+def test_page_error_is_reported_per_page(monkeypatch, make_pdf):
+    import pdfplumber.page
+
+    original = pdfplumber.page.Page.extract_text
+
+    def failing(self, *args, **kwargs):
+        if self.page_number == 2:
+            raise ValueError("bad content stream")
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(pdfplumber.page.Page, "extract_text", failing)
+    engine = thread_engine(max_workers=2, pages_per_task=2, timeout=30)
+    monkeypatch.setattr(pdf_extract, "pdf_engine", engine)
+
+    extracted = asyncio.run(PDFExtractor.extract_from_bytes(make_pdf(PAGES[:3])))
+    engine.shutdown()
+
+    assert extracted.page_count == 3
+    assert extracted.errors == ["Page 2: bad content stream"]
+    assert "Page 1 heading" in extracted.raw_text and "Page 3 heading" in extracted.raw_text
+    assert "Page 2 heading" not in extracted.raw_text
+
+
+def test_timeout_returns_an_error_result(monkeypatch, make_pdf):
+    def slow(path, start, stop):
+        time.sleep(0.5)
+        return [], []
+
+    monkeypatch.setattr(pdf_extract, "_extract_page_range", slow)
+    engine = thread_engine(max_workers=2, pages_per_task=1, timeout=0.1)
+    monkeypatch.setattr(pdf_extract, "pdf_engine", engine)
+
+    extracted = asyncio.run(PDFExtractor.extract_from_bytes(make_pdf(PAGES[:2])))
+    engine.shutdown()
+
+    assert extracted.page_count == 0
+    assert extracted.errors == ["Extraction timed out after 0.1 seconds"]
+
+
+def test_explicit_zero_settings_are_kept(make_pdf):
+    engine = PDFExtractionEngine(max_workers=1, pages_per_task=0, timeout=0)
+
+    assert engine.timeout == 0
+    assert engine.pages_per_task == 1
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(engine.extract_pages(make_pdf(PAGES[:1])))
+    engine.shutdown()
@@ -0,0 +1,192 @@
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.core.http_client import SharedHTTPClient
+from app.services.platform_adapters import AshbyAdapter, GreenhouseAdapter, LeverAdapter
+from app.services.url_cache import URLResponseCache
+from app.services.import_scheduler import URLImportScheduler
+from app.services.url_ingestion import URLIngestService
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+GREENHOUSE_URL = "https://boards.greenhouse.io/acmepayments/jobs/4012345?gh_src=feed"
+LEVER_URL = "https://jobs.lever.co/northwind/5ac21346-8e0c-4494-8e7a-3eb92ff77902"
+ASHBY_URLS = [
+    "https://jobs.ashbyhq.com/globex/0b1e3f7a-4d2c-4f8e-9a51-7c6d2e8b9f10",
+    "https://jobs.ashbyhq.com/globex/6f2d9c41-0a3b-4e5f-8c7d-1b2a3c4d5e6f/application",
+]
+
+
+def load(name: str) -> dict:
+    return json.loads((FIXTURES / "platform_api" / name).read_text(encoding="utf-8"))
+
+
+class FakePlatforms:
+    """MockTransport handler serving the API fixtures and the saved HTML pages."""
+
+    API_RESPONSES = {
+        "boards-api.greenhouse.io": "greenhouse_job.json",
+        "api.lever.co": "lever_posting.json",
+        "api.ashbyhq.com": "ashby_board.json",
+    }
+
+    def __init__(self, api_status: int = 200):
+        self.api_status = api_status
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.host in self.API_RESPONSES:
+            if self.api_status != 200:
+                return httpx.Response(self.api_status, json={"status": self.api_status})
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json=load(self.API_RESPONSES[request.url.host]), headers={"ETag": '"v1"'})
+        page = (FIXTURES / "job_html" / "greenhouse.html").read_text(encoding="utf-8")
+        return httpx.Response(200, text=page, headers={"Content-Type": "text/html; charset=utf-8"})
+
+    def hosts(self) -> list[str]:
+        return [request.url.host for request in self.requests]
+
+
+def make_service(platforms: FakePlatforms, **kwargs) -> URLIngestService:
+    return URLIngestService(http=SharedHTTPClient(transport=httpx.MockTransport(platforms)), **kwargs)
+
+
+def ingest(service: URLIngestService, urls: list[str]) -> list:
+    async def run():
+        return [await service.ingest_url(url) for url in urls]
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("adapter, url, api_url", [
+    (GreenhouseAdapter(), GREENHOUSE_URL,
+     "https://boards-api.greenhouse.io/v1/boards/acmepayments/jobs/4012345?pay_transparency=true"),
+    (GreenhouseAdapter(), "https://boards.greenhouse.io/embed/job_app?for=acmepayments&token=4012345",
+     "https://boards-api.greenhouse.io/v1/boards/acmepayments/jobs/4012345?pay_transparency=true"),
+    (LeverAdapter(), LEVER_URL + "/apply",
+     "https://api.lever.co/v0/postings/northwind/5ac21346-8e0c-4494-8e7a-3eb92ff77902"),
+    (LeverAdapter(), LEVER_URL.replace("jobs.lever", "jobs.eu.lever"),
+     "https://api.eu.lever.co/v0/postings/northwind/5ac21346-8e0c-4494-8e7a-3eb92ff77902"),
+    (AshbyAdapter(), ASHBY_URLS[1], "https://api.ashbyhq.com/posting-api/job-board/globex?includeCompensation=true"),
+    # Board listings and other pages are not postings
+    (GreenhouseAdapter(), "https://boards.greenhouse.io/acmepayments", None),
+    (LeverAdapter(), "https://jobs.lever.co/northwind", None),
+    (AshbyAdapter(), "https://jobs.ashbyhq.com/globex", None),
+])
+def test_api_urls(adapter, url, api_url):
+    assert adapter.api_url(url) == api_url
+
+
+def test_greenhouse_posting():
+    posting = GreenhouseAdapter().parse(load("greenhouse_job.json"), GREENHOUSE_URL)
+
+    assert posting.external_id == "4012345"
+    assert (posting.metadata.company, posting.metadata.location) == ("Acme Payments", "Berlin, Germany")
+    assert (posting.metadata.salary_min, posting.metadata.salary_max, posting.metadata.salary_currency) == \
+        (85000, 110000, "EUR")
+    assert posting.metadata.seniority == "senior"
+    assert posting.fields["departments"] == ["Engineering"]
+    assert posting.fields["custom_fields"]["Visa Sponsorship"] == "Yes"
+    assert "\nWhat you'll do\n• Design and build high-throughput APIs in Python and Go\n" in posting.text
+
+
+def test_lever_posting_includes_lists_and_closing_section():
+    posting = LeverAdapter().parse(load("lever_posting.json"), LEVER_URL)
+
+    assert posting.metadata.remote_type == "remote"
+    assert posting.metadata.salary_max == 225000
+    assert posting.fields["team"] == "Data Platform"
+    assert "What you'll need\n• 8+ years in data engineering\n" in posting.text
+    assert posting.text.endswith("proud to be an equal opportunity workplace.")
+
+
+def test_ashby_posting_is_picked_from_the_board():
+    posting = AshbyAdapter().parse(load("ashby_board.json"), ASHBY_URLS[1])
+
+    assert posting.external_id == "6f2d9c41-0a3b-4e5f-8c7d-1b2a3c4d5e6f"
+    assert posting.metadata.remote_type == "remote"
+    assert posting.text.endswith("• SQL, dbt and Looker")
+    assert AshbyAdapter().parse(load("ashby_board.json"), ASHBY_URLS[0].replace("0b1e", "ffff")) is None
+
+
+def test_service_reads_postings_from_apis():
+    platforms = FakePlatforms()
+    service = make_service(platforms)
+
+    results = ingest(service, [GREENHOUSE_URL, LEVER_URL, *ASHBY_URLS])
+
+    assert all(result.success and result.api_url for result in results)
+    assert results[0].metadata.company == "Acme Payments"
+    assert results[1].platform_fields["commitment"] == "Full-time"
+    assert [result.external_id for result in results[2:]] == [url.split("/")[4] for url in ASHBY_URLS]
+    # No HTML page fetched, and the Ashby board was downloaded once for both postings
+    assert platforms.hosts() == ["boards-api.greenhouse.io", "api.lever.co", "api.ashbyhq.com"]
+
+
+def test_service_falls_back_to_html_when_api_fails():
+    platforms = FakePlatforms(api_status=404)
+    service = make_service(platforms)
+
+    [result] = ingest(service, [GREENHOUSE_URL])
+
+    assert result.success and result.api_url is None
+    assert platforms.hosts() == ["boards-api.greenhouse.io", "boards.greenhouse.io"]
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_throttled_or_failing_api_is_reported_not_scraped(status):
+    platforms = FakePlatforms(api_status=status)
+    service = make_service(platforms)
+
+    [result] = ingest(service, [GREENHOUSE_URL])
+
+    assert not result.success and result.http_status == status
+    assert status in URLImportScheduler.RETRY_STATUSES
+    assert platforms.hosts() == ["boards-api.greenhouse.io"]
+
+
+def test_html_fallback_does_not_send_the_api_etag(tmp_path):
+    platforms = FakePlatforms()
+    service = make_service(platforms, cache=URLResponseCache(backend="disk", directory=tmp_path))
+    ingest(service, [GREENHOUSE_URL])
+
+    platforms.api_status = 404
+    [result] = ingest(service, [GREENHOUSE_URL])
+
+    assert result.success and not result.from_cache and result.api_url is None
+    html_request = platforms.requests[-1]
+    assert html_request.url.host == "boards.greenhouse.io"
+    assert "if-none-match" not in html_request.headers
+
+
+def test_board_responses_are_pruned(monkeypatch):
+    service = make_service(FakePlatforms())
+    monkeypatch.setattr(URLIngestService, "MAX_BOARD_RESPONSES", 2)
+    monkeypatch.setattr(URLIngestService, "BOARD_RESPONSE_TTL", 60.0)
+
+    service._remember_board("expired", {})
+    service._board_responses["expired"] = (0.0, {})
+    service._remember_board("a", {})
+    service._remember_board("b", {})
+    assert list(service._board_responses) == ["a", "b"]
+
+    service._remember_board("c", {})
+    assert list(service._board_responses) == ["b", "c"]
+
+
+def test_reimport_revalidates_api_response(tmp_path):
+    platforms = FakePlatforms()
+    service = make_service(platforms, cache=URLResponseCache(backend="disk", directory=tmp_path))
+
+    first, second = ingest(service, [LEVER_URL, LEVER_URL])
+
+    assert second.from_cache and second.http_status == 304
+    assert second.raw_text == first.raw_text
+    assert second.metadata == first.metadata
+    assert second.external_id == first.external_id
+    assert second.platform_fields == first.platform_fields
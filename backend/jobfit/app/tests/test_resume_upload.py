@@ -0,0 +1,252 @@
+import asyncio
+import hashlib
+import json
+import zipfile
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.routes import resume_route
+from app.services.extraction_cache import ExtractionCache
+from app.services.pdf_extract import PDFExtractor
+
+
+class FakeResume:
+    """Stands in for the Resume mapper, which needs every model configured."""
+
+    def __init__(self, **values):
+        self.__dict__.update(values)
+        self.id = None
+        self.created_at = None
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def add(self, row):
+        self.added.append(row)
+
+    async def commit(self):
+        for number, row in enumerate(self.added, start=1):
+            row.id, row.created_at = number, datetime(2026, 1, 1)
+
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture
+def upload_folder(monkeypatch, tmp_path):
+    monkeypatch.setattr(resume_route.settings, "upload_folder", tmp_path)
+    monkeypatch.setattr(resume_route, "UPLOAD_CHUNK_SIZE", 64)
+    return tmp_path
+
+
+def upload(content: bytes, filename: str = "cv.pdf") -> UploadFile:
+    return UploadFile(file=BytesIO(content), filename=filename)
+
+
+def test_spool_upload_streams_to_the_hash_path(upload_folder):
+    content = bytes(range(256)) * 5
+
+    file_path, file_hash, file_size = asyncio.run(resume_route._spool_upload(upload(content), ".pdf"))
+
+    assert file_hash == hashlib.sha256(content).hexdigest()
+    assert file_size == len(content)
+    assert file_path == upload_folder / f"{file_hash}.pdf"
+    assert file_path.read_bytes() == content
+
+    # A re-upload reuses the stored copy and leaves no temp file behind
+    assert asyncio.run(resume_route._spool_upload(upload(content), ".pdf"))[0] == file_path
+    assert list(upload_folder.iterdir()) == [file_path]
+
+
+def test_spool_upload_rejects_oversized_files(upload_folder, monkeypatch):
+    monkeypatch.setattr(resume_route.settings, "max_upload_size_mb", 1)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(resume_route._spool_upload(upload(b"x" * (1024 * 1024 + 1)), ".pdf"))
+
+    assert error.value.status_code == 400
+    assert list(upload_folder.iterdir()) == []
+
+
+def test_stream_extracts_pages_from_the_stored_file(upload_folder, monkeypatch, make_pdf):
+    content = make_pdf([["Jane Doe", "EXPERIENCE"], ["- Built the billing pipeline in Python"]])
+    file_path, file_hash, file_size = asyncio.run(resume_route._spool_upload(upload(content), ".pdf"))
+
+    sources = []
+    iter_pages = PDFExtractor.iter_pages.__func__
+
+    async def recording(cls, source, pages_per_task=1):
+        sources.append(source)
+        async for page in iter_pages(cls, source, pages_per_task):
+            yield page
+
+    session = FakeSession()
+    monkeypatch.setattr(PDFExtractor, "iter_pages", classmethod(recording))
+    monkeypatch.setattr(resume_route, "extraction_cache", ExtractionCache(max_entries=4))
+    monkeypatch.setattr(resume_route, "async_session_factory", lambda: session)
+    monkeypatch.setattr(resume_route, "Resume", FakeResume)
+
+    async def collect() -> list[dict]:
+        return [
+            json.loads(line)
+            async for line in resume_route._stream_resume_events(
+                file_hash=file_hash,
+                file_path=file_path,
+                file_size=file_size,
+                file_name="cv.pdf",
+                mime_type="application/pdf",
+                user_id=7,
+                label=None,
+                set_active=False,
+            )
+        ]
+
+    events = asyncio.run(collect())
+
+    assert sources == [file_path]
+    assert [event["event"] for event in events] == ["started", "page", "page", "completed"]
+    assert events[0]["file_size_bytes"] == file_size
+    assert [event["page"] for event in events[1:3]] == [1, 2]
+    assert events[2]["bullet_points"][0]["text"] == "Built the billing pipeline in Python"
+    assert events[3]["id"] == 1 and events[3]["page_count"] == 2
+
+    [resume] = session.added
+    assert resume.file_path == str(file_path)
+    assert resume.file_size_bytes == file_size
+    assert "Jane Doe" in resume.raw_text
+
+
+def make_zip(members: dict[str, bytes]) -> bytes:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_zip_expansion_spools_only_pdf_members(upload_folder):
+    content = make_zip({
+        "cvs/alice.pdf": b"%PDF alice",
+        "cvs/notes.txt": b"skip",
+        "cvs/": b"",
+        "__MACOSX/cvs/._alice.pdf": b"skip",
+        "bob.PDF": b"%PDF bob",
+    })
+
+    members = resume_route._expand_zip_upload("cvs.zip", content, max_files=10)
+
+    assert [member.file_name for member in members] == ["alice.pdf", "bob.PDF"]
+    assert [member.path.read_bytes() for member in members] == [b"%PDF alice", b"%PDF bob"]
+    assert members[0].file_hash == hashlib.sha256(b"%PDF alice").hexdigest()
+    assert members[0].path == upload_folder / f"{members[0].file_hash}.pdf"
+    assert sorted(upload_folder.iterdir()) == sorted(member.path for member in members)
+
+
+def test_zip_expansion_checks_count_and_sizes_before_reading(upload_folder, monkeypatch):
+    content = make_zip({f"cv{n}.pdf": b"%PDF" for n in range(3)})
+
+    def no_reads(*args, **kwargs):
+        raise AssertionError("member read before the checks")
+
+    monkeypatch.setattr(zipfile.ZipFile, "read", no_reads)
+    monkeypatch.setattr(zipfile.ZipFile, "open", no_reads)
+    with pytest.raises(HTTPException) as error:
+        resume_route._expand_zip_upload("cvs.zip", content, max_files=2)
+    assert error.value.status_code == 400
+
+    # Oversized members are never inflated
+    monkeypatch.setattr(resume_route.settings, "max_upload_size_mb", 0)
+    members = resume_route._expand_zip_upload("cvs.zip", content, max_files=3)
+    assert [(member.file_name, member.path) for member in members] == [(f"cv{n}.pdf", None) for n in range(3)]
+    assert all(member.error == "File size exceeds the maximum limit of 0 MB." for member in members)
+
+
+def test_batch_reports_oversized_and_empty_files_per_file(upload_folder, monkeypatch):
+    monkeypatch.setattr(resume_route.settings, "max_upload_size_mb", 1)
+    big = b"x" * (1024 * 1024 + 1)
+    files = [
+        upload(big, "big.pdf"),
+        upload(make_zip({"inner.pdf": big, "empty.pdf": b""}), "more.zip"),
+    ]
+
+    response = asyncio.run(resume_route.upload_resume_batch(files=files, user_id=1, label=None, db=None))
+
+    assert response["total_files"] == 3 and response["failed"] == 3
+    errors = {result.file_name: result.error for result in response["results"]}
+    assert errors == {
+        "big.pdf": "File size exceeds the maximum limit of 1 MB.",
+        "inner.pdf": "File size exceeds the maximum limit of 1 MB.",
+        "empty.pdf": "File is empty.",
+    }
+    assert list(upload_folder.iterdir()) == []
+
+
+class FakeInsertResult:
+    def __init__(self, ids):
+        self.ids = ids
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.ids
+
+
+class InsertSession:
+    def __init__(self):
+        self.rows = []
+
+    async def execute(self, statement, rows):
+        self.rows.extend(rows)
+        return FakeInsertResult(list(range(1, len(rows) + 1)))
+
+
+def test_batch_extracts_from_spooled_files(upload_folder, monkeypatch, make_pdf):
+    alice = make_pdf([["Alice Doe", "- Shipped the search service"]])
+    bob = make_pdf([["Bob Roe", "- Ran the data platform"]])
+    files = [upload(alice, "alice.pdf"), upload(make_zip({"cvs/bob.pdf": bob}), "more.zip")]
+
+    sources = []
+    extract_from_file = PDFExtractor.extract_from_file.__func__
+
+    async def recording(cls, file_path, file_hash=None):
+        sources.append(file_path)
+        return await extract_from_file(cls, file_path, file_hash)
+
+    monkeypatch.setattr(PDFExtractor, "extract_from_file", classmethod(recording))
+    monkeypatch.setattr(resume_route, "extraction_cache", ExtractionCache(max_entries=4))
+    db = InsertSession()
+
+    response = asyncio.run(resume_route.upload_resume_batch(files=files, user_id=3, label=None, db=db))
+
+    assert response["successful"] == 2
+    assert [result.resume_id for result in response["results"]] == [1, 2]
+    paths = [upload_folder / f"{hashlib.sha256(content).hexdigest()}.pdf" for content in (alice, bob)]
+    assert sources == paths
+    assert [row["file_path"] for row in db.rows] == [str(path) for path in paths]
+    assert [row["file_size_bytes"] for row in db.rows] == [len(alice), len(bob)]
+    assert "Bob Roe" in db.rows[1]["raw_text"]
+
+
+def test_batch_counts_files_across_uploads(upload_folder, monkeypatch):
+    monkeypatch.setattr(resume_route.settings, "resume_batch_max_files", 2)
+    files = [upload(b"%PDF", "a.pdf"), upload(make_zip({"b.pdf": b"%PDF", "c.pdf": b"%PDF"}), "more.zip")]
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(resume_route.upload_resume_batch(files=files, user_id=1, label=None, db=None))
+
+    assert error.value.status_code == 400
+    assert "at most 2 PDFs" in error.value.detail
+    # The rejected batch does not keep the PDF it had already spooled
+    assert list(upload_folder.iterdir()) == []
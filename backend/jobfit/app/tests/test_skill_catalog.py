@@ -0,0 +1,91 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+from app.services.skill_catalog import CatalogSnapshot, SkillCatalog
+
+ROWS = [
+    {"id": 1, "canonical_name": "python", "display_name": "Python", "category": "language", "aliases": ["py", "python 3"]},
+    {"id": 2, "canonical_name": "kubernetes", "display_name": "Kubernetes", "category": "devops", "aliases": ["k8s"]},
+]
+
+
+class FakeCatalogSource:
+    """Skills table rows and version counter that tests can change."""
+
+    def __init__(self, version=1):
+        self.rows = list(ROWS)
+        self.version = version
+        self.loads = 0
+
+    async def load(self) -> list[dict]:
+        self.loads += 1
+        await asyncio.sleep(0.01)
+        return list(self.rows)
+
+    async def read_version(self):
+        return self.version
+
+
+def make_catalog(source: FakeCatalogSource, **kwargs) -> SkillCatalog:
+    return SkillCatalog(loader=source.load, version_reader=source.read_version, **kwargs)
+
+
+def test_snapshot_lookups_and_matcher():
+    snapshot = CatalogSnapshot.from_records(ROWS, version=4)
+
+    assert snapshot.version == 4 and len(snapshot) == 2
+    assert snapshot.get(2).aliases == ("k8s",)
+    assert snapshot.lookup(" Python 3 ").canonical_name == "python"
+    assert [hit.skill_id for hit in snapshot.matcher.find("Py on K8s")] == [1, 2]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.get(1).category = "other"
+
+
+def test_new_version_swaps_snapshot():
+    source = FakeCatalogSource()
+    catalog = make_catalog(source)
+
+    async def run():
+        assert await catalog.refresh()
+        held = catalog.snapshot
+        # Same version, nothing loaded
+        assert not await catalog.refresh()
+
+        source.rows.append({"id": 3, "canonical_name": "redis", "category": "database"})
+        source.version = 2
+        assert await catalog.refresh()
+        return held
+
+    held = asyncio.run(run())
+
+    assert source.loads == 2
+    assert catalog.snapshot.version == 2 and catalog.snapshot.lookup("redis").id == 3
+    # A request holding the old snapshot keeps a consistent catalog
+    assert held.version == 1 and held.lookup("redis") is None
+
+
+def test_concurrent_refreshes_load_once():
+    source = FakeCatalogSource()
+    catalog = make_catalog(source)
+
+    async def run():
+        return await asyncio.gather(*(catalog.refresh() for _ in range(5)))
+
+    assert sorted(asyncio.run(run())) == [False] * 4 + [True]
+    assert source.loads == 1
+
+
+def test_without_version_reloads_by_age():
+    source = FakeCatalogSource(version=None)
+    catalog = make_catalog(source, max_age_seconds=0.05)
+
+    async def run():
+        await catalog.refresh()
+        assert not await catalog.refresh()
+        await asyncio.sleep(0.06)
+        assert await catalog.refresh()
+
+    asyncio.run(run())
+    assert source.loads == 2 and catalog.snapshot.version == 0
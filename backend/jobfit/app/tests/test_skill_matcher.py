@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+from app.services.skill_matcher import SkillMatcher
+from app.services.text_cleaner import clean_and_parse_job
+
+CATALOG = SkillMatcher.from_seed_file()
+
+
+def mentions(text: str, matcher: SkillMatcher = CATALOG) -> list[tuple[str, str]]:
+    return [(hit.canonical_name, text[hit.start:hit.end]) for hit in matcher.find(text)]
+
+
+def test_terms_match_whole_words_only():
+    assert mentions("Google Gopher tooling, Javanese, reactive code") == []
+    assert mentions("We use Go and Java.") == [("go", "Go"), ("java", "Java")]
+
+
+def test_multi_word_aliases_ignore_case_and_spacing():
+    assert mentions("PYTHON  3 and java\nscript") == [("python", "PYTHON  3"), ("javascript", "java\nscript")]
+
+
+def test_longest_leftmost_term_wins():
+    assert mentions("Node.js on ASP.NET Core with C++17") == [
+        ("node.js", "Node.js"), ("asp.net", "ASP.NET Core"), ("c++", "C++17"),
+    ]
+
+
+def test_shared_alias_hits_every_skill():
+    assert sorted(name for name, _ in mentions("TF")) == ["tensorflow", "terraform"]
+
+
+def test_hits_carry_job_sections():
+    parsed = clean_and_parse_job(
+        "Backend Engineer\n\nRequirements\n- Python and PostgreSQL\n\nNice to have\n- Kubernetes (k8s)\n"
+    )
+    hits = CATALOG.find(parsed["cleaned_text"], spans=parsed["sections"]["spans"])
+
+    assert [(hit.canonical_name, hit.section) for hit in hits] == [
+        ("python", "requirements"), ("postgresql", "requirements"),
+        ("kubernetes", "nice_to_have"), ("kubernetes", "nice_to_have"),
+    ]
+
+
+def test_bullets_and_skill_rows():
+    skills = [
+        SimpleNamespace(id=7, canonical_name="fastapi", display_name="FastAPI", aliases=["fast api"]),
+        SimpleNamespace(id=9, canonical_name="redis", display_name=None, aliases=None),
+    ]
+    matcher = SkillMatcher.from_skills(skills)
+    bullets = [
+        {"text": "Built a Fast API service cached in Redis", "section": "experience"},
+        {"text": "Led a team of four", "section": "experience"},
+    ]
+
+    first, second = matcher.find_in_bullets(bullets)
+
+    assert [(hit.skill_id, hit.start, hit.end, hit.section) for hit in first] == [
+        (7, 8, 16, "experience"), (9, 35, 40, "experience"),
+    ]
+    assert second == []
@@ -0,0 +1,77 @@
+from pathlib import Path
+
+from app.services.structured_data import description_to_text, extract_job_posting
+from app.services.text_cleaner import JobMetadata, clean_and_parse_job
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_html"
+
+
+def ld_json_page(block: str) -> str:
+    return (
+        '<html><head><script type="application/ld+json">' + block + '</script></head>'
+        '<body><div id="content">DOM text</div></body></html>'
+    )
+
+
+def test_greenhouse_job_posting():
+    posting = extract_job_posting((FIXTURES / "greenhouse.html").read_text(encoding="utf-8"))
+
+    assert posting.metadata == JobMetadata(
+        title="Senior Backend Engineer",
+        company="Acme Payments",
+        location="Berlin, DE",
+        seniority="senior",
+        role_type="backend",
+        salary_min=85000,
+        salary_max=110000,
+        salary_currency="EUR",
+    )
+    assert posting.text.startswith("About Acme Payments\nAcme Payments moves €2B a year")
+    assert "• Design and build high-throughput APIs in Python and Go\n" in posting.text
+
+
+def test_job_posting_inside_list_after_other_types():
+    posting = extract_job_posting((FIXTURES / "lever.html").read_text(encoding="utf-8"))
+
+    assert posting.metadata.company == "Northwind Data"
+    assert posting.metadata.remote_type == "remote"
+    assert (posting.metadata.salary_min, posting.metadata.salary_max) == (185000, 225000)
+
+
+def test_graph_and_invalid_blocks():
+    html = ld_json_page('{"@type": "JobPosting", broken') + ld_json_page(
+        '{"@context": "https://schema.org", "@graph": [{"@type": "Organization", "name": "Globex"},'
+        ' {"@type": ["JobPosting"], "title": "Platform Engineer", "description": "Run\n our <b>platform</b>",'
+        ' "jobLocation": [{"address": {"addressLocality": "Toronto", "addressRegion": "ON"}},'
+        ' {"address": "Remote, Canada"}],'
+        ' "baseSalary": {"currency": "CAD", "value": {"value": 60, "unitText": "HOUR"}}}]}'
+    )
+
+    posting = extract_job_posting(html)
+
+    assert posting.text == "Run our platform"
+    assert posting.metadata.location == "Toronto, ON; Remote, Canada"
+    # Hourly rates are not stored as annual salaries
+    assert posting.metadata.salary_min is None and posting.metadata.salary_currency is None
+
+
+def test_pages_without_job_posting():
+    assert extract_job_posting((FIXTURES / "generic.html").read_text(encoding="utf-8")) is None
+    assert extract_job_posting(ld_json_page('{"@type": "Organization", "name": "Globex"}')) is None
+    assert extract_job_posting(ld_json_page('{"@type": "JobPosting", "title": "No description"}')) is None
+
+
+def test_description_to_text():
+    assert description_to_text("&lt;p&gt;Build&amp;nbsp;APIs&lt;/p&gt;&lt;ul&gt;&lt;li&gt;Go&lt;/li&gt;&lt;/ul&gt;") == \
+        "Build APIs\n• Go"
+    assert description_to_text("Plain text, no tags") == "Plain text, no tags"
+
+
+def test_clean_and_parse_job_uses_given_metadata():
+    metadata = JobMetadata(title="Staff Data Engineer", company="Northwind Data", salary_min=185000)
+
+    parsed = clean_and_parse_job("Senior backend role paying $90,000 - $100,000 " * 5, metadata=metadata)
+
+    assert parsed["metadata"]["company"] == "Northwind Data"
+    assert parsed["metadata"]["salary_min"] == 185000
+    assert parsed["metadata"]["seniority"] is None
@@ -0,0 +1,96 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services.text_cleaner import JobMetadataExtractor, JobSectionExtractor, TextCleaner
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_pages"
+CORPUS = sorted(FIXTURES.glob("*.html"))
+
+
+def load_case(path: Path) -> tuple[str, str]:
+    raw = path.read_text(encoding="utf-8")
+    golden = path.with_name(f"{path.stem}.golden.txt").read_text(encoding="utf-8")
+    return raw, golden
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=[p.stem for p in CORPUS])
+def test_clean_job_text_matches_golden_output(path):
+    raw, golden = load_case(path)
+
+    assert TextCleaner.clean_job_text(raw) == golden
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=[p.stem for p in CORPUS])
+def test_boilerplate_scrub_matches_pattern_by_pattern_scrub(path):
+    text, _ = load_case(path)
+
+    expected = text
+    for pattern in TextCleaner.BOILERPLATE_PATTERNS:
+        expected = pattern.sub('', expected)
+
+    assert TextCleaner._remove_boilerplate(text) == expected
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=[p.stem for p in CORPUS])
+def test_extract_metadata_matches_golden_output(path):
+    _, cleaned = load_case(path)
+    golden = json.loads(path.with_name(f"{path.stem}.metadata.json").read_text(encoding="utf-8"))
+
+    metadata = JobMetadataExtractor.extract_metadata(cleaned)
+
+    assert {key: getattr(metadata, key) for key in golden} == golden
+
+
+@pytest.mark.parametrize("text", [
+    "Senior Backend Engineer (Tech Lead), fully remote, $120k - $150k",
+    "On-site reliability: SRE / Dev-Ops, in-office or hybrid",
+    "ML engineer or mlengineer, QA/test, 100% remote only",
+    "İntern ſenior internship",
+])
+def test_scan_reports_every_match(text):
+    expected = [
+        (dimension, label, position, pattern.match(text, position).end())
+        for position in range(len(text) + 1)
+        for dimension, label, pattern in JobMetadataExtractor.METADATA_PATTERNS
+        if pattern.match(text, position)
+    ]
+
+    hits = JobMetadataExtractor.scan(text)
+
+    assert [(hit.dimension, hit.label, hit.start, hit.end) for hit in hits] == expected
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=[p.stem for p in CORPUS])
+def test_extract_sections_matches_golden_output(path):
+    _, cleaned = load_case(path)
+    golden = json.loads(path.with_name(f"{path.stem}.sections.json").read_text(encoding="utf-8"))
+
+    sections = JobSectionExtractor.extract_sections(cleaned)
+
+    assert {name: getattr(sections, name) for name in golden} == golden
+
+
+def test_section_spans_cover_every_header_in_order():
+    text = (
+        "Senior Engineer\n\nAbout\nWe build payment rails.\n\nResponsibilities:\n• Build APIs\n\n"
+        "Requirements\n• Python\n---\nNice to have\n• Go\n\nHow to apply\nEmail us"
+    )
+
+    spans = JobSectionExtractor.extract_sections(text).spans
+
+    assert [(span.name, span.header) for span in spans] == [
+        ("other", "About"),
+        ("responsibilities", "Responsibilities:"),
+        ("requirements", "Requirements"),
+        ("nice_to_have", "Nice to have"),
+        ("other", "How to apply"),
+    ]
+    assert [text[span.start:span.end].strip() for span in spans] == [
+        "We build payment rails.",
+        "• Build APIs",
+        "• Python\n---",
+        "• Go",
+        "Email us",
+    ]
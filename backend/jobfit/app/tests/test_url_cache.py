@@ -0,0 +1,90 @@
+import asyncio
+import os
+import time
+
+from app.services.url_cache import CachedPage, URLResponseCache, normalize_url
+
+
+def make_page(url: str, etag: str = '"v1"', age_seconds: float = 0) -> CachedPage:
+    return CachedPage(
+        url=url,
+        raw_text="Senior Backend Engineer",
+        etag=etag,
+        last_modified=None,
+        detected_platform="greenhouse",
+        content_length=40_000,
+        stored_at=time.time() - age_seconds,
+    )
+
+
+def test_normalize_url_drops_tracking_and_fragment():
+    assert normalize_url("HTTPS://Boards.Greenhouse.io:443/acme/jobs/1?utm_source=x&gh_src=abc&b=2&a=1#apply") == \
+        "https://boards.greenhouse.io/acme/jobs/1?a=1&b=2"
+    assert normalize_url("https://boards.greenhouse.io/acme?gh_jid=42") == \
+        "https://boards.greenhouse.io/acme?gh_jid=42"
+
+
+def test_disk_cache_round_trip_and_ttl(tmp_path):
+    cache = URLResponseCache(backend="disk", directory=tmp_path, ttl_seconds=60)
+    url = "https://jobs.lever.co/acme/1"
+
+    async def run():
+        await cache.set(make_page(url))
+        hit = await cache.get(url + "?utm_campaign=feed")
+        await cache.set(make_page(url + "/stale", age_seconds=120))
+        stale = await cache.get(url + "/stale")
+        return hit, stale
+
+    hit, stale = asyncio.run(run())
+
+    assert hit.raw_text == "Senior Backend Engineer"
+    assert hit.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert stale is None
+
+
+def test_pages_without_validators_are_not_stored(tmp_path):
+    cache = URLResponseCache(backend="disk", directory=tmp_path)
+    url = "https://jobs.lever.co/acme/1"
+
+    asyncio.run(cache.set(make_page(url, etag=None)))
+
+    assert asyncio.run(cache.get(url)) is None
+    assert cache.stats.stores == 0
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    urls = [f"https://careers.example.com/jobs/{i}" for i in range(8)]
+    cache = URLResponseCache(backend="disk", directory=tmp_path)
+
+    async def run():
+        now = time.time()
+        await cache.set(make_page(urls[0]))
+        cache.max_bytes = cache._path(cache.key(urls[0])).stat().st_size * 5
+        for i, url in enumerate(urls):
+            await cache.set(make_page(url))
+            # Distinct, increasing mtimes regardless of filesystem resolution
+            path = cache._path(cache.key(url))
+            os.utime(path, (now - 100 + i, now - 100 + i))
+        return [await cache.get(url) is not None for url in urls]
+
+    present = asyncio.run(run())
+
+    assert cache.stats.evictions > 0
+    assert present[-1]
+    assert not present[0]
+    assert sum(present) >= 4
+    assert sum(f.stat().st_size for f in tmp_path.glob("*/*.json")) <= cache.max_bytes
+
+
+def test_concurrent_writes_of_one_key_do_not_collide(tmp_path):
+    cache = URLResponseCache(backend="disk", directory=tmp_path, ttl_seconds=60)
+    url = "https://jobs.lever.co/acme/1"
+
+    async def scenario():
+        await asyncio.gather(*(cache.set(make_page(url, etag=f'"v{n}"')) for n in range(20)))
+        return await cache.get(url)
+
+    page = asyncio.run(scenario())
+
+    assert page is not None and page.etag.startswith('"v')
+    assert [path.suffix for path in tmp_path.glob("*/*")] == [".json"]
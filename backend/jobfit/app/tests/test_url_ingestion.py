@@ -0,0 +1,58 @@
+import asyncio
+
+import httpx
+
+from app.services.url_ingestion import URLIngestService
+
+
+class CountingStream(httpx.AsyncByteStream):
+    """A body sent in fixed chunks, recording how many were pulled."""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+def read_capped(transport: httpx.MockTransport, max_length: int):
+    service = URLIngestService(max_content_length=max_length, cache=None)
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with client.stream("GET", "https://jobs.example.com/1") as response:
+                return await service._read_capped(response)
+
+    return asyncio.run(scenario())
+
+
+def test_read_capped_rejects_declared_length_without_reading():
+    stream = CountingStream([b"x" * 100] * 5)
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, headers={"content-length": "500"}, stream=stream)
+    )
+
+    assert read_capped(transport, max_length=200) == (None, 500)
+    assert stream.sent == 0
+
+
+def test_read_capped_stops_once_streamed_bytes_cross_the_cap():
+    stream = CountingStream([b"x" * 100] * 5)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=stream))
+
+    assert read_capped(transport, max_length=250) == (None, 300)
+    assert stream.sent == 3
+
+
+def test_read_capped_decodes_chunks_split_inside_a_character():
+    body = "Café résumé".encode("utf-8")
+    transport = httpx.MockTransport(lambda request: httpx.Response(
+        200,
+        headers={"content-type": "text/html; charset=utf-8"},
+        stream=CountingStream([body[:4], body[4:]]),
+    ))
+
+    assert read_capped(transport, max_length=1000) == ("Café résumé", len(body))